@@ -0,0 +1,52 @@
+"""add trigram indexes on restaurants and products names
+
+Revision ID: 136035382478
+Revises: 3287ed89e951
+Create Date: 2026-10-18 10:03:27.218840
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '136035382478'
+down_revision: str | None = '3287ed89e951'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+TRIGRAM_INDEXES = [
+	('ix_restaurants_name_trgm', 'restaurants'),
+	('ix_products_name_trgm', 'products'),
+]
+
+
+def upgrade() -> None:
+	# pg_trgm is a trusted extension since Postgres 13, so the database owner can create it
+	op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+
+	# CONCURRENTLY can't run inside a transaction block
+	with op.get_context().autocommit_block():
+		for index_name, table_name in TRIGRAM_INDEXES:
+			op.create_index(
+				index_name,
+				table_name,
+				['name'],
+				postgresql_using='gin',
+				postgresql_ops={'name': 'gin_trgm_ops'},
+				postgresql_concurrently=True,
+				if_not_exists=True,
+			)
+
+
+def downgrade() -> None:
+	# The pg_trgm extension is kept since other objects may depend on it
+	with op.get_context().autocommit_block():
+		for index_name, table_name in TRIGRAM_INDEXES:
+			op.drop_index(
+				index_name,
+				table_name=table_name,
+				postgresql_concurrently=True,
+				if_exists=True,
+			)
@@ -0,0 +1,98 @@
+"""add restaurant open intervals table
+
+Revision ID: 2fb8802d5841
+Revises: 5ec8f6511b19
+Create Date: 2026-10-18 15:33:02.417215
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '2fb8802d5841'
+down_revision: str | None = '5ec8f6511b19'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Same normalization as `src.core.weekly_intervals.weekly_intervals`: one [start, end) range of
+# minutes since Monday 00:00 for each day of a schedule, overnight spans running into the next
+# day and ranges crossing Sunday midnight split in two. Holiday schedules are left out.
+BACKFILL_OPEN_INTERVALS = """
+WITH days AS (
+	SELECT ARRAY['monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday']
+		AS names
+),
+schedules AS (
+	SELECT
+		s.id,
+		s.restaurant_id,
+		array_position(days.names, s.start_day::text) - 1 AS first_day,
+		(array_position(days.names, s.end_day::text) - array_position(days.names, s.start_day::text)
+			+ 7) % 7 + 1 AS days_count,
+		floor(extract(epoch FROM s.start_time) / 60)::int AS start_minute,
+		ceil(extract(epoch FROM s.end_time) / 60)::int AS end_minute
+	FROM restaurant_schedules s, days
+	WHERE s.day_type <> 'holiday'
+),
+spans AS (
+	SELECT
+		s.id AS schedule_id,
+		s.restaurant_id,
+		((s.first_day + d) % 7) * 1440 + s.start_minute AS span_start,
+		((s.first_day + d) % 7) * 1440 + s.start_minute + CASE
+			WHEN s.end_minute > s.start_minute THEN s.end_minute - s.start_minute
+			ELSE s.end_minute - s.start_minute + 1440
+		END AS span_end
+	FROM schedules s, generate_series(0, s.days_count - 1) AS d
+)
+INSERT INTO restaurant_open_intervals (id, restaurant_id, schedule_id, start_minute, end_minute)
+SELECT gen_random_uuid(), restaurant_id, schedule_id, span_start, least(span_end, 10080)
+FROM spans
+UNION ALL
+SELECT gen_random_uuid(), restaurant_id, schedule_id, 0, span_end - 10080
+FROM spans
+WHERE span_end > 10080
+"""
+
+
+def upgrade() -> None:
+	op.create_table(
+		'restaurant_open_intervals',
+		sa.Column('id', sa.Uuid(), nullable=False),
+		sa.Column('restaurant_id', sa.Uuid(), nullable=False),
+		sa.Column('schedule_id', sa.Uuid(), nullable=False),
+		sa.Column('start_minute', sa.Integer(), nullable=False),
+		sa.Column('end_minute', sa.Integer(), nullable=False),
+		sa.ForeignKeyConstraint(['restaurant_id'], ['restaurants.id']),
+		sa.ForeignKeyConstraint(['schedule_id'], ['restaurant_schedules.id'], ondelete='CASCADE'),
+		sa.PrimaryKeyConstraint('id'),
+	)
+	op.create_index(
+		'ix_restaurant_open_intervals_restaurant_id', 'restaurant_open_intervals', ['restaurant_id']
+	)
+	op.create_index(
+		'ix_restaurant_open_intervals_schedule_id', 'restaurant_open_intervals', ['schedule_id']
+	)
+	op.create_index(
+		'ix_restaurant_open_intervals_minutes',
+		'restaurant_open_intervals',
+		[sa.text('int4range(start_minute, end_minute)')],
+		postgresql_using='gist',
+	)
+
+	op.execute(BACKFILL_OPEN_INTERVALS)
+
+
+def downgrade() -> None:
+	op.drop_index('ix_restaurant_open_intervals_minutes', table_name='restaurant_open_intervals')
+	op.drop_index(
+		'ix_restaurant_open_intervals_schedule_id', table_name='restaurant_open_intervals'
+	)
+	op.drop_index(
+		'ix_restaurant_open_intervals_restaurant_id', table_name='restaurant_open_intervals'
+	)
+	op.drop_table('restaurant_open_intervals')
@@ -0,0 +1,39 @@
+"""add restaurants keyset pagination index
+
+Revision ID: 3287ed89e951
+Revises: 860af792347f
+Create Date: 2026-10-18 09:12:41.503118
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '3287ed89e951'
+down_revision: str | None = '860af792347f'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+	# CONCURRENTLY can't run inside a transaction block
+	with op.get_context().autocommit_block():
+		op.create_index(
+			'ix_restaurants_created_at_id',
+			'restaurants',
+			['created_at', 'id'],
+			postgresql_concurrently=True,
+			if_not_exists=True,
+		)
+
+
+def downgrade() -> None:
+	with op.get_context().autocommit_block():
+		op.drop_index(
+			'ix_restaurants_created_at_id',
+			table_name='restaurants',
+			postgresql_concurrently=True,
+			if_exists=True,
+		)
@@ -0,0 +1,52 @@
+"""add foreign keys indexes
+
+Revision ID: 5ec8f6511b19
+Revises: 136035382478
+Create Date: 2026-10-18 15:11:28.928063
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '5ec8f6511b19'
+down_revision: str | None = '136035382478'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Postgres doesn't index foreign key columns automatically, but relationship loads and
+# owner/category filters all look rows up by them
+FOREIGN_KEY_INDEXES = [
+	('ix_products_restaurant_id', 'products', 'restaurant_id'),
+	('ix_products_category_id', 'products', 'category_id'),
+	('ix_offers_product_id', 'offers', 'product_id'),
+	('ix_offer_schedules_offer_id', 'offer_schedules', 'offer_id'),
+	('ix_restaurant_schedules_restaurant_id', 'restaurant_schedules', 'restaurant_id'),
+	('ix_restaurants_owner_id', 'restaurants', 'owner_id'),
+]
+
+
+def upgrade() -> None:
+	# CONCURRENTLY can't run inside a transaction block
+	with op.get_context().autocommit_block():
+		for index_name, table_name, column_name in FOREIGN_KEY_INDEXES:
+			op.create_index(
+				index_name,
+				table_name,
+				[column_name],
+				postgresql_concurrently=True,
+				if_not_exists=True,
+			)
+
+
+def downgrade() -> None:
+	with op.get_context().autocommit_block():
+		for index_name, table_name, _ in FOREIGN_KEY_INDEXES:
+			op.drop_index(
+				index_name,
+				table_name=table_name,
+				postgresql_concurrently=True,
+				if_exists=True,
+			)
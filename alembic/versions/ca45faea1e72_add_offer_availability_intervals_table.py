@@ -0,0 +1,120 @@
+"""add offer availability intervals table
+
+Revision ID: ca45faea1e72
+Revises: 2fb8802d5841
+Create Date: 2026-10-18 15:58:41.230114
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'ca45faea1e72'
+down_revision: str | None = '2fb8802d5841'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Same normalization as `src.core.weekly_intervals`: one [start, end) range of minutes since
+# Monday 00:00 for each schedule, overnight spans running into the next day and ranges crossing
+# Sunday midnight split in two. Schedules that don't repeat (`repeats` is nullable, NULL is
+# treated as false like the app does) expire at the end of their first occurrence after they
+# were last updated.
+BACKFILL_AVAILABILITY_INTERVALS = """
+WITH schedules AS (
+	SELECT
+		s.id,
+		s.offer_id,
+		s.repeats,
+		s.updated_at,
+		(array_position(
+			ARRAY['monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday'],
+			s.day::text
+		) - 1) * 1440 AS day_start,
+		floor(extract(epoch FROM s.start_time) / 60)::int AS start_minute,
+		ceil(extract(epoch FROM s.end_time) / 60)::int AS end_minute
+	FROM offer_schedules s
+),
+spans AS (
+	SELECT
+		s.id AS schedule_id,
+		s.offer_id,
+		s.day_start + s.start_minute AS span_start,
+		s.day_start + s.start_minute + CASE
+			WHEN s.end_minute > s.start_minute THEN s.end_minute - s.start_minute
+			ELSE s.end_minute - s.start_minute + 1440
+		END AS span_end,
+		s.repeats,
+		s.updated_at
+	FROM schedules s
+),
+expiring_spans AS (
+	SELECT
+		s.*,
+		CASE WHEN NOT coalesce(s.repeats, false) THEN (
+			SELECT min(ends.end_at)
+			FROM (
+				SELECT date_trunc('week', s.updated_at) + make_interval(mins => s.span_end + k * 10080)
+					AS end_at
+				FROM generate_series(-1, 1) AS k
+			) AS ends
+			WHERE ends.end_at > s.updated_at
+		) END AS expires_at
+	FROM spans s
+)
+INSERT INTO offer_availability_intervals
+	(id, offer_id, schedule_id, start_minute, end_minute, expires_at)
+SELECT gen_random_uuid(), offer_id, schedule_id, span_start, least(span_end, 10080), expires_at
+FROM expiring_spans
+UNION ALL
+SELECT gen_random_uuid(), offer_id, schedule_id, 0, span_end - 10080, expires_at
+FROM expiring_spans
+WHERE span_end > 10080
+"""
+
+
+def upgrade() -> None:
+	op.create_table(
+		'offer_availability_intervals',
+		sa.Column('id', sa.Uuid(), nullable=False),
+		sa.Column('offer_id', sa.Uuid(), nullable=False),
+		sa.Column('schedule_id', sa.Uuid(), nullable=False),
+		sa.Column('start_minute', sa.Integer(), nullable=False),
+		sa.Column('end_minute', sa.Integer(), nullable=False),
+		sa.Column('expires_at', sa.DateTime(), nullable=True),
+		sa.ForeignKeyConstraint(['offer_id'], ['offers.id']),
+		sa.ForeignKeyConstraint(['schedule_id'], ['offer_schedules.id'], ondelete='CASCADE'),
+		sa.PrimaryKeyConstraint('id'),
+	)
+	op.create_index(
+		'ix_offer_availability_intervals_offer_id', 'offer_availability_intervals', ['offer_id']
+	)
+	op.create_index(
+		'ix_offer_availability_intervals_schedule_id',
+		'offer_availability_intervals',
+		['schedule_id'],
+	)
+	op.create_index(
+		'ix_offer_availability_intervals_minutes',
+		'offer_availability_intervals',
+		[sa.text('int4range(start_minute, end_minute)')],
+		postgresql_using='gist',
+	)
+
+	op.execute(BACKFILL_AVAILABILITY_INTERVALS)
+
+
+def downgrade() -> None:
+	op.drop_index(
+		'ix_offer_availability_intervals_minutes', table_name='offer_availability_intervals'
+	)
+	op.drop_index(
+		'ix_offer_availability_intervals_schedule_id', table_name='offer_availability_intervals'
+	)
+	op.drop_index(
+		'ix_offer_availability_intervals_offer_id', table_name='offer_availability_intervals'
+	)
+	op.drop_table('offer_availability_intervals')
@@ -0,0 +1,140 @@
+"""
+Benchmark the per request overhead of `StructLogMiddleware`.
+
+Sends `--requests` fake requests (1,000 by default) with the headers of a typical browser
+through an ASGI app answering right away, measuring the time per request:
+
+- no middleware: the bare app, as a baseline
+- access log enabled: the middleware emitting a JSON access log for every request
+- access log disabled: the middleware with the access logger above INFO level
+
+Logs are rendered as in production (JSON) and written to /dev/null.
+
+It doesn't need a database, since only the middleware is measured.
+
+Usage: poetry run python -m benchmarks.logging_middleware [--requests 1000] [--runs 20]
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+from functools import partial
+from unittest.mock import Mock
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from benchmarks.utils import measure, print_table
+from src.core.logging.logger import setup_logging
+from src.core.logging.middleware import StructLogMiddleware, access_stdlib_logger
+
+HEADERS = [
+	(b'host', b'api.rafood.com'),
+	(
+		b'user-agent',
+		b'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 Chrome/126.0 Safari/537.36',
+	),
+	(b'accept', b'application/json, text/plain, */*'),
+	(b'accept-encoding', b'gzip, deflate, br'),
+	(b'accept-language', b'pt-BR,pt;q=0.9,en-US;q=0.8,en;q=0.7'),
+	(b'connection', b'keep-alive'),
+	(b'cookie', b'read_primary=1; session=9f1c0a7e2b6d4c3e8a5f'),
+	(b'origin', b'https://rafood.com'),
+	(b'referer', b'https://rafood.com/restaurants'),
+	(b'sec-fetch-dest', b'empty'),
+	(b'sec-fetch-mode', b'cors'),
+	(b'x-request-id', b'5b0f7c6e-8f3a-4d6b-9b1e-2c7d8a9f0e1b'),
+]
+
+
+def build_scope() -> Scope:
+	endpoint = Mock(__name__='list_restaurants')
+	route = Mock(spec=['name'])
+	route.name = 'List restaurants'
+
+	return {
+		'type': 'http',
+		'client': ('10.0.0.1', 52731),
+		'method': 'GET',
+		'http_version': '1.1',
+		'path': '/api/v1/restaurants',
+		'query_string': b'limit=50',
+		'headers': HEADERS,
+		'endpoint': endpoint,
+		'route': route,
+		'path_params': {},
+	}
+
+
+async def app(scope: Scope, receive: Receive, send: Send) -> None:
+	await send({'type': 'http.response.start', 'status': 200, 'headers': []})
+	await send({'type': 'http.response.body', 'body': b'{}'})
+
+
+async def receive() -> Message:
+	return {'type': 'http.request', 'body': b''}
+
+
+async def send(message: Message) -> None:
+	pass
+
+
+def serve(loop: asyncio.AbstractEventLoop, asgi_app: ASGIApp, requests: int) -> None:
+	scope = build_scope()
+
+	async def serve_all() -> None:
+		for _ in range(requests):
+			await asgi_app(dict(scope), receive, send)
+
+	loop.run_until_complete(serve_all())
+
+
+def measure_scenarios(requests: int, runs: int) -> list[list[object]]:
+	loop = asyncio.new_event_loop()
+	middleware = StructLogMiddleware(app)
+
+	scenarios: list[tuple[str, ASGIApp, int]] = [
+		('no middleware', app, logging.INFO),
+		('access log enabled', middleware, logging.INFO),
+		('access log disabled', middleware, logging.WARNING),
+	]
+
+	results: list[list[object]] = []
+	for label, asgi_app, level in scenarios:
+		access_stdlib_logger.setLevel(level)
+		latency = measure(partial(serve, loop, asgi_app, requests), runs=runs)
+		# Milliseconds for all requests, so per request microseconds are x1000 / requests
+		results.append(
+			[
+				label,
+				f'{latency["p50"] * 1000 / requests:.1f}',
+				f'{latency["p95"] * 1000 / requests:.1f}',
+			]
+		)
+
+	loop.close()
+
+	return results
+
+
+def run(requests: int, runs: int) -> None:
+	setup_logging(json_logs=True, log_level='INFO')
+
+	with open(os.devnull, 'w') as devnull:
+		for handler in logging.getLogger().handlers:
+			if isinstance(handler, logging.StreamHandler):
+				handler.setStream(devnull)
+
+		results = measure_scenarios(requests, runs)
+
+	print(f'\nStructLogMiddleware overhead over {requests} requests ({runs} runs)\n')
+	print_table(['', 'p50 µs/request', 'p95 µs/request'], results)
+
+
+if __name__ == '__main__':
+	parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+	parser.add_argument('--requests', type=int, default=1_000, help='Requests per run')
+	parser.add_argument('--runs', type=int, default=20, help='Measured runs per scenario')
+	args = parser.parse_args()
+
+	run(requests=args.requests, runs=args.runs)
@@ -0,0 +1,152 @@
+"""
+Benchmark products search by name before and after the pg_trgm GIN index.
+
+Seeds a dedicated benchmark database with `--rows` products (1M by default) and measures
+the latency of the name filter used by `ProductRepository.list`:
+
+- before: `name LIKE '%term%'` (the old `contains` filter) with no trigram index
+- before: `name ILIKE '%term%'` (current filter) with no trigram index
+- after: `name ILIKE '%term%'` served by `ix_products_name_trgm`
+
+Usage: poetry run python -m benchmarks.products_search [--rows 1000000] [--runs 20]
+"""
+
+import argparse
+import hashlib
+from functools import partial
+from typing import TYPE_CHECKING
+
+from sqlalchemy import ColumnElement, Connection, Engine, select, text
+from sqlmodel import SQLModel
+
+from benchmarks.utils import create_benchmark_engine, fetch_all, measure, plan_nodes, print_table
+
+# Every model must be imported so SQLModel.metadata knows all tables and relationships
+from src.categories.models import Category  # noqa: F401
+from src.core.search import icontains
+from src.offers.models import Offer  # noqa: F401
+from src.products.models import Product
+from src.restaurants.models import Restaurant  # noqa: F401
+from src.users.models import User  # noqa: F401
+
+if TYPE_CHECKING:
+	from collections.abc import Callable
+
+SEED_BATCH_SIZE = 100_000
+RESTAURANTS_COUNT = 1_000
+CATEGORIES_COUNT = 20
+TRIGRAM_INDEX_NAME = 'ix_products_name_trgm'
+
+
+def seed(conn: Connection, rows: int) -> None:
+	existing = conn.execute(text('SELECT count(*) FROM products')).scalar_one()
+	if existing >= rows:
+		print(f'Found {existing} products, skipping seed')
+		return
+
+	print(f'Seeding {rows - existing} products...')
+	conn.execute(
+		text(
+			'INSERT INTO users (id, first_name, last_name, email, password, created_at, updated_at) '
+			"SELECT gen_random_uuid(), 'Bench', 'Owner', 'bench@rafood.com', 'bench', now(), now() "
+			'WHERE NOT EXISTS (SELECT 1 FROM users)'
+		)
+	)
+	conn.execute(
+		text(
+			'INSERT INTO restaurants (id, name, owner_id, street, number, neighborhood, city, '
+			'state_abbr, created_at, updated_at) '
+			"SELECT gen_random_uuid(), 'Restaurant ' || i, u.id, 'Street', i, 'Centro', "
+			"'Rio de Janeiro', 'RJ', now(), now() "
+			'FROM generate_series(1, :count) AS i, (SELECT id FROM users LIMIT 1) AS u '
+			'WHERE NOT EXISTS (SELECT 1 FROM restaurants)'
+		),
+		{'count': RESTAURANTS_COUNT},
+	)
+	conn.execute(
+		text(
+			'INSERT INTO categories (id, name, created_at, updated_at) '
+			"SELECT gen_random_uuid(), 'Category ' || i, now(), now() "
+			'FROM generate_series(1, :count) AS i '
+			'WHERE NOT EXISTS (SELECT 1 FROM categories)'
+		),
+		{'count': CATEGORIES_COUNT},
+	)
+
+	for start in range(existing + 1, rows + 1, SEED_BATCH_SIZE):
+		end = min(start + SEED_BATCH_SIZE - 1, rows)
+		# md5 names keep substring searches selective, like searching a real catalog
+		conn.execute(
+			text(
+				'INSERT INTO products (id, restaurant_id, name, price, category_id, created_at, '
+				'updated_at) '
+				"SELECT gen_random_uuid(), r.ids[1 + i % array_length(r.ids, 1)], 'Product ' || "
+				'md5(i::text), 9.99 + i % 100, c.ids[1 + i % array_length(c.ids, 1)], now(), now() '
+				'FROM generate_series(:start, :end) AS i, '
+				'(SELECT array_agg(id) AS ids FROM restaurants) AS r, '
+				'(SELECT array_agg(id) AS ids FROM categories) AS c'
+			),
+			{'start': start, 'end': end},
+		)
+		conn.commit()
+		print(f'  {end}/{rows}')
+
+	conn.execute(text('ANALYZE products'))
+	conn.commit()
+
+
+def run(engine: Engine, rows: int, runs: int) -> None:
+	SQLModel.metadata.create_all(engine)
+
+	with engine.connect() as conn:
+		seed(conn, rows)
+
+		# Terms are substrings of seeded names, so every search has matches
+		terms = [hashlib.md5(str(n).encode()).hexdigest()[4:10] for n in (7, 4242, 90210)]  # noqa: S324
+		scenarios: list[tuple[str, str, bool, Callable[[str], ColumnElement[bool]]]] = [
+			('before', 'LIKE (contains)', False, lambda term: Product.name.contains(term)),  # type: ignore[attr-defined]
+			('before', 'ILIKE', False, lambda term: icontains(Product.name, term)),
+			('after', 'ILIKE', True, lambda term: icontains(Product.name, term)),
+		]
+
+		results = []
+		for label, operator, with_index, build_filter in scenarios:
+			conn.execute(text(f'DROP INDEX IF EXISTS {TRIGRAM_INDEX_NAME}'))
+			if with_index:
+				conn.execute(text('CREATE EXTENSION IF NOT EXISTS pg_trgm'))
+				conn.execute(
+					text(
+						f'CREATE INDEX {TRIGRAM_INDEX_NAME} ON products USING gin (name gin_trgm_ops)'
+					)
+				)
+				conn.execute(text('ANALYZE products'))
+			conn.commit()
+
+			for term in terms:
+				query = select(Product.id).where(build_filter(term))  # type: ignore[call-overload]
+				matches = len(conn.execute(query).all())
+				latency = measure(partial(fetch_all, conn, query), runs=runs)
+
+				results.append(
+					[
+						label,
+						operator,
+						term,
+						matches,
+						f'{latency["p50"]:.2f}',
+						f'{latency["p95"]:.2f}',
+						plan_nodes(conn, query),
+					]
+				)
+
+	print(f'\nProducts search latency over {rows} products ({runs} runs per term)\n')
+	print_table(['', 'operator', 'term', 'matches', 'p50 ms', 'p95 ms', 'plan'], results)
+
+
+if __name__ == '__main__':
+	parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+	parser.add_argument('--rows', type=int, default=1_000_000, help='Products to seed')
+	parser.add_argument('--runs', type=int, default=20, help='Measured runs per search term')
+	args = parser.parse_args()
+
+	run(create_benchmark_engine(), rows=args.rows, runs=args.runs)
@@ -0,0 +1,90 @@
+"""
+Benchmark compressing a restaurants list response at different encodings and levels.
+
+Renders a `RestaurantPageSchema` with `--items` restaurants (100 by default, the largest page
+of `GET /restaurants`), each with two schedules, and compresses its body with
+`CompressionMiddleware` for each encoding and level, measuring:
+
+- bytes on the wire and compression ratio
+- p50/p95 latency and CPU time per response
+
+It doesn't need a database, since only the compression is measured.
+
+Usage: poetry run python -m benchmarks.responses_compression [--items 100] [--runs 50]
+"""
+
+import argparse
+import time
+from functools import partial
+
+from benchmarks.restaurants_response import build_page
+from benchmarks.utils import measure, print_table
+from src.core.compression import CompressionMiddleware
+from src.core.responses import ModelResponse
+
+# (encoding, levels), gzip levels go from 1 to 9 and brotli qualities from 0 to 11
+LEVELS = [
+	('identity', [0]),
+	('gzip', [1, 6, 9]),
+	('br', [1, 4, 6, 11]),
+]
+
+
+def build_middleware(encoding: str, level: int) -> CompressionMiddleware:
+	# The cache is disabled, so every run compresses the body again
+	return CompressionMiddleware(
+		app=None,  # type: ignore[arg-type]
+		minimum_size=0,
+		gzip_level=level if encoding == 'gzip' else 6,
+		brotli_quality=level if encoding == 'br' else 4,
+		thread_minimum_size=0,
+		cache_ttl_seconds=0,
+		cache_max_size=0,
+	)
+
+
+def cpu_ms(fn: partial[bytes], runs: int) -> float:
+	"""CPU time of the process per call, in milliseconds."""
+	start = time.process_time()
+	for _ in range(runs):
+		fn()
+
+	return (time.process_time() - start) * 1000 / runs
+
+
+def run(items: int, runs: int) -> None:
+	body = bytes(ModelResponse(build_page(items)).body)
+
+	results: list[list[object]] = []
+	for encoding, levels in LEVELS:
+		for level in levels:
+			if encoding == 'identity':
+				compress = partial(bytes, body)
+			else:
+				compress = partial(build_middleware(encoding, level)._compress, body, encoding)
+
+			size = len(compress())
+			latency = measure(compress, runs=runs)
+			results.append(
+				[
+					encoding,
+					level if encoding != 'identity' else '-',
+					f'{size / 1024:.1f}',
+					f'{len(body) / size:.1f}x',
+					f'{latency["p50"]:.2f}',
+					f'{latency["p95"]:.2f}',
+					f'{cpu_ms(compress, runs):.2f}',
+				]
+			)
+
+	print(f'\nRestaurants list response compression with {items} restaurants ({runs} runs)\n')
+	print_table(['encoding', 'level', 'KiB', 'ratio', 'p50 ms', 'p95 ms', 'CPU ms'], results)
+
+
+if __name__ == '__main__':
+	parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+	parser.add_argument('--items', type=int, default=100, help='Restaurants in the response')
+	parser.add_argument('--runs', type=int, default=50, help='Measured runs per level')
+	args = parser.parse_args()
+
+	run(items=args.items, runs=args.runs)
@@ -0,0 +1,213 @@
+"""
+Benchmark the restaurants `open_at` filter over the normalized open intervals.
+
+Seeds a dedicated benchmark database with `--rows` restaurants (100k by default), each with
+one or two schedules taken from a set of common opening hours (lunch, dinner, overnight
+weekends, all day), and measures the open restaurants query used by `RestaurantRepository.list`
+at a few moments of the week:
+
+- before: no GiST index, every open interval is scanned
+- after: intervals looked up by `ix_restaurant_open_intervals_minutes`
+
+Usage: poetry run python -m benchmarks.restaurants_open_at [--rows 100000] [--runs 20]
+"""
+
+import argparse
+from datetime import datetime, time
+from functools import partial
+
+from sqlalchemy import Connection, Engine, Select, func, select, text
+from sqlmodel import SQLModel
+
+from benchmarks.utils import create_benchmark_engine, fetch_all, measure, plan_nodes, print_table
+
+# Every model must be imported so SQLModel.metadata knows all tables and relationships
+from src.categories.models import Category  # noqa: F401
+from src.core.weekly_intervals import minute_of_week, weekly_intervals
+from src.enums import Day
+from src.offers.models import Offer  # noqa: F401
+from src.products.models import Product  # noqa: F401
+from src.restaurants.models import Restaurant, RestaurantOpenInterval
+from src.users.models import User  # noqa: F401
+
+GIST_INDEX_NAME = 'ix_restaurant_open_intervals_minutes'
+PAGE_SIZE = 50
+
+# (day_type, start_day, end_day, start_time, end_time)
+SCHEDULE_TEMPLATES = [
+	('weekday', Day.MONDAY, Day.FRIDAY, time(11), time(15)),
+	('weekday', Day.MONDAY, Day.FRIDAY, time(18), time(23)),
+	('weekday', Day.TUESDAY, Day.SATURDAY, time(8), time(20)),
+	('weekend', Day.FRIDAY, Day.SATURDAY, time(18), time(3)),
+	('weekend', Day.SATURDAY, Day.SUNDAY, time(12), time(23, 59, 59)),
+	('weekend', Day.SUNDAY, Day.SUNDAY, time(20), time(2)),
+	('weekday', Day.MONDAY, Day.SUNDAY, time(0), time(0)),
+]
+
+MOMENTS = {
+	'monday lunch': datetime(2026, 1, 26, 12, 30),
+	'friday night': datetime(2026, 1, 30, 23, 30),
+	'saturday 2am': datetime(2026, 1, 31, 2, 0),
+	'monday 1am': datetime(2026, 2, 2, 1, 0),
+}
+
+
+def seed(conn: Connection, rows: int) -> None:
+	existing = conn.execute(text('SELECT count(*) FROM restaurants')).scalar_one()
+	if existing >= rows:
+		print(f'Found {existing} restaurants, skipping seed')
+		return
+
+	print(f'Seeding {rows - existing} restaurants with schedules...')
+	conn.execute(
+		text(
+			'INSERT INTO users (id, first_name, last_name, email, password, created_at, updated_at) '
+			"SELECT gen_random_uuid(), 'Bench', 'Owner', 'bench@rafood.com', 'bench', now(), now() "
+			'WHERE NOT EXISTS (SELECT 1 FROM users)'
+		)
+	)
+	conn.execute(
+		text(
+			'INSERT INTO restaurants (id, name, owner_id, street, number, neighborhood, city, '
+			'state_abbr, created_at, updated_at) '
+			"SELECT gen_random_uuid(), 'Restaurant ' || i, u.id, 'Street', i, 'Centro', "
+			"'Rio de Janeiro', 'RJ', now(), now() "
+			'FROM generate_series(:start, :end) AS i, (SELECT id FROM users LIMIT 1) AS u'
+		),
+		{'start': existing + 1, 'end': rows},
+	)
+
+	conn.execute(
+		text(
+			'CREATE TEMPORARY TABLE schedule_templates (template integer, day_type text, '
+			'start_day text, end_day text, start_time time, end_time time)'
+		)
+	)
+	conn.execute(
+		text(
+			'CREATE TEMPORARY TABLE template_intervals (template integer, start_minute integer, '
+			'end_minute integer)'
+		)
+	)
+	for template, (day_type, start_day, end_day, start_time, end_time) in enumerate(
+		SCHEDULE_TEMPLATES
+	):
+		conn.execute(
+			text(
+				'INSERT INTO schedule_templates VALUES (:template, :day_type, :start_day, :end_day, '
+				':start_time, :end_time)'
+			),
+			{
+				'template': template,
+				'day_type': day_type,
+				'start_day': start_day.value,
+				'end_day': end_day.value,
+				'start_time': start_time,
+				'end_time': end_time,
+			},
+		)
+		conn.execute(
+			text('INSERT INTO template_intervals VALUES (:template, :start_minute, :end_minute)'),
+			[
+				{'template': template, 'start_minute': start, 'end_minute': end}
+				for start, end in weekly_intervals(start_day, end_day, start_time, end_time)
+			],
+		)
+
+	# Every restaurant gets one template, and every other one a second, different template
+	conn.execute(
+		text(
+			'INSERT INTO restaurant_schedules (id, restaurant_id, day_type, start_day, end_day, '
+			'start_time, end_time, created_at, updated_at) '
+			'SELECT gen_random_uuid(), r.id, t.day_type, t.start_day, t.end_day, t.start_time, '
+			't.end_time, now(), now() '
+			'FROM (SELECT id, row_number() OVER (ORDER BY id) AS n FROM restaurants WHERE NOT EXISTS '
+			'(SELECT 1 FROM restaurant_schedules s WHERE s.restaurant_id = restaurants.id)) AS r '
+			'JOIN schedule_templates t ON t.template = r.n % :templates '
+			'OR (r.n % 2 = 0 AND t.template = (r.n / 2 + 1) % :templates)'
+		),
+		{'templates': len(SCHEDULE_TEMPLATES)},
+	)
+	conn.execute(
+		text(
+			'INSERT INTO restaurant_open_intervals (id, restaurant_id, schedule_id, start_minute, '
+			'end_minute) '
+			'SELECT gen_random_uuid(), s.restaurant_id, s.id, i.start_minute, i.end_minute '
+			'FROM restaurant_schedules s '
+			'JOIN schedule_templates t ON (t.day_type, t.start_day, t.end_day, t.start_time, '
+			't.end_time) = (s.day_type, s.start_day, s.end_day, s.start_time, s.end_time) '
+			'JOIN template_intervals i ON i.template = t.template '
+			'WHERE NOT EXISTS (SELECT 1 FROM restaurant_open_intervals o WHERE o.schedule_id = s.id)'
+		)
+	)
+
+	conn.execute(text('ANALYZE restaurants, restaurant_schedules, restaurant_open_intervals'))
+	conn.commit()
+
+
+def open_restaurants_query(moment: datetime) -> Select[tuple[Restaurant]]:
+	"""The query built by `RestaurantRepository.list` for the first page of `open_at`."""
+	open_restaurants = select(RestaurantOpenInterval.restaurant_id).where(  # type: ignore[call-overload]
+		func.int4range(RestaurantOpenInterval.start_minute, RestaurantOpenInterval.end_minute).op(
+			'@>'
+		)(minute_of_week(moment))
+	)
+
+	return (
+		select(Restaurant)
+		.filter(Restaurant.id.in_(open_restaurants))  # type: ignore[attr-defined]
+		.order_by(Restaurant.created_at, Restaurant.id)  # type: ignore[arg-type]
+		.limit(PAGE_SIZE + 1)
+	)
+
+
+def run(engine: Engine, rows: int, runs: int) -> None:
+	SQLModel.metadata.create_all(engine)
+
+	with engine.connect() as conn:
+		seed(conn, rows)
+
+		results: list[list[object]] = []
+		for label, with_index in (('before', False), ('after', True)):
+			conn.execute(text(f'DROP INDEX IF EXISTS {GIST_INDEX_NAME}'))
+			if with_index:
+				conn.execute(
+					text(
+						f'CREATE INDEX {GIST_INDEX_NAME} ON restaurant_open_intervals '
+						'USING gist (int4range(start_minute, end_minute))'
+					)
+				)
+				conn.execute(text('ANALYZE restaurant_open_intervals'))
+			conn.commit()
+
+			for moment_label, moment in MOMENTS.items():
+				query = open_restaurants_query(moment)
+				open_count = conn.execute(
+					select(func.count()).select_from(
+						open_restaurants_query(moment).limit(None).order_by(None).subquery()
+					)
+				).scalar_one()
+				latency = measure(partial(fetch_all, conn, query), runs=runs)
+
+				results.append(
+					[
+						label,
+						moment_label,
+						open_count,
+						f'{latency["p50"]:.2f}',
+						f'{latency["p95"]:.2f}',
+						plan_nodes(conn, query),
+					]
+				)
+
+	print(f'\nOpen restaurants (first page) over {rows} restaurants ({runs} runs per moment)\n')
+	print_table(['', 'open at', 'open', 'p50 ms', 'p95 ms', 'plan'], results)
+
+
+if __name__ == '__main__':
+	parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+	parser.add_argument('--rows', type=int, default=100_000, help='Restaurants to seed')
+	parser.add_argument('--runs', type=int, default=20, help='Measured runs per moment')
+	args = parser.parse_args()
+
+	run(create_benchmark_engine(), rows=args.rows, runs=args.runs)
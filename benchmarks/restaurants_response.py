@@ -0,0 +1,132 @@
+"""
+Benchmark serializing a restaurants list response before and after `ModelResponse`.
+
+Builds a `RestaurantPageSchema` with `--items` restaurants (5,000 by default), each with two
+schedules, like the ones returned by `RestaurantService.list`, and measures:
+
+- before: FastAPI's `response_model` path, validating the page again and rendering it with
+  `JSONResponse` (stdlib json)
+- after: `ModelResponse`, rendering the page with its compiled pydantic-core serializer
+
+It doesn't need a database, since only the serialization is measured.
+
+Usage: poetry run python -m benchmarks.restaurants_response [--items 5000] [--runs 20]
+"""
+
+import argparse
+import asyncio
+from datetime import datetime, time
+from functools import partial
+from uuid import uuid4
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+from benchmarks.utils import measure, print_table
+from src.core.responses import ModelResponse
+from src.restaurants.schemas import (
+	RestaurantPageSchema,
+	RestaurantScheduleSchema,
+	RestaurantWithSchedulesSchema,
+)
+
+
+def build_page(items: int) -> RestaurantPageSchema:
+	now = datetime.now()
+	schedules = [
+		RestaurantScheduleSchema(
+			id=uuid4(),
+			day_type=day_type,
+			start_day=start_day,
+			end_day=end_day,
+			start_time=time(11),
+			end_time=time(23),
+			created_at=now,
+			updated_at=now,
+		)
+		for day_type, start_day, end_day in (
+			('weekday', 'monday', 'friday'),
+			('weekend', 'saturday', 'sunday'),
+		)
+	]
+
+	return RestaurantPageSchema(
+		items=[
+			RestaurantWithSchedulesSchema(
+				id=uuid4(),
+				name=f'Restaurant {n}',
+				image_url='https://example.com/image.jpg',
+				owner_id=uuid4(),
+				street='Rua Uruguai',
+				number=n,
+				neighborhood='Tijuca',
+				city='Rio de Janeiro',
+				state_abbr='RJ',
+				created_at=now,
+				updated_at=now,
+				schedules=schedules,
+			)
+			for n in range(1, items + 1)
+		],
+		next_cursor=None,
+	)
+
+
+def render_with_response_model(
+	loop: asyncio.AbstractEventLoop, page: RestaurantPageSchema
+) -> bytes:
+	"""What FastAPI does with the value returned by a route that declares a `response_model`."""
+	field = create_response_field(
+		name='Response_List_restaurants', type_=RestaurantPageSchema, mode='serialization'
+	)
+	content = loop.run_until_complete(
+		serialize_response(field=field, response_content=page, is_coroutine=True)
+	)
+
+	return bytes(JSONResponse(content).body)
+
+
+def render_with_model_response(page: RestaurantPageSchema) -> bytes:
+	return bytes(ModelResponse(page).body)
+
+
+def run(items: int, runs: int) -> None:
+	page = build_page(items)
+	loop = asyncio.new_event_loop()
+
+	scenarios = [
+		(
+			'before',
+			'response_model + JSONResponse',
+			partial(render_with_response_model, loop, page),
+		),
+		('after', 'ModelResponse', partial(render_with_model_response, page)),
+	]
+
+	results: list[list[object]] = []
+	for label, path, render in scenarios:
+		latency = measure(render, runs=runs)
+		results.append(
+			[
+				label,
+				path,
+				f'{len(render()) / 1024:.0f}',
+				f'{latency["p50"]:.2f}',
+				f'{latency["p95"]:.2f}',
+			]
+		)
+
+	loop.close()
+
+	print(f'\nRestaurants list response serialization with {items} restaurants ({runs} runs)\n')
+	print_table(['', 'path', 'body KiB', 'p50 ms', 'p95 ms'], results)
+
+
+if __name__ == '__main__':
+	parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+	parser.add_argument('--items', type=int, default=5_000, help='Restaurants in the response')
+	parser.add_argument('--runs', type=int, default=20, help='Measured runs per scenario')
+	args = parser.parse_args()
+
+	run(items=args.items, runs=args.runs)
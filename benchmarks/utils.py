@@ -0,0 +1,87 @@
+import statistics
+import time
+from collections.abc import Callable
+from typing import Any
+
+import psycopg2
+from sqlalchemy import Connection, Engine, create_engine, text
+
+from src.core.config import settings
+
+BENCHMARK_DB_NAME = f'{settings.DB_NAME}_benchmark'
+
+
+def create_benchmark_engine() -> Engine:
+	"""
+	Create a sync engine for a dedicated benchmark database, creating it when missing.
+	Benchmarks seed a lot of data, so they never run against the application database.
+	"""
+	conn = psycopg2.connect(
+		dbname='postgres',
+		user=settings.DB_USER,
+		password=settings.DB_PASSWORD,
+		host=settings.DB_HOST,
+		port=settings.DB_PORT,
+	)
+	conn.autocommit = True
+
+	cur = conn.cursor()
+	cur.execute('SELECT 1 FROM pg_database WHERE datname = %s', (BENCHMARK_DB_NAME,))
+
+	if not cur.fetchone():
+		cur.execute(f'CREATE DATABASE "{BENCHMARK_DB_NAME}"')
+
+	cur.close()
+	conn.close()
+
+	return create_engine(
+		f'postgresql+psycopg2://{settings.DB_USER}:{settings.DB_PASSWORD}'
+		f'@{settings.DB_HOST}:{settings.DB_PORT}/{BENCHMARK_DB_NAME}'
+	)
+
+
+def measure(fn: Callable[[], object], runs: int, warmup: int = 2) -> dict[str, float]:
+	"""Run `fn` a number of times and return p50/p95/mean wall-clock latency in milliseconds."""
+	for _ in range(warmup):
+		fn()
+
+	samples = []
+	for _ in range(runs):
+		start = time.perf_counter()
+		fn()
+		samples.append((time.perf_counter() - start) * 1000)
+
+	samples.sort()
+	return {
+		'p50': statistics.median(samples),
+		'p95': samples[min(len(samples) - 1, int(len(samples) * 0.95))],
+		'mean': statistics.fmean(samples),
+	}
+
+
+def fetch_all(conn: Connection, query: Any) -> list[Any]:
+	return list(conn.execute(query).all())
+
+
+def plan_nodes(conn: Connection, query: Any) -> str:
+	"""Return the plan node types chosen by Postgres, e.g. `Bitmap Heap Scan > Bitmap Index Scan`."""
+	sql = str(query.compile(conn.engine, compile_kwargs={'literal_binds': True}))
+	plan = conn.execute(text(f'EXPLAIN (FORMAT JSON) {sql}')).scalar_one()[0]['Plan']
+
+	nodes = []
+	while plan:
+		nodes.append(plan['Node Type'])
+		plan = (plan.get('Plans') or [None])[0]
+
+	return ' > '.join(nodes)
+
+
+def print_table(headers: list[str], rows: list[list[object]]) -> None:
+	widths = [
+		max(len(str(value)) for value in column) for column in zip(headers, *rows, strict=True)
+	]
+
+	print(' | '.join(str(h).ljust(w) for h, w in zip(headers, widths, strict=True)))
+	print('-+-'.join('-' * w for w in widths))
+	for row in rows:
+		print(' | '.join(str(value).ljust(w) for value, w in zip(row, widths, strict=True)))
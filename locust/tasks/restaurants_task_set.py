@@ -53,7 +53,7 @@ class RestaurantTasks(TaskSet):
 			log_failure('Get Restaurants', response)
 			return []
 
-		restaurants = response.json()
+		restaurants = response.json().get('items', [])
 		return [restaurant.get('id') for restaurant in restaurants if restaurant.get('id')]
 
 	def get_restaurant_details(self, restaurant_id: str):
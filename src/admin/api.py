@@ -0,0 +1,27 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Query, status
+from fastapi.responses import PlainTextResponse
+
+from src.admin.deps import ProfilerServiceDeps, verify_profiler_access
+from src.core.config import settings
+
+router = APIRouter(dependencies=[Depends(verify_profiler_access)])
+
+
+@router.get(
+	'/profile',
+	name='Profile event loop',
+	status_code=status.HTTP_200_OK,
+	description=(
+		'Sample the stacks of the event loop of the worker answering the request for some '
+		'seconds, returning them in the collapsed stack format (a flamegraph input)'
+	),
+	response_class=PlainTextResponse,
+)
+async def profile(
+	service: ProfilerServiceDeps,
+	seconds: Annotated[float, Query(gt=0, le=settings.PROFILER_MAX_SECONDS)] = 10,
+	interval_ms: Annotated[float, Query(ge=1, le=1000)] = 10,
+) -> PlainTextResponse:
+	return PlainTextResponse(await service.profile(seconds, interval_ms / 1000))
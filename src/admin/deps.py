@@ -0,0 +1,33 @@
+import secrets
+from typing import Annotated
+
+from fastapi import Depends, Header
+
+from src.admin.exceptions import AdminTokenInvalidError, ProfilerDisabledError
+from src.admin.service import ProfilerService
+from src.core.config import settings
+
+# Shared by every request of the worker process, so only one profile runs at a time
+profiler_service = ProfilerService()
+
+
+def verify_profiler_access(
+	admin_token: Annotated[str | None, Header(alias=settings.ADMIN_HEADER_NAME)] = None,
+) -> None:
+	"""
+	The profiler answers as if it didn't exist unless PROFILER_ENABLED, and then only to
+	requests with the ADMIN_TOKEN. An empty ADMIN_TOKEN refuses every request.
+	"""
+	if not settings.PROFILER_ENABLED:
+		raise ProfilerDisabledError()
+	if not settings.ADMIN_TOKEN or admin_token is None:
+		raise AdminTokenInvalidError()
+	if not secrets.compare_digest(admin_token.encode(), settings.ADMIN_TOKEN.encode()):
+		raise AdminTokenInvalidError()
+
+
+def get_profiler_service() -> ProfilerService:
+	return profiler_service
+
+
+ProfilerServiceDeps = Annotated[ProfilerService, Depends(get_profiler_service)]
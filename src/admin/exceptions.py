@@ -0,0 +1,25 @@
+from src.exceptions import AppConflictError, AppNotFoundError, AppUnauthorizedError
+
+
+class ProfilerDisabledError(AppNotFoundError):
+	def __init__(self) -> None:
+		super().__init__(
+			message='Profiler is disabled',
+			error_code='profiler_disabled',
+		)
+
+
+class AdminTokenInvalidError(AppUnauthorizedError):
+	def __init__(self) -> None:
+		super().__init__(
+			message='Missing or invalid admin token',
+			error_code='admin_token_invalid',
+		)
+
+
+class ProfilerBusyError(AppConflictError):
+	def __init__(self) -> None:
+		super().__init__(
+			message='A profile is already running, try again when it ends',
+			error_code='profiler_busy',
+		)
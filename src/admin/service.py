@@ -0,0 +1,78 @@
+import asyncio
+import sys
+import threading
+import time
+from collections import Counter
+from types import FrameType
+
+from src.admin.exceptions import ProfilerBusyError
+from src.core.logging.logger import StructLogger
+
+logger = StructLogger()
+
+
+def frame_name(frame: FrameType) -> str:
+	code = frame.f_code
+	return f'{code.co_name} ({code.co_filename}:{code.co_firstlineno})'
+
+
+def collapse(frame: FrameType | None) -> str:
+	"""Stack of a frame, outermost first, as a line of the collapsed stack format."""
+	names = []
+	while frame is not None:
+		names.append(frame_name(frame))
+		frame = frame.f_back
+
+	return ';'.join(reversed(names))
+
+
+def sample_stacks(thread_id: int, seconds: float, interval: float) -> Counter[str]:
+	"""
+	Take the stack of a thread every `interval` seconds for `seconds`, counting each distinct
+	stack. Samples are taken on wall-clock time, so time the thread is idle (e.g. the event
+	loop waiting on `select`) is sampled too.
+	"""
+	stacks: Counter[str] = Counter()
+	deadline = time.monotonic() + seconds
+
+	while time.monotonic() < deadline:
+		frame = sys._current_frames().get(thread_id)
+		if frame is None:
+			break
+
+		stacks[collapse(frame)] += 1
+		del frame
+		time.sleep(interval)
+
+	return stacks
+
+
+def format_collapsed(stacks: Counter[str]) -> str:
+	"""One `frame;frame;frame count` line per stack, the input of flamegraph.pl or speedscope."""
+	return ''.join(f'{stack} {count}\n' for stack, count in stacks.most_common())
+
+
+class ProfilerService:
+	"""
+	Sample the event loop of this worker process from a separate thread, so requests keep
+	being served (and profiled) while the profile runs. One profile runs at a time.
+	"""
+
+	def __init__(self) -> None:
+		self._running = False
+
+	async def profile(self, seconds: float, interval: float) -> str:
+		if self._running:
+			raise ProfilerBusyError()
+
+		# Called from a coroutine, so this is the thread running the event loop
+		loop_thread_id = threading.get_ident()
+		self._running = True
+		try:
+			stacks = await asyncio.to_thread(sample_stacks, loop_thread_id, seconds, interval)
+		finally:
+			self._running = False
+
+		logger.bind(profiled_samples_count=sum(stacks.values()))
+
+		return format_collapsed(stacks)
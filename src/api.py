@@ -1,5 +1,6 @@
 from fastapi import APIRouter
 
+from src.admin import api as admin
 from src.categories import api as categories
 from src.offers import api as offers
 from src.products import api as products
@@ -14,3 +15,4 @@ api_router.include_router(users.router, prefix='/users', tags=['users'])
 api_router.include_router(categories.router, prefix='/categories', tags=['categories'])
 api_router.include_router(products.router, prefix='/products', tags=['products'])
 api_router.include_router(offers.router, prefix='/offers', tags=['offers'])
+api_router.include_router(admin.router, prefix='/admin', tags=['admin'], include_in_schema=False)
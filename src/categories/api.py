@@ -8,6 +8,7 @@ from src.categories.schemas import (
 	CreateCategoryResponseSchema,
 	CreateCategorySchema,
 )
+from src.core.responses import ModelResponse
 
 router = APIRouter()
 
@@ -19,8 +20,8 @@ router = APIRouter()
 	description='Get all categories',
 	response_model=list[CategorySchema],
 )
-async def list_category(service: CategoryServiceDeps) -> list[CategorySchema]:
-	return await service.list()
+async def list_category(service: CategoryServiceDeps) -> ModelResponse:
+	return ModelResponse(await service.list())
 
 
 @router.post(
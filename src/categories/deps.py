@@ -4,9 +4,25 @@ from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.categories.repository import CategoryRepository
+from src.categories.schemas import CategorySchema
 from src.categories.service import CategoryService
+from src.core.cache import TTLCache
+from src.core.config import settings
 from src.core.deps import get_session
 
+# Shared by every request of the worker process, so writes invalidate what reads have cached.
+# It's loaded from the primary, not a read replica: a replica lagging behind a write would
+# refill it with the rows from before the write, served until the TTL ends
+categories_cache: TTLCache[list[CategorySchema]] = TTLCache(
+	name='categories',
+	ttl_seconds=settings.CATEGORIES_CACHE_TTL_SECONDS,
+	max_size=settings.CATEGORIES_CACHE_MAX_SIZE,
+)
+
+
+def get_categories_cache() -> TTLCache[list[CategorySchema]]:
+	return categories_cache
+
 
 def get_category_repository(
 	db: AsyncSession = Depends(get_session),
@@ -16,8 +32,9 @@ def get_category_repository(
 
 def get_category_service(
 	repository: CategoryRepository = Depends(get_category_repository),
+	cache: TTLCache[list[CategorySchema]] = Depends(get_categories_cache),
 ) -> CategoryService:
-	return CategoryService(repository)
+	return CategoryService(repository, cache)
 
 
 CategoryServiceDeps = Annotated[CategoryService, Depends(get_category_service)]
@@ -1,13 +1,17 @@
 from uuid import UUID
 
+from sqlalchemy import delete
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
 from src.categories.exceptions import CategoryNotFoundError
 from src.categories.models import Category
 from src.categories.schemas import CreateCategorySchema
+from src.core.cache_invalidation import notify_change
+from src.core.metrics.database import track_repository
 
 
+@track_repository
 class CategoryRepository:
 	db: AsyncSession
 
@@ -15,14 +19,16 @@ class CategoryRepository:
 		self.db = db
 
 	async def list(self) -> list[Category]:
-		result = await self.db.execute(select(Category))
-		categories: list[Category] = list(result.scalars().unique().all())
+		async with self.db.begin():
+			result = await self.db.execute(select(Category))
+			categories: list[Category] = list(result.scalars().unique().all())
 
 		return categories
 
 	async def get(self, id: UUID) -> Category:
-		result = await self.db.execute(select(Category).where(Category.id == id))  # type: ignore[arg-type]
-		category: Category | None = result.scalars().unique().first()
+		async with self.db.begin():
+			result = await self.db.execute(select(Category).where(Category.id == id))  # type: ignore[arg-type]
+			category: Category | None = result.scalars().unique().first()
 
 		if not category:
 			raise CategoryNotFoundError(category_id=str(id))
@@ -32,11 +38,20 @@ class CategoryRepository:
 	async def create(self, category: CreateCategorySchema) -> UUID:
 		new_category = Category(**category.model_dump())
 
-		self.db.add(new_category)
-		await self.db.commit()
+		async with self.db.begin():
+			self.db.add(new_category)
+			await notify_change(self.db, Category.__tablename__, new_category.id)
 
 		return new_category.id
 
-	async def delete(self, category: Category) -> None:
-		await self.db.delete(category)
-		await self.db.commit()
+	async def delete(self, id: UUID) -> None:
+		"""Delete a category with a single `DELETE ... RETURNING` statement, without loading it first."""
+		query = delete(Category).where(Category.id == id).returning(Category.id)  # type: ignore[arg-type, call-overload]
+
+		async with self.db.begin():
+			result = await self.db.execute(query)
+
+			if result.scalar_one_or_none() is None:
+				raise CategoryNotFoundError(category_id=str(id))
+
+			await notify_change(self.db, Category.__tablename__, id)
@@ -7,29 +7,42 @@ from src.categories.schemas import (
 	CreateCategoryResponseSchema,
 	CreateCategorySchema,
 )
+from src.core.cache import TTLCache
 from src.core.logging.logger import StructLogger
+from src.core.timing import timed
 
 logger = StructLogger()
 
+LIST_CACHE_KEY = 'list'
+
 
 class CategoryService:
 	repository: CategoryRepository
+	cache: TTLCache[list[CategorySchema]]
 
-	def __init__(self, repository: CategoryRepository):
+	def __init__(self, repository: CategoryRepository, cache: TTLCache[list[CategorySchema]]):
 		self.repository = repository
+		self.cache = cache
+
+	async def _load(self) -> list[CategorySchema]:
+		categories = await self.repository.list()
+
+		with timed('validation'):
+			return [CategorySchema.model_validate(category) for category in categories]
 
 	async def list(self) -> list[CategorySchema]:
 		try:
-			categories = await self.repository.list()
+			categories = await self.cache.get_or_load(LIST_CACHE_KEY, self._load)
 			logger.bind(listed_categories_count=len(categories))
 
-			return [CategorySchema.model_validate(category) for category in categories]
+			return list(categories)
 		except Exception as e:
 			raise CategoriesInternalError(message=str(e)) from e
 
 	async def create(self, category: CreateCategorySchema) -> CreateCategoryResponseSchema:
 		try:
 			category_id = await self.repository.create(category)
+			self.cache.invalidate()
 			logger.bind(created_category_id=str(category_id))
 
 			return CreateCategoryResponseSchema(id=category_id)
@@ -38,8 +51,8 @@ class CategoryService:
 
 	async def delete(self, id: UUID) -> None:
 		try:
-			category = await self.repository.get(id)
-			await self.repository.delete(category)
+			await self.repository.delete(id)
+			self.cache.invalidate()
 
 			logger.bind(deleted_category_id=id)
 		except CategoryNotFoundError:
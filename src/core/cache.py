@@ -0,0 +1,86 @@
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Generic, TypeVar
+
+from prometheus_client import Counter
+
+T = TypeVar('T')
+
+CACHE_HITS = Counter('cache_hits_total', 'Reads served from an in-process cache', ['cache'])
+CACHE_MISSES = Counter(
+	'cache_misses_total', 'Reads not found, or expired, in an in-process cache', ['cache']
+)
+CACHE_EVICTIONS = Counter(
+	'cache_evictions_total',
+	'Entries dropped from an in-process cache to stay within its max size',
+	['cache'],
+)
+
+
+class TTLCache(Generic[T]):
+	"""
+	Bounded in-process cache where entries expire `ttl_seconds` after being stored and the least
+	recently used one is evicted past `max_size`. Each worker process has its own copy, so it
+	only fits small tables where a stale read for up to the TTL is acceptable.
+	"""
+
+	def __init__(
+		self,
+		name: str,
+		ttl_seconds: float,
+		max_size: int,
+		clock: Callable[[], float] = time.monotonic,
+	) -> None:
+		self.name = name
+		self.ttl_seconds = ttl_seconds
+		self.max_size = max_size
+		self.clock = clock
+		self._entries: OrderedDict[Hashable, tuple[float, T]] = OrderedDict()
+		# Bumped on every invalidation, so loads started before it don't store stale values
+		self._generation = 0
+
+	def __len__(self) -> int:
+		return len(self._entries)
+
+	def get(self, key: Hashable) -> T | None:
+		entry = self._entries.get(key)
+
+		if entry is None or entry[0] <= self.clock():
+			self._entries.pop(key, None)
+			CACHE_MISSES.labels(cache=self.name).inc()
+			return None
+
+		self._entries.move_to_end(key)
+		CACHE_HITS.labels(cache=self.name).inc()
+
+		return entry[1]
+
+	def set(self, key: Hashable, value: T) -> None:
+		if self.ttl_seconds <= 0 or self.max_size <= 0:
+			return
+
+		self._entries[key] = (self.clock() + self.ttl_seconds, value)
+		self._entries.move_to_end(key)
+
+		while len(self._entries) > self.max_size:
+			self._entries.popitem(last=False)
+			CACHE_EVICTIONS.labels(cache=self.name).inc()
+
+	async def get_or_load(self, key: Hashable, load: Callable[[], Awaitable[T]]) -> T:
+		value = self.get(key)
+		if value is not None:
+			return value
+
+		generation = self._generation
+		value = await load()
+
+		# Another request may have invalidated the cache while this one was loading
+		if generation == self._generation:
+			self.set(key, value)
+
+		return value
+
+	def invalidate(self) -> None:
+		self._entries.clear()
+		self._generation += 1
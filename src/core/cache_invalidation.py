@@ -0,0 +1,111 @@
+import asyncio
+import contextlib
+import json
+from collections import defaultdict
+from collections.abc import Awaitable, Callable
+from typing import Any
+from uuid import UUID
+
+import asyncpg
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.cache import TTLCache
+from src.core.logging.logger import StructLogger
+
+logger = StructLogger()
+
+CHANNEL = 'cache_invalidation'
+
+
+async def notify_change(db: AsyncSession, entity: str, id: UUID) -> None:
+	"""
+	Tell every app instance listening on the database that an entity changed. Postgres only
+	delivers the notification when the current transaction commits, and drops it on rollback.
+	"""
+	payload = json.dumps({'entity': entity, 'id': str(id)})
+
+	await db.execute(select(func.pg_notify(CHANNEL, payload)))
+
+
+class CacheInvalidationListener:
+	"""
+	Background task listening for `notify_change` notifications on a dedicated connection and
+	invalidating the in-process caches registered for the changed entity, so writes served by
+	another pod (or worker process) don't leave stale reads here until the TTL ends.
+	"""
+
+	def __init__(
+		self,
+		connect: Callable[[], Awaitable[asyncpg.Connection]],
+		retry_seconds: float,
+	) -> None:
+		self.connect = connect
+		self.retry_seconds = retry_seconds
+		self._caches: dict[str, list[TTLCache[Any]]] = defaultdict(list)
+		self._task: asyncio.Task[None] | None = None
+
+	def register(self, entity: str, cache: TTLCache[Any]) -> None:
+		self._caches[entity].append(cache)
+
+	def invalidate(self, payload: str) -> None:
+		try:
+			entity = json.loads(payload)['entity']
+		except (ValueError, KeyError, TypeError):
+			logger.warning('Ignoring malformed cache invalidation', payload=payload)
+			return
+
+		for cache in self._caches.get(entity, []):
+			cache.invalidate()
+
+	def invalidate_all(self) -> None:
+		for caches in self._caches.values():
+			for cache in caches:
+				cache.invalidate()
+
+	def _on_notification(
+		self, connection: asyncpg.Connection, pid: int, channel: str, payload: str
+	) -> None:
+		self.invalidate(payload)
+
+	async def _listen_until_closed(self) -> None:
+		connection = await self.connect()
+		closed = asyncio.Event()
+		connection.add_termination_listener(lambda _: closed.set())
+
+		try:
+			await connection.add_listener(CHANNEL, self._on_notification)
+			# Notifications sent while disconnected are lost, so nothing cached before is trusted
+			self.invalidate_all()
+
+			await closed.wait()
+		finally:
+			if not connection.is_closed():
+				await connection.close()
+
+	async def run(self) -> None:
+		while True:
+			try:
+				await self._listen_until_closed()
+				logger.warning('Cache invalidation listener disconnected')
+			except Exception as e:
+				# Any failure (connect timeout, connection dropped mid-call) is retried, otherwise
+				# invalidations from other pods would stop until the process restarts
+				logger.warning(
+					'Cache invalidation listener failed', error=str(e), error_type=type(e).__name__
+				)
+
+			await asyncio.sleep(self.retry_seconds)
+
+	def start(self) -> None:
+		self._task = asyncio.create_task(self.run())
+
+	async def stop(self) -> None:
+		if self._task is None:
+			return
+
+		self._task.cancel()
+		with contextlib.suppress(asyncio.CancelledError):
+			await self._task
+
+		self._task = None
@@ -0,0 +1,145 @@
+import asyncio
+import gzip
+import hashlib
+
+import brotli
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.core.cache import TTLCache
+
+# Preferred first when the client accepts both with the same weight
+ENCODINGS = ('br', 'gzip')
+COMPRESSIBLE_CONTENT_TYPES = ('application/json', 'text/')
+
+
+def negotiate_encoding(accept_encoding: str) -> str | None:
+	"""
+	Pick the supported encoding with the highest weight in an `Accept-Encoding` header, e.g.
+	`gzip, br;q=0.8`, or None when the client accepts none of them (a weight of 0 refuses it).
+	"""
+	weights: dict[str, float] = {}
+
+	for item in accept_encoding.lower().split(','):
+		coding, _, params = item.partition(';')
+		coding = coding.strip()
+		weight = 1.0
+
+		if params.strip().startswith('q='):
+			try:
+				weight = float(params.strip()[2:])
+			except ValueError:
+				weight = 0.0
+
+		if coding == '*':
+			for encoding in ENCODINGS:
+				weights.setdefault(encoding, weight)
+		elif coding in ENCODINGS:
+			weights[coding] = weight
+
+	accepted = [encoding for encoding in ENCODINGS if weights.get(encoding, 0) > 0]
+
+	return max(accepted, key=lambda encoding: weights[encoding]) if accepted else None
+
+
+class CompressionMiddleware:
+	"""
+	Compress responses with brotli or gzip, as negotiated with `Accept-Encoding`, once their
+	body reaches `minimum_size` bytes. Bodies of `thread_minimum_size` bytes or more are
+	compressed in a worker thread, so they don't block the event loop, and compressed bodies
+	are cached by content, so the same list sent again isn't compressed again.
+	Streamed responses (sent in more than one body message) are left uncompressed.
+	"""
+
+	def __init__(
+		self,
+		app: ASGIApp,
+		minimum_size: int,
+		gzip_level: int,
+		brotli_quality: int,
+		thread_minimum_size: int,
+		cache_ttl_seconds: float,
+		cache_max_size: int,
+	) -> None:
+		self.app = app
+		self.minimum_size = minimum_size
+		self.gzip_level = gzip_level
+		self.brotli_quality = brotli_quality
+		self.thread_minimum_size = thread_minimum_size
+		self.cache: TTLCache[bytes] = TTLCache(
+			name='compressed_responses', ttl_seconds=cache_ttl_seconds, max_size=cache_max_size
+		)
+
+	async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+		if scope['type'] != 'http':
+			await self.app(scope, receive, send)
+			return
+
+		encoding = negotiate_encoding(Headers(scope=scope).get('accept-encoding', ''))
+		if encoding is None:
+			await self.app(scope, receive, send)
+			return
+
+		start_message: Message | None = None
+
+		# The response start is held until its body tells if it's worth compressing
+		async def inner_send(message: Message) -> None:
+			nonlocal start_message
+
+			if message['type'] == 'http.response.start':
+				start_message = message
+				return
+			if message['type'] != 'http.response.body' or start_message is None:
+				await send(message)
+				return
+
+			start, start_message = start_message, None
+			body = message.get('body', b'')
+
+			if message.get('more_body', False) or not self.should_compress(start, body):
+				await send(start)
+				await send(message)
+				return
+
+			compressed = await self.compress(body, encoding)
+			headers = MutableHeaders(raw=start['headers'])
+			headers['Content-Encoding'] = encoding
+			headers['Content-Length'] = str(len(compressed))
+			headers.add_vary_header('Accept-Encoding')
+
+			await send(start)
+			await send({'type': 'http.response.body', 'body': compressed})
+
+		await self.app(scope, receive, inner_send)
+
+	def should_compress(self, start: Message, body: bytes) -> bool:
+		headers = Headers(raw=start['headers'])
+
+		return (
+			len(body) >= self.minimum_size
+			and 'content-encoding' not in headers
+			and headers.get('content-type', '').startswith(COMPRESSIBLE_CONTENT_TYPES)
+		)
+
+	async def compress(self, body: bytes, encoding: str) -> bytes:
+		key = (encoding, hashlib.blake2b(body, digest_size=16).digest())
+
+		compressed = self.cache.get(key)
+		if compressed is not None:
+			return compressed
+
+		if len(body) >= self.thread_minimum_size:
+			compressed = await asyncio.to_thread(self._compress, body, encoding)
+		else:
+			compressed = self._compress(body, encoding)
+
+		self.cache.set(key, compressed)
+
+		return compressed
+
+	def _compress(self, body: bytes, encoding: str) -> bytes:
+		if encoding == 'br':
+			return bytes(brotli.compress(body, quality=self.brotli_quality))
+
+		# A fixed mtime keeps the output the same for the same body
+		return gzip.compress(body, compresslevel=self.gzip_level, mtime=0)
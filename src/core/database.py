@@ -1,14 +1,50 @@
+from collections.abc import Awaitable
+
+import asyncpg
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
 from src.core.config import settings
+from src.core.metrics.database import TimedQueuePool
+from src.core.replicas import ReplicaRouter
+
+
+def build_engine(url: str) -> AsyncEngine:
+	return create_async_engine(
+		url,
+		poolclass=TimedQueuePool,
+		pool_size=settings.DB_POOL_SIZE,
+		max_overflow=settings.DB_POOL_MAX_OVERFLOW,
+		pool_timeout=settings.DB_POOL_TIMEOUT,
+		pool_recycle=settings.DB_POOL_RECYCLE,
+		pool_pre_ping=settings.DB_POOL_PRE_PING,
+		connect_args={'statement_cache_size': settings.DB_STATEMENT_CACHE_SIZE},
+	)
+
 
 db_url = f'postgresql+asyncpg://{settings.DB_USER}:{settings.DB_PASSWORD}@{settings.DB_HOST}:{settings.DB_PORT}/{settings.DB_NAME}'
-engine: AsyncEngine = create_async_engine(db_url)
+engine: AsyncEngine = build_engine(db_url)
+
+# Each replica has its own pool with the same settings as the primary
+replica_router = ReplicaRouter(
+	engines=[build_engine(url) for url in settings.DB_REPLICA_URLS],
+	ejection_seconds=settings.DB_REPLICA_EJECTION_SECONDS,
+)
+
+
+def connect_primary() -> Awaitable[asyncpg.Connection]:
+	"""Open a connection to the primary outside the pool, for long lived uses such as LISTEN."""
+	return asyncpg.connect(
+		engine.url.set(drivername='postgresql').render_as_string(hide_password=False)
+	)
 
 
+# Repositories open explicit transactions with `session.begin()`, so a connection is checked out
+# on the first statement and returned to the pool as soon as the transaction ends, instead of
+# being held until the request finishes (responses are serialized before sessions are closed)
 Session: AsyncSession = sessionmaker(  # type: ignore[call-overload]
 	autocommit=False,
+	autobegin=False,
 	autoflush=False,
 	expire_on_commit=False,
 	class_=AsyncSession,
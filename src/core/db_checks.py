@@ -0,0 +1,72 @@
+from sqlalchemy import Connection, inspect
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import configure_mappers
+from sqlmodel.main import default_registry
+
+from src.core.logging.logger import StructLogger
+
+logger = StructLogger()
+
+
+def relationship_foreign_keys() -> set[tuple[str, str]]:
+	"""
+	Return the (table, column) pairs of every foreign key column used to join a relationship
+	declared on the models. Both sides of each relationship are checked, so one-to-many and
+	many-to-one relationships report the same column.
+	"""
+	configure_mappers()
+
+	foreign_keys = set()
+	for mapper in default_registry.mappers:
+		for relationship in mapper.relationships:
+			for local, remote in relationship.local_remote_pairs or []:
+				for column in (local, remote):
+					if column.foreign_keys and column.table is not None:
+						foreign_keys.add((column.table.name, column.name))
+
+	return foreign_keys
+
+
+def find_unindexed_foreign_keys(conn: Connection) -> list[tuple[str, str]]:
+	"""
+	Return the relationship foreign key columns that aren't the leading column of any index
+	(or of the primary key) in the connected database.
+	"""
+	inspector = inspect(conn)
+
+	unindexed = []
+	for table_name, column_name in sorted(relationship_foreign_keys()):
+		if not inspector.has_table(table_name):
+			continue
+
+		leading_columns = {
+			index['column_names'][0]
+			for index in inspector.get_indexes(table_name)
+			if index['column_names']
+		}
+		leading_columns.update(inspector.get_pk_constraint(table_name)['constrained_columns'][:1])
+
+		if column_name not in leading_columns:
+			unindexed.append((table_name, column_name))
+
+	return unindexed
+
+
+async def warn_unindexed_foreign_keys(engine: AsyncEngine) -> None:
+	"""
+	Log a warning for each foreign key column used by a relationship that has no index.
+	Joined loads and filters on these columns fall back to sequential scans without one.
+	"""
+	try:
+		async with engine.connect() as conn:
+			unindexed = await conn.run_sync(find_unindexed_foreign_keys)
+	except Exception as e:
+		logger.warning('Could not check foreign key indexes', error=str(e))
+		return
+
+	for table_name, column_name in unindexed:
+		logger.warning(
+			'Foreign key column used by a relationship has no index',
+			table=table_name,
+			column=column_name,
+		)
@@ -1,14 +1,17 @@
 from collections.abc import AsyncGenerator
 
+from fastapi import Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.core.database import Session
+from src.core.database import Session, replica_router
+from src.core.replicas import is_connection_error, reads_from_primary
 
 
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
 	"""
 	Get an async session from the database.
-	Starts a session, yields it and then closes it when it ends.
+	Starts a session, yields it and then closes it when it ends. Creating a session doesn't
+	touch the pool: repositories check a connection out only inside their own transactions.
 	"""
 	session: AsyncSession = Session()  # type: ignore[operator]
 
@@ -16,3 +19,23 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
 		yield session
 	finally:
 		await session.close()
+
+
+async def get_read_session(request: Request) -> AsyncGenerator[AsyncSession, None]:
+	"""
+	Get an async session for read-only routes.
+	Binds it to a healthy read replica, or to the primary when there are no replicas, all of
+	them are ejected or the request must read its own writes. A replica failing to connect
+	is ejected, so the next requests skip it.
+	"""
+	replica = None if reads_from_primary(request) else replica_router.choose()
+	session: AsyncSession = Session(bind=replica) if replica else Session()  # type: ignore[operator]
+
+	try:
+		yield session
+	except Exception as e:
+		if replica is not None and is_connection_error(e):
+			replica_router.eject(replica)
+		raise
+	finally:
+		await session.close()
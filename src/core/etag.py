@@ -0,0 +1,45 @@
+import hashlib
+from collections.abc import Iterable
+from datetime import datetime
+from typing import Annotated
+from uuid import UUID
+
+from fastapi import Header, Response, status
+
+# (id, updated_at) of an entity, enough to tell if it changed since a response was sent
+Version = tuple[UUID, datetime]
+
+IfNoneMatch = Annotated[
+	str | None,
+	Header(description='ETag of a previous response, answered with 304 when still current'),
+]
+
+
+def weak_etag(root: Version, children: Iterable[Version]) -> str:
+	"""
+	Weak ETag of a resource from the version of its root entity and of every child loaded with
+	it, so adding, updating or removing a child changes it too. Children are sorted, so it
+	doesn't depend on the order they were loaded in.
+	"""
+	digest = hashlib.blake2b(digest_size=16)
+
+	for id, updated_at in [root, *sorted(children)]:
+		digest.update(f'{id}:{updated_at.isoformat()};'.encode())
+
+	return f'W/"{digest.hexdigest()}"'
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+	"""Weak comparison (RFC 9110) of an `If-None-Match` header with the current ETag."""
+	if if_none_match.strip() == '*':
+		return True
+
+	opaque_tag = etag.removeprefix('W/')
+
+	return any(
+		candidate.strip().removeprefix('W/') == opaque_tag for candidate in if_none_match.split(',')
+	)
+
+
+def not_modified(etag: str) -> Response:
+	return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={'ETag': etag})
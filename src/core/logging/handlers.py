@@ -0,0 +1,59 @@
+import logging
+import queue
+from logging.handlers import QueueHandler
+from typing import Literal
+
+import structlog
+from prometheus_client import Counter
+
+LOG_RECORDS_DROPPED = Counter(
+	'log_records_dropped_total', 'Log records dropped because the log queue was full', ['level']
+)
+
+FullPolicy = Literal['drop', 'block']
+
+
+class BoundedQueueHandler(QueueHandler):
+	"""
+	Hand log records over to a `QueueListener` thread, which renders and writes them, so the
+	event loop never waits on JSON rendering or stdout. When the queue is full, records are
+	dropped and counted (`drop`), or the caller waits up to `block_timeout` seconds for room
+	before dropping them (`block`).
+	"""
+
+	def __init__(
+		self,
+		log_queue: 'queue.Queue[logging.LogRecord]',
+		full_policy: FullPolicy,
+		block_timeout: float,
+	) -> None:
+		super().__init__(log_queue)
+		self.full_policy = full_policy
+		self.block_timeout = block_timeout
+
+	def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+		"""
+		Records from structlog carry their event dict in `msg`, rendered by the listener's
+		`ProcessorFormatter`, so they're queued as they are. The message of records from other
+		libraries is formatted now, and the request context bound to this thread is copied as
+		record extras, since the listener thread doesn't see it.
+		"""
+		if isinstance(record.msg, dict):
+			return record
+
+		record.msg = record.getMessage()
+		record.args = None
+		for key, value in structlog.contextvars.get_contextvars().items():
+			if key not in record.__dict__:
+				setattr(record, key, value)
+
+		return record
+
+	def enqueue(self, record: logging.LogRecord) -> None:
+		try:
+			if self.full_policy == 'block':
+				self.queue.put(record, timeout=self.block_timeout)  # type: ignore[attr-defined]
+			else:
+				self.queue.put_nowait(record)
+		except queue.Full:
+			LOG_RECORDS_DROPPED.labels(level=record.levelname).inc()
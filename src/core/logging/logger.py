@@ -1,5 +1,8 @@
 # Based on https://wazaari.dev/blog/fastapi-structlog-integration#configure-the-logger
+import atexit
 import logging
+import logging.handlers
+import queue
 import re
 from typing import Any
 
@@ -8,6 +11,7 @@ from sqlmodel import SQLModel
 from structlog.types import EventDict, Processor
 
 from src.core.config import settings
+from src.core.logging.handlers import BoundedQueueHandler, FullPolicy
 
 
 def drop_color_message_key(logger: Any, method_name: str, event_dict: EventDict) -> EventDict:
@@ -19,11 +23,18 @@ def drop_color_message_key(logger: Any, method_name: str, event_dict: EventDict)
 	return event_dict
 
 
-def setup_logging(json_logs: bool = False, log_level: str = 'INFO') -> None:
+def setup_logging(
+	json_logs: bool = False,
+	log_level: str = 'INFO',
+	queue_size: int = 10_000,
+	full_policy: FullPolicy = 'drop',
+	block_timeout: float = 1,
+) -> None:
 	"""
 	Configure structlog with shared processors and formatters for Rafood API.
 	Uses JSON renderer for production (json_logs=True) or console renderer for development.
 	Reconfigures root logger to emit logs through structlog and handles uvicorn log propagation.
+	Logs are rendered and written by a background thread, reading them from a bounded queue.
 	"""
 	timestamper = structlog.processors.TimeStamper(fmt='iso')
 
@@ -73,11 +84,17 @@ def setup_logging(json_logs: bool = False, log_level: str = 'INFO') -> None:
 	)
 
 	# Reconfigure the root logger to use our structlog formatter, effectively emitting
-	# the logs via structlog
+	# the logs via structlog. Rendering and writing to stdout happen in the listener thread,
+	# stopped (writing what's left in the queue) when the process exits
 	handler = logging.StreamHandler()
 	handler.setFormatter(formatter)
+	log_queue: queue.Queue[logging.LogRecord] = queue.Queue(maxsize=queue_size)
+	listener = logging.handlers.QueueListener(log_queue, handler)
+	listener.start()
+	atexit.register(listener.stop)
+
 	root_logger = logging.getLogger()
-	root_logger.addHandler(handler)
+	root_logger.addHandler(BoundedQueueHandler(log_queue, full_policy, block_timeout))
 	root_logger.setLevel(log_level.upper())
 
 	for _log in ['uvicorn', 'uvicorn.error']:
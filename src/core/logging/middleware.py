@@ -1,5 +1,7 @@
 # Based on https://wazaari.dev/blog/fastapi-structlog-integration#logging-middleware
+import logging
 import time
+import zlib
 from typing import TypedDict
 
 import structlog
@@ -8,9 +10,12 @@ from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from uvicorn.protocols.utils import get_path_with_query_string
 
 from src.core.config import settings
+from src.core.timing import request_timings
 
 app_logger = structlog.stdlib.get_logger(settings.LOG_NAME)
 access_logger = structlog.stdlib.get_logger(settings.LOG_ACCESS_NAME)
+# The stdlib logger behind access_logger, caching if its level is enabled until levels change
+access_stdlib_logger = logging.getLogger(settings.LOG_ACCESS_NAME)
 
 
 class AccessInfo(TypedDict, total=False):
@@ -55,36 +60,85 @@ class StructLogMiddleware:
 			# Will be correctly logged and returned to caller
 			raise
 		finally:
+			# Access logs are often disabled (e.g. LOG_LEVEL=WARNING), so nothing is extracted
+			# from the scope unless the log is going to be emitted
 			process_time = time.perf_counter_ns() - info['start_time']
-			client_host, client_port = scope.get('client') or ('unknown', 0)
-			http_method = scope['method']
-			http_version = scope['http_version']
-			url = get_path_with_query_string(scope)  # type: ignore[arg-type]
-			headers = {k.decode().lower(): v.decode() for k, v in scope.get('headers', [])}
-			user_agent = headers.get('user-agent')
-			http_host = headers.get('host')
-			function_name = scope['endpoint'].__name__
-			route_name = scope['route'].name
-			path_params = scope['path_params'] if scope['path_params'] else None
-
-			# Recreate the Uvicorn access log format, but add all parameters as structured information
-			# Returning 420 (https://http.cat/status/420) if status_code is missing
-			access_logger.info(
-				f'Called - {http_method} {scope["path"]} | HTTP/{http_version} | {info.get("status_code", 420)} ',
-				http={
-					'url': str(url),
-					'status_code': info.get('status_code', 420),
-					'method': http_method,
-					'version': http_version,
-					'host': http_host,
-				},
-				network={'client': {'ip': client_host, 'port': client_port}},
-				details={
-					'function': function_name,
-					'name': route_name,
-					'path_params': path_params,
-				},
-				request_id=correlation_id.get(),
-				user_agent=user_agent,
-				duration=process_time,
-			)
+
+			if access_log_enabled() and should_log_access(info.get('status_code'), process_time):
+				log_access(scope, info, process_time)
+
+
+def access_log_enabled() -> bool:
+	return access_stdlib_logger.isEnabledFor(logging.INFO)
+
+
+def should_log_access(status_code: int | None, process_time: float) -> bool:
+	"""
+	Sample the access logs: errors (and requests that never responded) and requests slower than
+	LOG_ACCESS_SLOW_THRESHOLD_MS are always logged, and LOG_ACCESS_SAMPLE_RATE of the rest.
+	Sampling hashes the request id, so a request is either kept or dropped in every
+	instance that logs it.
+	"""
+	if status_code is None or status_code >= 400:
+		return True
+	if process_time >= settings.LOG_ACCESS_SLOW_THRESHOLD_MS * 1_000_000:
+		return True
+
+	request_id = correlation_id.get()
+	if request_id is None:
+		return True
+
+	return zlib.crc32(request_id.encode()) % 10_000 < settings.LOG_ACCESS_SAMPLE_RATE * 10_000
+
+
+def find_headers(scope: Scope) -> tuple[str | None, str | None]:
+	"""
+	Get the user agent and host headers in a single pass, without decoding the other ones.
+	ASGI servers send header names lowercased.
+	"""
+	user_agent = http_host = None
+
+	for key, value in scope.get('headers', []):
+		if key == b'user-agent':
+			user_agent = value.decode('latin-1')
+		elif key == b'host':
+			http_host = value.decode('latin-1')
+
+	return user_agent, http_host
+
+
+def log_access(scope: Scope, info: AccessInfo, process_time: float) -> None:
+	client_host, client_port = scope.get('client') or ('unknown', 0)
+	http_method = scope['method']
+	http_version = scope['http_version']
+	status_code = info.get('status_code', 420)
+	url = get_path_with_query_string(scope)  # type: ignore[arg-type]
+	user_agent, http_host = find_headers(scope)
+	function_name = scope['endpoint'].__name__
+	route_name = scope['route'].name
+	path_params = scope['path_params'] if scope['path_params'] else None
+	# Set by ServerTimingMiddleware, milliseconds spent on each phase of the request
+	timings = request_timings.get()
+
+	# Recreate the Uvicorn access log format, but add all parameters as structured information
+	# Returning 420 (https://http.cat/status/420) if status_code is missing
+	access_logger.info(
+		f'Called - {http_method} {scope["path"]} | HTTP/{http_version} | {status_code} ',
+		http={
+			'url': str(url),
+			'status_code': status_code,
+			'method': http_method,
+			'version': http_version,
+			'host': http_host,
+		},
+		network={'client': {'ip': client_host, 'port': client_port}},
+		details={
+			'function': function_name,
+			'name': route_name,
+			'path_params': path_params,
+		},
+		request_id=correlation_id.get(),
+		user_agent=user_agent,
+		duration=process_time,
+		timings=timings.as_milliseconds() if timings is not None else None,
+	)
@@ -0,0 +1,294 @@
+import asyncio
+import contextlib
+import functools
+import inspect
+import logging
+import time
+from collections.abc import Awaitable, Callable, Iterator
+from contextvars import ContextVar
+from typing import Any, ParamSpec, TypeVar
+
+from prometheus_client import REGISTRY, CollectorRegistry, Counter, Gauge, Histogram
+from prometheus_client.core import GaugeMetricFamily
+from prometheus_client.registry import Collector
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, ExceptionContext, ExecutionContext
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import (
+	AsyncAdaptedQueuePool,
+	ConnectionPoolEntry,
+	PoolProxiedConnection,
+	QueuePool,
+)
+
+from src.core.timing import RequestTimings, record, request_timings, timed
+
+P = ParamSpec('P')
+R = TypeVar('R')
+RepositoryType = TypeVar('RepositoryType', bound=type)
+
+# Statements are short, so buckets go from 1ms instead of the HTTP defaults
+QUERY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5)
+STATEMENT_KINDS = {'SELECT', 'INSERT', 'UPDATE', 'DELETE'}
+UNKNOWN_METHOD = 'unknown'
+# Phases spent waiting on the database, the rest of a repository method is ORM work
+DATABASE_PHASES = ('pool', 'db', 'commit')
+
+DB_STATEMENT_DURATION = Histogram(
+	'db_statement_duration_seconds',
+	'Time spent by the database driver on a statement, by repository method and statement kind',
+	['method', 'statement'],
+	buckets=QUERY_BUCKETS,
+)
+DB_STATEMENT_ROWS = Counter(
+	'db_statement_rows_total',
+	'Rows returned by statements, by repository method and statement kind',
+	['method', 'statement'],
+)
+DB_REPOSITORY_DURATION = Histogram(
+	'db_repository_method_duration_seconds',
+	'Time spent in a repository method, statements and ORM loading included',
+	['method'],
+	buckets=QUERY_BUCKETS,
+)
+
+repository_method: ContextVar[str] = ContextVar('repository_method', default=UNKNOWN_METHOD)
+
+
+class DatabasePoolCollector(Collector):
+	"""
+	Prometheus collector reading the engine connection pool usage on every scrape,
+	so the values are always current without hooking into checkout/checkin events.
+	"""
+
+	def __init__(self, engine: AsyncEngine) -> None:
+		self.engine = engine
+
+	def collect(self) -> Iterator[GaugeMetricFamily]:
+		pool = self.engine.pool
+		if not isinstance(pool, QueuePool):
+			return
+
+		yield GaugeMetricFamily(
+			'db_pool_size',
+			'Number of connections kept open by the database connection pool',
+			value=pool.size(),
+		)
+		yield GaugeMetricFamily(
+			'db_pool_connections_checked_out',
+			'Database connections currently in use by a request',
+			value=pool.checkedout(),
+		)
+		yield GaugeMetricFamily(
+			'db_pool_connections_idle',
+			'Database connections open and waiting in the pool',
+			value=pool.checkedin(),
+		)
+		# The overflow counter starts at -pool_size and only goes positive past the pool size
+		yield GaugeMetricFamily(
+			'db_pool_connections_overflow',
+			'Database connections opened beyond the pool size',
+			value=max(pool.overflow(), 0),
+		)
+
+
+class DatabasePoolGauges:
+	"""
+	Multiprocess mode counterpart of `DatabasePoolCollector`. The worker answering a scrape
+	can't read the pools of the other workers, so each worker writes its pool usage to gauges
+	every `interval_seconds`, and the scrape sums them across running workers.
+	"""
+
+	def __init__(
+		self,
+		engine: AsyncEngine,
+		interval_seconds: float,
+		registry: CollectorRegistry | None = None,
+	) -> None:
+		self.engine = engine
+		self.interval_seconds = interval_seconds
+		self._task: asyncio.Task[None] | None = None
+
+		# In multiprocess mode values are written to files, so gauges don't need a registry
+		self.size = Gauge(
+			'db_pool_size',
+			'Number of connections kept open by the database connection pool',
+			registry=registry,
+			multiprocess_mode='livesum',
+		)
+		self.checked_out = Gauge(
+			'db_pool_connections_checked_out',
+			'Database connections currently in use by a request',
+			registry=registry,
+			multiprocess_mode='livesum',
+		)
+		self.idle = Gauge(
+			'db_pool_connections_idle',
+			'Database connections open and waiting in the pool',
+			registry=registry,
+			multiprocess_mode='livesum',
+		)
+		self.overflow = Gauge(
+			'db_pool_connections_overflow',
+			'Database connections opened beyond the pool size',
+			registry=registry,
+			multiprocess_mode='livesum',
+		)
+
+	def refresh(self) -> None:
+		pool = self.engine.pool
+		if not isinstance(pool, QueuePool):
+			return
+
+		self.size.set(pool.size())
+		self.checked_out.set(pool.checkedout())
+		self.idle.set(pool.checkedin())
+		self.overflow.set(max(pool.overflow(), 0))
+
+	async def run(self) -> None:
+		while True:
+			self.refresh()
+			await asyncio.sleep(self.interval_seconds)
+
+	def start(self) -> None:
+		self._task = asyncio.create_task(self.run())
+
+	async def stop(self) -> None:
+		if self._task is None:
+			return
+
+		self._task.cancel()
+		with contextlib.suppress(asyncio.CancelledError):
+			await self._task
+
+		self._task = None
+
+
+def register_database_pool_metrics(engine: AsyncEngine) -> None:
+	REGISTRY.register(DatabasePoolCollector(engine))
+
+
+class TimedQueuePool(AsyncAdaptedQueuePool):
+	"""
+	Pool recording the time spent getting a connection as the `pool` phase of the request:
+	waiting for a free connection, the pre-ping and opening new connections.
+	"""
+
+	def connect(self) -> PoolProxiedConnection:
+		with timed('pool'):
+			return super().connect()
+
+
+# SQLAlchemy names pool loggers after the pool class, so this one isn't under the `sqlalchemy`
+# logger. It gets the same default level, otherwise pool dispose and recreate info messages
+# would show up in the app logs
+logging.getLogger(f'{TimedQueuePool.__module__}.{TimedQueuePool.__name__}').setLevel(
+	logging.WARNING
+)
+
+
+def statement_kind(statement: str) -> str:
+	words = statement.split(maxsplit=1)
+	kind = words[0].upper() if words else ''
+
+	return kind if kind in STATEMENT_KINDS else 'OTHER'
+
+
+def _database_time(timings: RequestTimings) -> float:
+	return sum(timings.get(phase) for phase in DATABASE_PHASES)
+
+
+def _track_method(name: str, method: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]:
+	@functools.wraps(method)
+	async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+		# Methods called by another repository method are part of its time
+		outermost = repository_method.get() == UNKNOWN_METHOD
+		timings = request_timings.get()
+		database_before = _database_time(timings) if timings is not None else 0
+		token = repository_method.set(name)
+		start = time.perf_counter()
+		try:
+			return await method(*args, **kwargs)
+		finally:
+			duration = time.perf_counter() - start
+			DB_REPOSITORY_DURATION.labels(method=name).observe(duration)
+			repository_method.reset(token)
+			# What isn't spent waiting on the database is mostly spent building ORM objects
+			if outermost and timings is not None:
+				timings.add('orm', duration - (_database_time(timings) - database_before))
+
+	return wrapper
+
+
+def track_repository(cls: RepositoryType) -> RepositoryType:
+	"""
+	Class decorator timing the public async methods of a repository, and labelling the
+	statements they run (`db_statement_duration_seconds`) with `RepositoryClass.method`.
+	"""
+	for name, method in list(vars(cls).items()):
+		if not name.startswith('_') and inspect.iscoroutinefunction(method):
+			setattr(cls, name, _track_method(f'{cls.__name__}.{name}', method))
+
+	return cls
+
+
+def _before_cursor_execute(
+	conn: Connection,
+	cursor: Any,
+	statement: str,
+	parameters: Any,
+	context: ExecutionContext,
+	executemany: bool,
+) -> None:
+	conn.info.setdefault('statement_start', []).append(time.perf_counter())
+
+
+def _after_cursor_execute(
+	conn: Connection,
+	cursor: Any,
+	statement: str,
+	parameters: Any,
+	context: ExecutionContext,
+	executemany: bool,
+) -> None:
+	duration = time.perf_counter() - conn.info['statement_start'].pop()
+	labels = {'method': repository_method.get(), 'statement': statement_kind(statement)}
+
+	DB_STATEMENT_DURATION.labels(**labels).observe(duration)
+	record('db', duration)
+	# rowcount is the number of rows fetched for statements returning rows
+	if cursor.description is not None and cursor.rowcount > 0:
+		DB_STATEMENT_ROWS.labels(**labels).inc(cursor.rowcount)
+
+
+def _handle_error(context: ExceptionContext) -> None:
+	# A failed statement never reaches after_cursor_execute, so its start time is dropped here
+	if context.connection is not None:
+		starts = context.connection.info.get('statement_start')
+		if starts:
+			starts.pop()
+
+
+def _end_transaction(conn: Connection) -> None:
+	conn.info['transaction_end'] = time.perf_counter()
+
+
+def _checkin(dbapi_connection: Any, connection_record: ConnectionPoolEntry) -> None:
+	# COMMIT (or ROLLBACK) is sent by the driver, not as a statement, until the connection is back
+	start = connection_record.info.pop('transaction_end', None)
+	if start is not None:
+		record('commit', time.perf_counter() - start)
+
+
+def register_query_metrics(engine: AsyncEngine) -> None:
+	"""
+	Time every statement sent by the engine, with the repository method running it, and the
+	end of its transactions (`commit` phase).
+	"""
+	sync_engine = engine.sync_engine
+	event.listen(sync_engine, 'before_cursor_execute', _before_cursor_execute)
+	event.listen(sync_engine, 'after_cursor_execute', _after_cursor_execute)
+	event.listen(sync_engine, 'handle_error', _handle_error)
+	event.listen(sync_engine, 'commit', _end_transaction)
+	event.listen(sync_engine, 'rollback', _end_transaction)
+	event.listen(sync_engine, 'checkin', _checkin)
@@ -0,0 +1,107 @@
+import asyncio
+import contextlib
+import sys
+import threading
+import time
+import traceback
+
+from prometheus_client import Histogram
+
+from src.core.logging.logger import StructLogger
+
+logger = StructLogger()
+
+# A healthy loop wakes up within a millisecond, anything past 100ms is felt by every request
+LAG_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5)
+
+EVENT_LOOP_LAG = Histogram(
+	'event_loop_lag_seconds',
+	'Delay of the event loop in running a callback past its scheduled time',
+	buckets=LAG_BUCKETS,
+)
+
+
+class EventLoopMonitor:
+	"""
+	Measure the event loop lag with a task sleeping `interval_seconds` and observing how late
+	it wakes up: while a callback runs CPU work (or a blocking call), nothing else is scheduled.
+
+	With `blocking_detection`, a watchdog thread also checks that the task keeps waking up, and
+	logs the stack of the event loop thread when it's `blocking_threshold_seconds` late, which
+	is the code blocking the loop at that moment.
+	"""
+
+	def __init__(
+		self,
+		interval_seconds: float,
+		blocking_detection: bool,
+		blocking_threshold_seconds: float,
+	) -> None:
+		self.interval_seconds = interval_seconds
+		self.blocking_detection = blocking_detection
+		self.blocking_threshold_seconds = blocking_threshold_seconds
+		self._task: asyncio.Task[None] | None = None
+		self._watchdog: threading.Thread | None = None
+		self._stopped = threading.Event()
+		self._loop_thread_id = 0
+		# Monotonic time the task is expected to wake up at, read by the watchdog thread
+		self._next_wakeup = 0.0
+
+	async def run(self) -> None:
+		while True:
+			start = time.monotonic()
+			self._next_wakeup = start + self.interval_seconds
+			await asyncio.sleep(self.interval_seconds)
+
+			lag = time.monotonic() - start - self.interval_seconds
+			EVENT_LOOP_LAG.observe(max(lag, 0))
+
+	def watch(self) -> None:
+		"""Log the loop stack once per blocking episode, until the task wakes up again."""
+		reported_wakeup = 0.0
+		check_interval = max(self.blocking_threshold_seconds / 2, 0.005)
+
+		while not self._stopped.wait(check_interval):
+			next_wakeup = self._next_wakeup
+			blocked_for = time.monotonic() - next_wakeup
+			if blocked_for < self.blocking_threshold_seconds or reported_wakeup == next_wakeup:
+				continue
+
+			reported_wakeup = next_wakeup
+			frame = sys._current_frames().get(self._loop_thread_id)
+			if frame is None:
+				return
+
+			logger.warning(
+				'Event loop blocked',
+				blocked_ms=round(blocked_for * 1000),
+				stack=''.join(traceback.format_stack(frame)),
+			)
+			del frame
+
+	def start(self) -> None:
+		self._loop_thread_id = threading.get_ident()
+		self._next_wakeup = time.monotonic() + self.interval_seconds
+		self._task = asyncio.create_task(self.run())
+
+		if self.blocking_detection:
+			self._stopped.clear()
+			self._watchdog = threading.Thread(
+				target=self.watch, name='event-loop-watchdog', daemon=True
+			)
+			self._watchdog.start()
+
+	async def stop(self) -> None:
+		if self._watchdog is not None:
+			self._stopped.set()
+			self._watchdog.join()
+			self._watchdog = None
+
+		if self._task is None:
+			return
+
+		self._task.cancel()
+		with contextlib.suppress(asyncio.CancelledError):
+			await self._task
+
+		self._task = None
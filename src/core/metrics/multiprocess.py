@@ -0,0 +1,72 @@
+"""
+Prometheus multiprocess mode, for running the API with several worker processes.
+
+When `PROMETHEUS_MULTIPROC_DIR` is set, every worker writes its metrics to files in that
+directory and `/metrics` sums the files of all workers (`prometheus-fastapi-instrumentator`
+reads them with a `MultiProcessCollector`), whichever worker answers the scrape.
+
+The directory must be emptied before the workers start, so counters don't carry over values
+from a previous run:
+
+	PROMETHEUS_MULTIPROC_DIR=/tmp/metrics poetry run python -m src.core.metrics.multiprocess
+"""
+
+import glob
+import os
+import re
+
+from prometheus_client import multiprocess
+
+MULTIPROC_DIR_ENV = 'PROMETHEUS_MULTIPROC_DIR'
+
+# Live gauges (e.g. `gauge_livesum_1234.db`) are only summed across running workers
+LIVE_GAUGE_FILE = re.compile(r'gauge_live\w+?_(?P<pid>\d+)\.db$')
+
+
+def multiprocess_dir() -> str | None:
+	return os.environ.get(MULTIPROC_DIR_ENV)
+
+
+def prepare_multiprocess_dir(path: str) -> None:
+	"""Create the metrics directory, removing the files left by a previous run."""
+	os.makedirs(path, exist_ok=True)
+	for file in glob.glob(os.path.join(path, '*.db')):
+		os.remove(file)
+
+
+def is_alive(pid: int) -> bool:
+	try:
+		os.kill(pid, 0)
+	except ProcessLookupError:
+		return False
+	except PermissionError:
+		return True
+
+	return True
+
+
+def remove_dead_workers(path: str) -> list[int]:
+	"""
+	Remove the live gauges of workers which died without shutting down (killed, out of memory),
+	so they aren't summed anymore. Counters and histograms of dead workers are kept, otherwise
+	the totals would go backwards.
+	"""
+	pids = set()
+	for file in glob.glob(os.path.join(path, 'gauge_live*.db')):
+		match = LIVE_GAUGE_FILE.search(file)
+		if match:
+			pids.add(int(match['pid']))
+
+	dead = sorted(pid for pid in pids if not is_alive(pid))
+	for pid in dead:
+		multiprocess.mark_process_dead(pid, path)
+
+	return dead
+
+
+if __name__ == '__main__':
+	path = multiprocess_dir()
+	if path is None:
+		raise SystemExit(f'{MULTIPROC_DIR_ENV} is not set')
+
+	prepare_multiprocess_dir(path)
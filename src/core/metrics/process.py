@@ -0,0 +1,60 @@
+import asyncio
+import contextlib
+
+from prometheus_client import CollectorRegistry, Gauge, ProcessCollector
+
+# Samples of `ProcessCollector`, written by every worker in multiprocess mode
+PROCESS_METRICS = {
+	'process_cpu_seconds_total': 'Total user and system CPU time spent in seconds',
+	'process_resident_memory_bytes': 'Resident memory size in bytes',
+	'process_virtual_memory_bytes': 'Virtual memory size in bytes',
+	'process_open_fds': 'Number of open file descriptors',
+	'process_max_fds': 'Maximum number of open file descriptors',
+	'process_start_time_seconds': 'Start time of the process since unix epoch in seconds',
+}
+
+
+class ProcessGauges:
+	"""
+	Multiprocess mode counterpart of the `process_*` metrics of `prometheus_client`, which the
+	multiprocess `/metrics` doesn't collect (they would only describe the worker answering the
+	scrape). Each worker writes its own to gauges every `interval_seconds`, labelled with its
+	`pid`, and the scrape returns those of the running workers.
+	"""
+
+	def __init__(self, interval_seconds: float, registry: CollectorRegistry | None = None) -> None:
+		self.interval_seconds = interval_seconds
+		self._collector = ProcessCollector(registry=None)
+		self._task: asyncio.Task[None] | None = None
+
+		# In multiprocess mode values are written to files, so gauges don't need a registry
+		self.gauges = {
+			name: Gauge(name, documentation, registry=registry, multiprocess_mode='liveall')
+			for name, documentation in PROCESS_METRICS.items()
+		}
+
+	def refresh(self) -> None:
+		# Nothing is collected without /proc (e.g. macOS)
+		for metric in self._collector.collect():
+			for sample in metric.samples:
+				gauge = self.gauges.get(sample.name)
+				if gauge is not None:
+					gauge.set(sample.value)
+
+	async def run(self) -> None:
+		while True:
+			self.refresh()
+			await asyncio.sleep(self.interval_seconds)
+
+	def start(self) -> None:
+		self._task = asyncio.create_task(self.run())
+
+	async def stop(self) -> None:
+		if self._task is None:
+			return
+
+		self._task.cancel()
+		with contextlib.suppress(asyncio.CancelledError):
+			await self._task
+
+		self._task = None
@@ -0,0 +1,38 @@
+import base64
+import binascii
+from datetime import datetime
+from uuid import UUID
+
+from src.exceptions import AppBadRequestError
+
+CURSOR_SEPARATOR = '|'
+
+
+class InvalidCursorError(AppBadRequestError):
+	def __init__(self, cursor: str):
+		super().__init__(
+			message=f'Invalid pagination cursor {cursor}',
+			error_code='invalid_cursor',
+		)
+
+
+def encode_cursor(created_at: datetime, id: UUID) -> str:
+	"""
+	Build an opaque keyset cursor from the last row of a page.
+	The cursor is the URL-safe base64 of `created_at|id` without padding.
+	"""
+	raw = f'{created_at.isoformat()}{CURSOR_SEPARATOR}{id}'.encode()
+
+	return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+	"""Decode a cursor built by `encode_cursor` back to its `(created_at, id)` keyset."""
+	try:
+		padded = cursor + '=' * (-len(cursor) % 4)
+		raw = base64.urlsafe_b64decode(padded.encode()).decode()
+		created_at, id = raw.split(CURSOR_SEPARATOR)
+
+		return datetime.fromisoformat(created_at), UUID(id)
+	except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+		raise InvalidCursorError(cursor=cursor) from e
@@ -0,0 +1,85 @@
+import time
+from collections.abc import Callable
+
+from fastapi import Request
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.core.config import settings
+from src.core.logging.logger import StructLogger
+
+logger = StructLogger()
+
+FALSY_VALUES = {'', '0', 'false', 'no'}
+
+
+class ReplicaRouter:
+	"""
+	Pick a read replica engine with round-robin, skipping the ones ejected after a connection
+	failure until their cooldown ends. Returns None when there are no healthy replicas, so
+	callers fall back to the primary.
+	"""
+
+	def __init__(
+		self,
+		engines: list[AsyncEngine],
+		ejection_seconds: float,
+		clock: Callable[[], float] = time.monotonic,
+	) -> None:
+		self.engines = engines
+		self.ejection_seconds = ejection_seconds
+		self.clock = clock
+		self._next = 0
+		self._ejected_until: dict[int, float] = {}
+
+	def choose(self) -> AsyncEngine | None:
+		now = self.clock()
+
+		for _ in range(len(self.engines)):
+			index = self._next
+			self._next = (self._next + 1) % len(self.engines)
+
+			if self._ejected_until.get(index, 0) <= now:
+				return self.engines[index]
+
+		return None
+
+	def eject(self, engine: AsyncEngine) -> None:
+		index = self.engines.index(engine)
+		self._ejected_until[index] = self.clock() + self.ejection_seconds
+
+		logger.warning(
+			'Read replica ejected after a connection failure',
+			replica=engine.url.render_as_string(hide_password=True),
+			ejection_seconds=self.ejection_seconds,
+		)
+
+
+def is_connection_error(error: BaseException) -> bool:
+	"""
+	Tell if an error, or any error it was raised from, means the database couldn't be reached.
+	Services wrap database errors in app errors, so the whole chain is checked.
+	"""
+	current: BaseException | None = error
+
+	while current is not None:
+		if isinstance(current, OSError):
+			return True
+		if isinstance(current, DBAPIError) and current.connection_invalidated:
+			return True
+
+		current = current.__cause__ or current.__context__
+
+	return False
+
+
+def reads_from_primary(request: Request) -> bool:
+	"""
+	Requests that must see their own writes (replicas may lag behind the primary) are marked
+	by the client with a header or a cookie.
+	"""
+	value = request.headers.get(settings.DB_READ_PRIMARY_HEADER_NAME)
+	if value is None:
+		value = request.cookies.get(settings.DB_READ_PRIMARY_COOKIE_NAME)
+
+	return value is not None and value.strip().lower() not in FALSY_VALUES
@@ -0,0 +1,22 @@
+from typing import Any
+
+from fastapi import Response
+from pydantic_core import to_json
+
+from src.core.timing import timed
+
+
+class ModelResponse(Response):
+	"""
+	JSON response rendered by pydantic-core instead of the stdlib json encoder.
+	Models are serialized with their own compiled serializers, so routes returning an
+	already validated schema wrapped in a `ModelResponse` skip FastAPI's `response_model`
+	validation and `jsonable_encoder` passes. The route `response_model` is still used for
+	the OpenAPI docs.
+	"""
+
+	media_type = 'application/json'
+
+	def render(self, content: Any) -> bytes:
+		with timed('render'):
+			return to_json(content)
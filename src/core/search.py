@@ -0,0 +1,23 @@
+from typing import Any
+
+from sqlalchemy import ColumnElement
+
+LIKE_ESCAPE_CHAR = '\\'
+
+
+def escape_like(value: str) -> str:
+	"""Escape LIKE wildcards so user input is always matched literally."""
+	return (
+		value.replace(LIKE_ESCAPE_CHAR, LIKE_ESCAPE_CHAR * 2)
+		.replace('%', f'{LIKE_ESCAPE_CHAR}%')
+		.replace('_', f'{LIKE_ESCAPE_CHAR}_')
+	)
+
+
+def icontains(column: Any, value: str) -> ColumnElement[bool]:
+	"""
+	Case-insensitive substring match as `column ILIKE '%value%'`.
+	Unlike `lower(column) LIKE ...`, a plain ILIKE can be served by a pg_trgm GIN index
+	built with `gin_trgm_ops` on the column itself.
+	"""
+	return column.ilike(f'%{escape_like(value)}%', escape=LIKE_ESCAPE_CHAR)
@@ -0,0 +1,86 @@
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class RequestTimings:
+	"""
+	Time spent by a request in each phase (connections, statements, commits, ORM loading,
+	validation, rendering), fed by the database hooks, repositories, services and responses
+	while the request is handled.
+	"""
+
+	def __init__(self) -> None:
+		self.phases: dict[str, float] = {}
+
+	def add(self, phase: str, seconds: float) -> None:
+		self.phases[phase] = self.phases.get(phase, 0) + seconds
+
+	def get(self, phase: str) -> float:
+		return self.phases.get(phase, 0)
+
+	def as_milliseconds(self) -> dict[str, float]:
+		return {phase: round(seconds * 1000, 2) for phase, seconds in self.phases.items()}
+
+	def server_timing(self, total: float) -> str:
+		"""Format the phases as a `Server-Timing` header, durations in milliseconds."""
+		metrics = [
+			f'{phase};dur={milliseconds}' for phase, milliseconds in self.as_milliseconds().items()
+		]
+		metrics.append(f'total;dur={round(total * 1000, 2)}')
+
+		return ', '.join(metrics)
+
+
+request_timings: ContextVar[RequestTimings | None] = ContextVar('request_timings', default=None)
+
+
+def record(phase: str, seconds: float) -> None:
+	"""Add time to a phase of the current request, if any (e.g. not on startup checks)."""
+	timings = request_timings.get()
+	if timings is not None:
+		timings.add(phase, seconds)
+
+
+@contextmanager
+def timed(phase: str) -> Iterator[None]:
+	start = time.perf_counter()
+	try:
+		yield
+	finally:
+		record(phase, time.perf_counter() - start)
+
+
+class ServerTimingMiddleware:
+	"""
+	Collect the phase timings of every request, for the access log, and send them to the
+	client as a `Server-Timing` header (shown by browser dev tools) when `header_enabled`.
+	"""
+
+	def __init__(self, app: ASGIApp, header_enabled: bool) -> None:
+		self.app = app
+		self.header_enabled = header_enabled
+
+	async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+		if scope['type'] != 'http':
+			await self.app(scope, receive, send)
+			return
+
+		timings = RequestTimings()
+		token = request_timings.set(timings)
+		start = time.perf_counter()
+
+		async def send_with_timings(message: Message) -> None:
+			if message['type'] == 'http.response.start' and self.header_enabled:
+				headers = MutableHeaders(scope=message)
+				headers.append('Server-Timing', timings.server_timing(time.perf_counter() - start))
+			await send(message)
+
+		try:
+			await self.app(scope, receive, send_with_timings)
+		finally:
+			request_timings.reset(token)
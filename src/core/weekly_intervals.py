@@ -0,0 +1,63 @@
+from datetime import datetime, time, timedelta
+
+from src.enums import Day
+
+MINUTES_PER_DAY = 24 * 60
+MINUTES_PER_WEEK = 7 * MINUTES_PER_DAY
+WEEK = list(Day)
+
+
+def minute_of_week(moment: datetime) -> int:
+	"""Minutes since Monday 00:00 for the wall clock time of the given moment."""
+	return moment.weekday() * MINUTES_PER_DAY + moment.hour * 60 + moment.minute
+
+
+def _daily_span(start_time: time, end_time: time) -> tuple[int, int]:
+	"""
+	Start minute of the day and duration of a span. An end time that isn't after the start time
+	means the span runs overnight into the next day, and equal times mean a whole day.
+	"""
+	start = start_time.hour * 60 + start_time.minute
+	# Rounding the end up keeps a span ending at 23:59:59 open until midnight
+	end = end_time.hour * 60 + end_time.minute + (1 if end_time.second else 0)
+
+	return start, end - start if end > start else end - start + MINUTES_PER_DAY
+
+
+def weekly_intervals(
+	start_day: Day, end_day: Day, start_time: time, end_time: time
+) -> list[tuple[int, int]]:
+	"""
+	Normalize a schedule into half-open [start, end) minute of week ranges, one for each day
+	from `start_day` to `end_day` (wrapping around the week, e.g. friday to monday).
+	Spans crossing Sunday midnight are split in two, so every range fits in the week.
+	"""
+	start, duration = _daily_span(start_time, end_time)
+
+	first_day = WEEK.index(start_day)
+	days_count = (WEEK.index(end_day) - first_day) % 7 + 1
+
+	intervals = []
+	for offset in range(days_count):
+		span_start = (first_day + offset) % 7 * MINUTES_PER_DAY + start
+		span_end = span_start + duration
+
+		intervals.append((span_start, min(span_end, MINUTES_PER_WEEK)))
+		if span_end > MINUTES_PER_WEEK:
+			intervals.append((0, span_end - MINUTES_PER_WEEK))
+
+	return intervals
+
+
+def next_occurrence_end(day: Day, start_time: time, end_time: time, after: datetime) -> datetime:
+	"""End of the first occurrence of a weekly span that is still running or yet to start."""
+	start, duration = _daily_span(start_time, end_time)
+	week_start = datetime.combine(after.date() - timedelta(days=after.weekday()), time())
+	span_end = WEEK.index(day) * MINUTES_PER_DAY + start + duration
+
+	# Starting from last week, since an overnight span started last Sunday may still be running
+	end = week_start + timedelta(minutes=span_end - MINUTES_PER_WEEK)
+	while end <= after:
+		end += timedelta(weeks=1)
+
+	return end
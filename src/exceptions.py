@@ -1,5 +1,8 @@
 NOT_FOUND_ERROR = 'Not Found Error'
+BAD_REQUEST_ERROR = 'Bad Request Error'
 INTERNAL_SERVER_ERROR = 'Internal Server Error'
+UNAUTHORIZED_ERROR = 'Unauthorized Error'
+CONFLICT_ERROR = 'Conflict Error'
 
 
 class AppError(Exception):
@@ -23,6 +26,15 @@ class AppNotFoundError(AppError):
 		)
 
 
+class AppBadRequestError(AppError):
+	"""Base class for all bad request exceptions."""
+
+	def __init__(self, message: str, error_code: str):
+		super().__init__(
+			title=BAD_REQUEST_ERROR, message=message, error_code=error_code, status_code=400
+		)
+
+
 class AppInternalServerError(AppError):
 	"""Base class for all internal server error exceptions."""
 
@@ -30,3 +42,21 @@ class AppInternalServerError(AppError):
 		super().__init__(
 			title=INTERNAL_SERVER_ERROR, message=message, error_code=error_code, status_code=500
 		)
+
+
+class AppUnauthorizedError(AppError):
+	"""Base class for all unauthorized exceptions."""
+
+	def __init__(self, message: str, error_code: str):
+		super().__init__(
+			title=UNAUTHORIZED_ERROR, message=message, error_code=error_code, status_code=401
+		)
+
+
+class AppConflictError(AppError):
+	"""Base class for all conflict exceptions."""
+
+	def __init__(self, message: str, error_code: str):
+		super().__init__(
+			title=CONFLICT_ERROR, message=message, error_code=error_code, status_code=409
+		)
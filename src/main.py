@@ -1,17 +1,79 @@
+import os
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from asgi_correlation_id import CorrelationIdMiddleware
 from fastapi import FastAPI
+from prometheus_client import multiprocess
 from prometheus_fastapi_instrumentator import Instrumentator
 
 from src.api import api_router
+from src.categories.deps import categories_cache
+from src.categories.models import Category
+from src.core.cache_invalidation import CacheInvalidationListener
+from src.core.compression import CompressionMiddleware
 from src.core.config import settings
+from src.core.database import connect_primary, engine, replica_router
+from src.core.db_checks import warn_unindexed_foreign_keys
 from src.core.exception_handlers import register_exception_handlers
 from src.core.logging.logger import setup_logging
 from src.core.logging.middleware import StructLogMiddleware
+from src.core.metrics.database import (
+	DatabasePoolGauges,
+	register_database_pool_metrics,
+	register_query_metrics,
+)
+from src.core.metrics.event_loop import EventLoopMonitor
+from src.core.metrics.multiprocess import multiprocess_dir, remove_dead_workers
+from src.core.metrics.process import ProcessGauges
+from src.core.responses import ModelResponse
+from src.core.timing import ServerTimingMiddleware
+
+cache_invalidation = CacheInvalidationListener(
+	connect=connect_primary, retry_seconds=settings.CACHE_INVALIDATION_RETRY_SECONDS
+)
+cache_invalidation.register(Category.__tablename__, categories_cache)
+database_pool_gauges = DatabasePoolGauges(
+	engine, interval_seconds=settings.DB_POOL_METRICS_INTERVAL_SECONDS
+)
+process_gauges = ProcessGauges(interval_seconds=settings.PROCESS_METRICS_INTERVAL_SECONDS)
+event_loop_monitor = EventLoopMonitor(
+	interval_seconds=settings.EVENT_LOOP_LAG_INTERVAL_SECONDS,
+	blocking_detection=settings.EVENT_LOOP_BLOCKING_DETECTION,
+	blocking_threshold_seconds=settings.EVENT_LOOP_BLOCKING_THRESHOLD_MS / 1000,
+)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+	if settings.DB_CHECK_FK_INDEXES:
+		await warn_unindexed_foreign_keys(engine)
+	if settings.CACHE_INVALIDATION_ENABLED:
+		cache_invalidation.start()
+	event_loop_monitor.start()
+	# With several workers, metrics are shared through files (see src/core/metrics/multiprocess.py)
+	metrics_dir = multiprocess_dir()
+	if metrics_dir is not None:
+		remove_dead_workers(metrics_dir)
+		database_pool_gauges.start()
+		process_gauges.start()
+
+	yield
+
+	await cache_invalidation.stop()
+	await event_loop_monitor.stop()
+	await database_pool_gauges.stop()
+	await process_gauges.stop()
+	if metrics_dir is not None:
+		multiprocess.mark_process_dead(os.getpid(), metrics_dir)
+
 
 app = FastAPI(
 	title=settings.APP_NAME,
 	description=settings.APP_DESCRIPTION,
 	version=settings.APP_VERSION,
+	lifespan=lifespan,
+	default_response_class=ModelResponse,
 )
 
 Instrumentator(
@@ -23,13 +85,32 @@ Instrumentator(
 	endpoint='/metrics',
 	include_in_schema=False,
 )
+register_database_pool_metrics(engine)
+for query_engine in [engine, *replica_router.engines]:
+	register_query_metrics(query_engine)
 
-setup_logging(json_logs=settings.LOG_JSON_FORMAT, log_level=settings.LOG_LEVEL)
+setup_logging(
+	json_logs=settings.LOG_JSON_FORMAT,
+	log_level=settings.LOG_LEVEL,
+	queue_size=settings.LOG_QUEUE_SIZE,
+	full_policy=settings.LOG_QUEUE_FULL_POLICY,
+	block_timeout=settings.LOG_QUEUE_BLOCK_TIMEOUT,
+)
 register_exception_handlers(app)
 
 app.include_router(api_router, prefix=settings.APP_V1_PREFIX)
 
+app.add_middleware(
+	CompressionMiddleware,
+	minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+	gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+	brotli_quality=settings.COMPRESSION_BROTLI_QUALITY,
+	thread_minimum_size=settings.COMPRESSION_THREAD_MINIMUM_SIZE,
+	cache_ttl_seconds=settings.COMPRESSION_CACHE_TTL_SECONDS,
+	cache_max_size=settings.COMPRESSION_CACHE_MAX_SIZE,
+)
 app.add_middleware(StructLogMiddleware)
+app.add_middleware(ServerTimingMiddleware, header_enabled=settings.SERVER_TIMING_HEADER_ENABLED)
 app.add_middleware(CorrelationIdMiddleware, header_name=settings.LOGS_CORRELATION_HEADER_NAME)
 
 
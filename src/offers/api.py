@@ -1,8 +1,10 @@
+from datetime import datetime
 from uuid import UUID
 
-from fastapi import APIRouter, status
+from fastapi import APIRouter, Query, status
 
-from src.offers.deps import OfferScheduleServiceDeps, OfferServiceDeps
+from src.core.responses import ModelResponse
+from src.offers.deps import OfferReadServiceDeps, OfferScheduleServiceDeps, OfferServiceDeps
 from src.offers.schemas import (
 	CreateOfferResponseSchema,
 	CreateOfferScheduleResponseSchema,
@@ -24,8 +26,24 @@ router = APIRouter()
 	status_code=status.HTTP_200_OK,
 	response_model=list[OfferSchema],
 )
-async def list_offers(service: OfferServiceDeps) -> list[OfferSchema]:
-	return await service.list()
+async def list_offers(service: OfferReadServiceDeps) -> ModelResponse:
+	return ModelResponse(await service.list())
+
+
+@router.get(
+	'/live',
+	name='List live offers',
+	status_code=status.HTTP_200_OK,
+	description='Get active offers available at a moment (now by default)',
+	response_model=list[OfferSchema],
+)
+async def list_live_offers(
+	service: OfferReadServiceDeps,
+	at: datetime | None = Query(
+		default=None, description='Wall clock time to check, e.g. 2026-01-30T22:30:00'
+	),
+) -> ModelResponse:
+	return ModelResponse(await service.list_live(at))
 
 
 @router.get(
@@ -34,8 +52,8 @@ async def list_offers(service: OfferServiceDeps) -> list[OfferSchema]:
 	status_code=status.HTTP_200_OK,
 	response_model=OfferWithSchedulesSchema,
 )
-async def find_offer(id: UUID, service: OfferServiceDeps) -> OfferWithSchedulesSchema:
-	return await service.get(id)
+async def find_offer(id: UUID, service: OfferReadServiceDeps) -> ModelResponse:
+	return ModelResponse(await service.get(id))
 
 
 @router.post(
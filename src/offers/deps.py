@@ -3,7 +3,7 @@ from typing import Annotated
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.core.deps import get_session
+from src.core.deps import get_read_session, get_session
 from src.offers.repository import OfferRepository, OfferScheduleRepository
 from src.offers.service import OfferScheduleService, OfferService
 
@@ -23,6 +23,22 @@ def get_offer_service(
 OfferServiceDeps = Annotated[OfferService, Depends(get_offer_service)]
 
 
+def get_offer_read_repository(
+	db: AsyncSession = Depends(get_read_session),
+) -> OfferRepository:
+	return OfferRepository(db)
+
+
+def get_offer_read_service(
+	repository: OfferRepository = Depends(get_offer_read_repository),
+) -> OfferService:
+	return OfferService(repository)
+
+
+# Read-only routes may be served by a read replica
+OfferReadServiceDeps = Annotated[OfferService, Depends(get_offer_read_service)]
+
+
 def get_offer_schedule_repository(
 	db: AsyncSession = Depends(get_session),
 ) -> OfferScheduleRepository:
@@ -3,6 +3,7 @@ from datetime import datetime, time
 from typing import Optional
 from uuid import UUID, uuid4
 
+from sqlalchemy import Index, func, text
 from sqlmodel import Field, Relationship, SQLModel
 
 
@@ -10,7 +11,7 @@ class Offer(SQLModel, table=True):
 	__tablename__ = 'offers'
 
 	id: UUID = Field(default_factory=uuid4, primary_key=True)
-	product_id: UUID = Field(foreign_key='products.id')
+	product_id: UUID = Field(foreign_key='products.id', index=True)
 	price: float
 	active: bool = Field(default=True)
 	created_at: datetime = Field(default_factory=datetime.now)
@@ -28,7 +29,7 @@ class OfferSchedule(SQLModel, table=True):
 	__tablename__ = 'offer_schedules'
 
 	id: UUID = Field(default_factory=uuid4, primary_key=True)
-	offer_id: UUID = Field(foreign_key='offers.id')
+	offer_id: UUID = Field(foreign_key='offers.id', index=True)
 	day: str = Field(max_length=10)
 	start_time: time
 	end_time: time
@@ -39,3 +40,29 @@ class OfferSchedule(SQLModel, table=True):
 	)
 
 	offer: Optional['Offer'] = Relationship(back_populates='schedules')
+
+
+# Weekly availability of offers, used to find live offers in SQL. Each row is a half-open
+# [start_minute, end_minute) range of minutes since Monday 00:00, rebuilt by the schedules
+# repository whenever a schedule changes. Schedules that don't repeat expire after their next
+# occurrence, while repeating ones never expire
+class OfferAvailabilityInterval(SQLModel, table=True):
+	__tablename__ = 'offer_availability_intervals'
+	# GiST index on the range serves "live at minute M" lookups (`range @> M`)
+	__table_args__ = (
+		Index(
+			'ix_offer_availability_intervals_minutes',
+			func.int4range(text('start_minute'), text('end_minute')),
+			postgresql_using='gist',
+		),
+	)
+
+	id: UUID = Field(default_factory=uuid4, primary_key=True)
+	offer_id: UUID = Field(foreign_key='offers.id', index=True)
+	schedule_id: UUID = Field(foreign_key='offer_schedules.id', ondelete='CASCADE', index=True)
+	start_minute: int
+	end_minute: int
+	expires_at: datetime | None = Field(default=None)
+
+	# Makes the unit of work insert a new schedule before its intervals
+	schedule: Optional['OfferSchedule'] = Relationship()
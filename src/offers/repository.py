@@ -1,28 +1,67 @@
-from datetime import datetime
+from datetime import datetime, timedelta
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import delete, func, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.metrics.database import track_repository
+from src.core.weekly_intervals import minute_of_week, next_occurrence_end, weekly_intervals
 from src.offers.exceptions import OfferNotFoundError, OfferScheduleNotFoundError
-from src.offers.models import Offer, OfferSchedule
-from src.offers.schemas import CreateOfferScheduleSchema, CreateOfferSchema
+from src.offers.models import Offer, OfferAvailabilityInterval, OfferSchedule
+from src.offers.schemas import (
+	CreateOfferScheduleSchema,
+	CreateOfferSchema,
+	UpdateOfferScheduleSchema,
+	UpdateOfferSchema,
+)
 
 
+@track_repository
 class OfferRepository:
 	db: AsyncSession
 
 	def __init__(self, db: AsyncSession):
 		self.db = db
 
+	async def list_live(self, at: datetime) -> list[Offer]:
+		"""
+		List active offers available at the given moment, found by its minute of week on the
+		availability intervals instead of evaluating every schedule. Intervals of schedules that
+		don't repeat only match the week before they expire.
+		"""
+		live_offers = select(OfferAvailabilityInterval.offer_id).where(  # type: ignore[call-overload]
+			func.int4range(
+				OfferAvailabilityInterval.start_minute, OfferAvailabilityInterval.end_minute
+			).op('@>')(minute_of_week(at)),
+			or_(
+				OfferAvailabilityInterval.expires_at.is_(None),  # type: ignore[union-attr]
+				OfferAvailabilityInterval.expires_at.between(  # type: ignore[union-attr]
+					at + timedelta(microseconds=1), at + timedelta(weeks=1)
+				),
+			),
+		)
+		query = select(Offer).where(
+			Offer.active,  # type: ignore[arg-type]
+			Offer.id.in_(live_offers),  # type: ignore[attr-defined]
+		)
+
+		async with self.db.begin():
+			result = await self.db.execute(query)
+			offers = list(result.scalars().unique().all())
+
+		return offers
+
 	async def list(self) -> list[Offer]:
-		result = await self.db.execute(select(Offer))
+		async with self.db.begin():
+			result = await self.db.execute(select(Offer))
+			offers = list(result.scalars().unique().all())
 
-		return list(result.scalars().unique().all())
+		return offers
 
 	async def get(self, id: UUID) -> Offer:
-		result = await self.db.execute(select(Offer).where(Offer.id == id))  # type: ignore[arg-type]
-		offer = result.scalars().unique().first()
+		async with self.db.begin():
+			result = await self.db.execute(select(Offer).where(Offer.id == id))  # type: ignore[arg-type]
+			offer = result.scalars().unique().first()
 
 		if not offer:
 			raise OfferNotFoundError(offer_id=str(id))
@@ -32,22 +71,45 @@ class OfferRepository:
 	async def create(self, offer: CreateOfferSchema) -> UUID:
 		new_offer = Offer(**offer.model_dump())
 
-		self.db.add(new_offer)
-		await self.db.commit()
+		async with self.db.begin():
+			self.db.add(new_offer)
 
 		return new_offer.id
 
-	async def update(self, offer: Offer) -> None:
-		self.db.add(offer)
+	async def update(self, id: UUID, offer: UpdateOfferSchema) -> Offer:
+		"""
+		Update an offer with a single `UPDATE ... RETURNING` statement, without selecting it
+		first. Instances already in the session are refreshed with the returned row.
+		"""
+		query = (
+			update(Offer)
+			.where(Offer.id == id)  # type: ignore[arg-type]
+			.values(**offer.model_dump())
+			.returning(Offer)
+			.execution_options(populate_existing=True)
+		)
+
+		async with self.db.begin():
+			result = await self.db.execute(query)
+			updated_offer = result.scalars().first()
+
+			if not updated_offer:
+				raise OfferNotFoundError(offer_id=str(id))
+
+		return updated_offer
 
-		await self.db.commit()
-		await self.db.refresh(offer)
+	async def delete(self, id: UUID) -> None:
+		"""Delete an offer with a single `DELETE ... RETURNING` statement, without loading it first."""
+		query = delete(Offer).where(Offer.id == id).returning(Offer.id)  # type: ignore[arg-type, call-overload]
 
-	async def delete(self, offer: Offer) -> None:
-		await self.db.delete(offer)
-		await self.db.commit()
+		async with self.db.begin():
+			result = await self.db.execute(query)
 
+			if result.scalar_one_or_none() is None:
+				raise OfferNotFoundError(offer_id=str(id))
 
+
+@track_repository
 class OfferScheduleRepository:
 	db: AsyncSession
 
@@ -61,26 +123,105 @@ class OfferScheduleRepository:
 		new_schedule.start_time = datetime.strptime(schedule.start_time, '%H:%M:%S').time()
 		new_schedule.end_time = datetime.strptime(schedule.end_time, '%H:%M:%S').time()
 
-		self.db.add(new_schedule)
-		await self.db.commit()
+		async with self.db.begin():
+			self.db.add(new_schedule)
+			self.db.add_all(self._build_availability_intervals(offer_id, new_schedule.id, schedule))
 
 		return new_schedule.id
 
 	async def get(self, schedule_id: UUID) -> OfferSchedule:
-		result = await self.db.execute(select(OfferSchedule).where(OfferSchedule.id == schedule_id))  # type: ignore[arg-type]
-		schedule = result.scalars().unique().first()
+		query = select(OfferSchedule).where(OfferSchedule.id == schedule_id)  # type: ignore[arg-type]
+
+		async with self.db.begin():
+			result = await self.db.execute(query)
+			schedule = result.scalars().unique().first()
 
 		if not schedule:
 			raise OfferScheduleNotFoundError(schedule_id=str(schedule_id))
 
 		return schedule
 
-	async def update(self, schedule: OfferSchedule) -> None:
-		self.db.add(schedule)
-
-		await self.db.commit()
-		await self.db.refresh(schedule)
-
-	async def delete(self, schedule: OfferSchedule) -> None:
-		await self.db.delete(schedule)
-		await self.db.commit()
+	async def update(
+		self, offer_id: UUID, schedule_id: UUID, schedule: UpdateOfferScheduleSchema
+	) -> OfferSchedule:
+		"""
+		Update a schedule with a single `UPDATE ... RETURNING` statement. The schedule must belong
+		to the given offer, so no row is returned when either one is missing. Its availability
+		intervals are rebuilt in the same transaction.
+		"""
+		query = (
+			update(OfferSchedule)
+			.where(
+				OfferSchedule.id == schedule_id,  # type: ignore[arg-type]
+				OfferSchedule.offer_id == offer_id,  # type: ignore[arg-type]
+			)
+			.values(
+				day=schedule.day.value,
+				start_time=datetime.strptime(schedule.start_time, '%H:%M:%S').time(),
+				end_time=datetime.strptime(schedule.end_time, '%H:%M:%S').time(),
+				repeats=schedule.repeats,
+			)
+			.returning(OfferSchedule)
+			.execution_options(populate_existing=True)
+		)
+
+		async with self.db.begin():
+			result = await self.db.execute(query)
+			updated_schedule = result.scalars().first()
+
+			if not updated_schedule:
+				raise OfferScheduleNotFoundError(schedule_id=str(schedule_id))
+
+			await self.db.execute(
+				delete(OfferAvailabilityInterval).where(
+					OfferAvailabilityInterval.schedule_id == schedule_id  # type: ignore[arg-type]
+				)
+			)
+			self.db.add_all(self._build_availability_intervals(offer_id, schedule_id, schedule))
+
+		return updated_schedule
+
+	async def delete(self, offer_id: UUID, schedule_id: UUID) -> None:
+		"""
+		Delete a schedule with a single `DELETE ... RETURNING` statement. The schedule must belong
+		to the given offer, so nothing is deleted when either one is missing. Its availability
+		intervals are deleted by the database (`ON DELETE CASCADE`).
+		"""
+		query = (
+			delete(OfferSchedule)
+			.where(
+				OfferSchedule.id == schedule_id,  # type: ignore[arg-type]
+				OfferSchedule.offer_id == offer_id,  # type: ignore[arg-type]
+			)
+			.returning(OfferSchedule.id)  # type: ignore[call-overload]
+		)
+
+		async with self.db.begin():
+			result = await self.db.execute(query)
+
+			if result.scalar_one_or_none() is None:
+				raise OfferScheduleNotFoundError(schedule_id=str(schedule_id))
+
+	def _build_availability_intervals(
+		self, offer_id: UUID, schedule_id: UUID, schedule: CreateOfferScheduleSchema
+	) -> list[OfferAvailabilityInterval]:
+		start_time = datetime.strptime(schedule.start_time, '%H:%M:%S').time()
+		end_time = datetime.strptime(schedule.end_time, '%H:%M:%S').time()
+		expires_at = (
+			None
+			if schedule.repeats
+			else next_occurrence_end(schedule.day, start_time, end_time, datetime.now())
+		)
+
+		return [
+			OfferAvailabilityInterval(
+				offer_id=offer_id,
+				schedule_id=schedule_id,
+				start_minute=start_minute,
+				end_minute=end_minute,
+				expires_at=expires_at,
+			)
+			for start_minute, end_minute in weekly_intervals(
+				schedule.day, schedule.day, start_time, end_time
+			)
+		]
@@ -2,6 +2,7 @@ from datetime import datetime
 from uuid import UUID
 
 from src.core.logging.logger import StructLogger
+from src.core.timing import timed
 from src.offers.exceptions import (
 	OfferNotFoundError,
 	OfferScheduleNotFoundError,
@@ -30,12 +31,25 @@ class OfferService:
 	def __init__(self, repository: OfferRepository):
 		self.repository = repository
 
+	async def list_live(self, at: datetime | None = None) -> list[OfferSchema]:
+		try:
+			# Schedules are wall clock times, so the moment is compared without its timezone
+			moment = (at or datetime.now()).replace(tzinfo=None)
+			offers = await self.repository.list_live(moment)
+			logger.bind(listed_live_offers_count=len(offers))
+
+			with timed('validation'):
+				return [OfferSchema.model_validate(offer) for offer in offers]
+		except Exception as e:
+			raise OffersInternalError(message=str(e)) from e
+
 	async def list(self) -> list[OfferSchema]:
 		try:
 			offers = await self.repository.list()
 			logger.bind(listed_offers_count=len(offers))
 
-			return [OfferSchema.model_validate(offer) for offer in offers]
+			with timed('validation'):
+				return [OfferSchema.model_validate(offer) for offer in offers]
 		except Exception as e:
 			raise OffersInternalError(message=str(e)) from e
 
@@ -44,7 +58,8 @@ class OfferService:
 			offer = await self.repository.get(id)
 			logger.bind(retrieved_offer_id=offer.id)
 
-			return OfferWithSchedulesSchema.model_validate(offer)
+			with timed('validation'):
+				return OfferWithSchedulesSchema.model_validate(offer)
 		except OfferNotFoundError:
 			raise
 		except Exception as e:
@@ -61,14 +76,11 @@ class OfferService:
 
 	async def update(self, id: UUID, offer_update: UpdateOfferSchema) -> OfferSchema:
 		try:
-			offer = await self.repository.get(id)
-
-			offer.price = offer_update.price
-			offer.active = offer_update.active
-			await self.repository.update(offer)
+			offer = await self.repository.update(id, offer_update)
 			logger.bind(updated_offer_id=offer.id)
 
-			return OfferSchema.model_validate(offer)
+			with timed('validation'):
+				return OfferSchema.model_validate(offer)
 		except OfferNotFoundError:
 			raise
 		except Exception as e:
@@ -76,9 +88,7 @@ class OfferService:
 
 	async def delete(self, id: UUID) -> None:
 		try:
-			offer = await self.repository.get(id)
-
-			await self.repository.delete(offer)
+			await self.repository.delete(id)
 			logger.bind(deleted_offer_id=id)
 		except OfferNotFoundError:
 			raise
@@ -112,17 +122,17 @@ class OfferScheduleService:
 		self, offer_id: UUID, schedule_id: UUID, schedule_update: UpdateOfferScheduleSchema
 	) -> OfferScheduleSchema:
 		try:
-			await self.offer_repository.get(offer_id)
-			schedule = await self.repository.get(schedule_id)
-
-			schedule.day = schedule_update.day.value
-			schedule.start_time = datetime.strptime(schedule_update.start_time, '%H:%M:%S').time()
-			schedule.end_time = datetime.strptime(schedule_update.end_time, '%H:%M:%S').time()
-			schedule.repeats = schedule_update.repeats
-			await self.repository.update(schedule)
+			try:
+				schedule = await self.repository.update(offer_id, schedule_id, schedule_update)
+			except OfferScheduleNotFoundError:
+				# Nothing is updated when the offer is missing too, so check which one it was
+				await self.offer_repository.get(offer_id)
+				raise
+
 			logger.bind(updated_offer_schedule_id=schedule.id)
 
-			return OfferScheduleSchema.model_validate(schedule)
+			with timed('validation'):
+				return OfferScheduleSchema.model_validate(schedule)
 		except (OfferNotFoundError, OfferScheduleNotFoundError):
 			raise
 		except Exception as e:
@@ -130,11 +140,14 @@ class OfferScheduleService:
 
 	async def delete(self, offer_id: UUID, schedule_id: UUID) -> None:
 		try:
-			await self.offer_repository.get(offer_id)
-			schedule = await self.repository.get(schedule_id)
-
-			await self.repository.delete(schedule)
-			logger.bind(deleted_offer_schedule_id=schedule.id)
+			try:
+				await self.repository.delete(offer_id, schedule_id)
+			except OfferScheduleNotFoundError:
+				# Nothing is deleted when the offer is missing too, so check which one it was
+				await self.offer_repository.get(offer_id)
+				raise
+
+			logger.bind(deleted_offer_schedule_id=schedule_id)
 		except (OfferNotFoundError, OfferScheduleNotFoundError):
 			raise
 		except Exception as e:
@@ -1,8 +1,10 @@
 from uuid import UUID
 
-from fastapi import APIRouter, status
+from fastapi import APIRouter, Response, status
 
-from src.products.deps import ProductServiceDeps
+from src.core.etag import IfNoneMatch, etag_matches, not_modified, weak_etag
+from src.core.responses import ModelResponse
+from src.products.deps import ProductReadServiceDeps, ProductServiceDeps
 from src.products.schemas import (
 	CreateProductResponseSchema,
 	CreateProductSchema,
@@ -22,9 +24,9 @@ router = APIRouter()
 	response_model=list[ProductWithCategoriesSchema],
 )
 async def list_products(
-	service: ProductServiceDeps, name: str | None = None, category_id: UUID | None = None
-) -> list[ProductWithCategoriesSchema]:
-	return await service.list(name, category_id)
+	service: ProductReadServiceDeps, name: str | None = None, category_id: UUID | None = None
+) -> ModelResponse:
+	return ModelResponse(await service.list(name, category_id))
 
 
 @router.get(
@@ -33,8 +35,22 @@ async def list_products(
 	status_code=status.HTTP_200_OK,
 	response_model=ProductWithOffersSchema,
 )
-async def find_product(id: UUID, service: ProductServiceDeps) -> ProductWithOffersSchema:
-	return await service.get(id)
+async def find_product(
+	id: UUID, service: ProductReadServiceDeps, if_none_match: IfNoneMatch = None
+) -> Response:
+	# Revalidation only reads the versions of the product and its offers
+	if if_none_match is not None:
+		etag = await service.get_etag(id)
+		if etag_matches(if_none_match, etag):
+			return not_modified(etag)
+
+	product = await service.get(id)
+	etag = weak_etag(
+		(product.id, product.updated_at),
+		[(offer.id, offer.updated_at) for offer in product.offers],
+	)
+
+	return ModelResponse(product, headers={'ETag': etag})
 
 
 @router.post(
@@ -3,7 +3,7 @@ from typing import Annotated
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.core.deps import get_session
+from src.core.deps import get_read_session, get_session
 from src.products.repository import ProductRepository
 from src.products.service import ProductService
 
@@ -21,3 +21,19 @@ def get_product_service(
 
 
 ProductServiceDeps = Annotated[ProductService, Depends(get_product_service)]
+
+
+def get_product_read_repository(
+	db: AsyncSession = Depends(get_read_session),
+) -> ProductRepository:
+	return ProductRepository(db)
+
+
+def get_product_read_service(
+	repository: ProductRepository = Depends(get_product_read_repository),
+) -> ProductService:
+	return ProductService(repository)
+
+
+# Read-only routes may be served by a read replica
+ProductReadServiceDeps = Annotated[ProductService, Depends(get_product_read_service)]
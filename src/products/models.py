@@ -10,10 +10,11 @@ class Product(SQLModel, table=True):
 	__tablename__ = 'products'
 
 	id: UUID = Field(default_factory=uuid4, primary_key=True)
-	restaurant_id: UUID = Field(foreign_key='restaurants.id')
+	restaurant_id: UUID = Field(foreign_key='restaurants.id', index=True)
+	# Name search (ILIKE) is served by a pg_trgm GIN index, created only in migrations
 	name: str = Field(max_length=256)
 	price: float
-	category_id: UUID = Field(foreign_key='categories.id')
+	category_id: UUID = Field(foreign_key='categories.id', index=True)
 	image_url: str | None = Field(default=None, max_length=256)
 	created_at: datetime = Field(default_factory=datetime.now)
 	updated_at: datetime = Field(
@@ -1,36 +1,69 @@
 from uuid import UUID
 
+from sqlalchemy import delete, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.orm import selectinload
 
+from src.core.etag import Version
+from src.core.metrics.database import track_repository
+from src.core.search import icontains
+from src.offers.models import Offer
 from src.products.exceptions import ProductNotFoundError
 from src.products.models import Product
-from src.products.schemas import CreateProductSchema
+from src.products.schemas import CreateProductSchema, UpdateProductSchema
 
 
+@track_repository
 class ProductRepository:
 	db: AsyncSession
 
 	def __init__(self, db: AsyncSession):
 		self.db = db
 
+	async def get_version(self, id: UUID) -> tuple[Version, list[Version]]:
+		"""
+		Get the id and updated_at of a product and of its offers, the ones loaded by `get`,
+		without loading the full rows.
+		"""
+		query = (
+			select(Product.id, Product.updated_at, Offer.id, Offer.updated_at)  # type: ignore[call-overload]
+			.outerjoin(Offer, Offer.product_id == Product.id)
+			.where(Product.id == id)
+		)
+
+		async with self.db.begin():
+			result = await self.db.execute(query)
+			rows = result.all()
+
+		if not rows:
+			raise ProductNotFoundError(product_id=str(id))
+
+		root = (rows[0][0], rows[0][1])
+		offers = [(offer_id, updated_at) for _, _, offer_id, updated_at in rows if offer_id]
+
+		return root, offers
+
 	async def list(self, name: str | None, category_id: UUID | None) -> list[Product]:
 		query = select(Product)
 
 		if name is not None:
-			query = query.filter(Product.name.contains(name))  # type: ignore[attr-defined]
+			query = query.filter(icontains(Product.name, name))
 		if category_id is not None:
 			query = query.filter(Product.category_id == category_id)  # type: ignore[arg-type]
 
-		result = await self.db.execute(query)
+		async with self.db.begin():
+			result = await self.db.execute(query)
+			products = list(result.scalars().unique().all())
 
-		return list(result.scalars().unique().all())
+		return products
 
 	async def get(self, id: UUID) -> Product:
 		query = select(Product).options(selectinload(Product.offers)).where(Product.id == id)  # type: ignore[arg-type]
-		result = await self.db.execute(query)
-		product = result.scalars().unique().first()
+
+		async with self.db.begin():
+			result = await self.db.execute(query)
+			product = result.scalars().unique().first()
 
 		if not product:
 			raise ProductNotFoundError(product_id=str(id))
@@ -40,17 +73,39 @@ class ProductRepository:
 	async def create(self, product: CreateProductSchema) -> UUID:
 		new_product = Product(**product.model_dump())
 
-		self.db.add(new_product)
-		await self.db.commit()
+		async with self.db.begin():
+			self.db.add(new_product)
 
 		return new_product.id
 
-	async def update(self, product: Product) -> None:
-		self.db.add(product)
-
-		await self.db.commit()
-		await self.db.refresh(product)
-
-	async def delete(self, product: Product) -> None:
-		await self.db.delete(product)
-		await self.db.commit()
+	async def update(self, id: UUID, product: UpdateProductSchema) -> Product:
+		"""
+		Update a product with a single `UPDATE ... RETURNING` statement, without selecting it
+		first. Instances already in the session are refreshed with the returned row.
+		"""
+		query = (
+			update(Product)
+			.where(Product.id == id)  # type: ignore[arg-type]
+			.values(**product.model_dump())
+			.returning(Product)
+			.execution_options(populate_existing=True)
+		)
+
+		async with self.db.begin():
+			result = await self.db.execute(query)
+			updated_product = result.scalars().first()
+
+			if not updated_product:
+				raise ProductNotFoundError(product_id=str(id))
+
+		return updated_product
+
+	async def delete(self, id: UUID) -> None:
+		"""Delete a product with a single `DELETE ... RETURNING` statement, without loading it first."""
+		query = delete(Product).where(Product.id == id).returning(Product.id)  # type: ignore[arg-type, call-overload]
+
+		async with self.db.begin():
+			result = await self.db.execute(query)
+
+			if result.scalar_one_or_none() is None:
+				raise ProductNotFoundError(product_id=str(id))
@@ -1,6 +1,8 @@
 from uuid import UUID
 
+from src.core.etag import weak_etag
 from src.core.logging.logger import StructLogger
+from src.core.timing import timed
 from src.products.exceptions import ProductNotFoundError, ProductsInternalError
 from src.products.repository import ProductRepository
 from src.products.schemas import (
@@ -28,7 +30,8 @@ class ProductService:
 			products = await self.repository.list(name, category_id)
 			logger.bind(listed_products_count=len(products))
 
-			return [ProductWithCategoriesSchema.model_validate(product) for product in products]
+			with timed('validation'):
+				return [ProductWithCategoriesSchema.model_validate(product) for product in products]
 		except Exception as e:
 			raise ProductsInternalError(message=str(e)) from e
 
@@ -37,7 +40,19 @@ class ProductService:
 			product = await self.repository.get(id)
 			logger.bind(retrieved_product_id=product.id)
 
-			return ProductWithOffersSchema.model_validate(product)
+			with timed('validation'):
+				return ProductWithOffersSchema.model_validate(product)
+		except ProductNotFoundError:
+			raise
+		except Exception as e:
+			raise ProductsInternalError(message=str(e)) from e
+
+	async def get_etag(self, id: UUID) -> str:
+		"""ETag of the product returned by `get`, without loading it."""
+		try:
+			product, offers = await self.repository.get_version(id)
+
+			return weak_etag(product, offers)
 		except ProductNotFoundError:
 			raise
 		except Exception as e:
@@ -54,20 +69,11 @@ class ProductService:
 
 	async def update(self, id: UUID, product_update: UpdateProductSchema) -> ProductSchema:
 		try:
-			product = await self.repository.get(id)
-
-			product.restaurant_id = product_update.restaurant_id
-			product.name = product_update.name
-			product.price = product_update.price
-			product.category_id = product_update.category_id
-			product.image_url = (
-				str(product_update.image_url) if product_update.image_url is not None else None
-			)
-
-			await self.repository.update(product)
+			product = await self.repository.update(id, product_update)
 			logger.bind(updated_product_id=product.id)
 
-			return ProductSchema.model_validate(product)
+			with timed('validation'):
+				return ProductSchema.model_validate(product)
 		except ProductNotFoundError:
 			raise
 		except Exception as e:
@@ -75,9 +81,7 @@ class ProductService:
 
 	async def delete(self, id: UUID) -> None:
 		try:
-			product = await self.repository.get(id)
-
-			await self.repository.delete(product)
+			await self.repository.delete(id)
 			logger.bind(deleted_product_id=id)
 		except ProductNotFoundError:
 			raise
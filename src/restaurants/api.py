@@ -1,8 +1,12 @@
+from datetime import datetime
 from uuid import UUID
 
-from fastapi import APIRouter, status
+from fastapi import APIRouter, Query, Response, status
 
+from src.core.etag import IfNoneMatch, etag_matches, not_modified, weak_etag
+from src.core.responses import ModelResponse
 from src.restaurants.deps import (
+	RestaurantReadServiceDeps,
 	RestaurantScheduleServiceDeps,
 	RestaurantServiceDeps,
 )
@@ -11,10 +15,10 @@ from src.restaurants.schemas import (
 	CreateRestaurantScheduleResponseSchema,
 	CreateRestaurantScheduleSchema,
 	CreateRestaurantSchema,
+	RestaurantPageSchema,
 	RestaurantScheduleSchema,
 	RestaurantSchema,
 	RestaurantWithProductsSchema,
-	RestaurantWithSchedulesSchema,
 	UpdateRestaurantScheduleSchema,
 	UpdateRestaurantSchema,
 )
@@ -26,14 +30,24 @@ router = APIRouter()
 	'',
 	name='List restaurants',
 	status_code=status.HTTP_200_OK,
-	response_model=list[RestaurantWithSchedulesSchema],
+	response_model=RestaurantPageSchema,
 )
 async def list_restaurants(
-	service: RestaurantServiceDeps,
+	service: RestaurantReadServiceDeps,
 	name: str | None = None,
 	owner_id: UUID | None = None,
-) -> list[RestaurantWithSchedulesSchema]:
-	return await service.list(name=name, owner_id=owner_id)
+	limit: int = Query(default=50, ge=1, le=100),
+	cursor: str | None = None,
+	open_at: datetime | None = Query(
+		default=None,
+		description='Only restaurants open at this wall clock time, e.g. 2026-01-30T22:30:00',
+	),
+) -> ModelResponse:
+	return ModelResponse(
+		await service.list(
+			name=name, owner_id=owner_id, limit=limit, cursor=cursor, open_at=open_at
+		)
+	)
 
 
 @router.get(
@@ -42,8 +56,22 @@ async def list_restaurants(
 	status_code=status.HTTP_200_OK,
 	response_model=RestaurantWithProductsSchema,
 )
-async def find_restaurant(id: UUID, service: RestaurantServiceDeps) -> RestaurantWithProductsSchema:
-	return await service.get(id)
+async def find_restaurant(
+	id: UUID, service: RestaurantReadServiceDeps, if_none_match: IfNoneMatch = None
+) -> Response:
+	# Revalidation only reads the versions of the restaurant and its products
+	if if_none_match is not None:
+		etag = await service.get_etag(id)
+		if etag_matches(if_none_match, etag):
+			return not_modified(etag)
+
+	restaurant = await service.get(id)
+	etag = weak_etag(
+		(restaurant.id, restaurant.updated_at),
+		[(product.id, product.updated_at) for product in restaurant.products],
+	)
+
+	return ModelResponse(restaurant, headers={'ETag': etag})
 
 
 @router.post(
@@ -3,7 +3,7 @@ from typing import Annotated
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.core.deps import get_session
+from src.core.deps import get_read_session, get_session
 from src.restaurants.repository import (
 	RestaurantRepository,
 	RestaurantScheduleRepository,
@@ -29,6 +29,22 @@ def get_restaurant_service(
 RestaurantServiceDeps = Annotated[RestaurantService, Depends(get_restaurant_service)]
 
 
+def get_restaurant_read_repository(
+	db: AsyncSession = Depends(get_read_session),
+) -> RestaurantRepository:
+	return RestaurantRepository(db)
+
+
+def get_restaurant_read_service(
+	repository: RestaurantRepository = Depends(get_restaurant_read_repository),
+) -> RestaurantService:
+	return RestaurantService(repository)
+
+
+# Read-only routes may be served by a read replica
+RestaurantReadServiceDeps = Annotated[RestaurantService, Depends(get_restaurant_read_service)]
+
+
 def get_restaurant_schedule_repository(
 	db: AsyncSession = Depends(get_session),
 ) -> RestaurantScheduleRepository:
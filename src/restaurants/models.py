@@ -3,16 +3,20 @@ from datetime import datetime, time
 from typing import Optional
 from uuid import UUID, uuid4
 
+from sqlalchemy import Index, func, text
 from sqlmodel import Field, Relationship, SQLModel
 
 
 class Restaurant(SQLModel, table=True):
 	__tablename__ = 'restaurants'
+	# Keyset pagination on list endpoint is ordered by (created_at, id)
+	__table_args__ = (Index('ix_restaurants_created_at_id', 'created_at', 'id'),)
 
 	id: UUID = Field(default_factory=uuid4, primary_key=True)
+	# Name search (ILIKE) is served by a pg_trgm GIN index, created only in migrations
 	name: str = Field(max_length=256)
 	image_url: str | None = Field(default=None, max_length=256)
-	owner_id: UUID = Field(foreign_key='users.id')
+	owner_id: UUID = Field(foreign_key='users.id', index=True)
 	street: str = Field(max_length=256)
 	number: int
 	neighborhood: str = Field(max_length=256)
@@ -24,19 +28,17 @@ class Restaurant(SQLModel, table=True):
 	)
 
 	owner: Optional['User'] = Relationship(back_populates='restaurants')  # noqa: F821
-	products: list['Product'] = Relationship(  # noqa: F821
-		back_populates='restaurant', sa_relationship_kwargs={'lazy': 'joined'}
-	)
-	schedules: list['RestaurantSchedule'] = Relationship(
-		back_populates='restaurant', sa_relationship_kwargs={'lazy': 'joined'}
-	)
+	# Collections are not eagerly loaded by default. Each repository method picks the loader
+	# strategy for its use case, avoiding a products x schedules cartesian join on every query
+	products: list['Product'] = Relationship(back_populates='restaurant')  # noqa: F821
+	schedules: list['RestaurantSchedule'] = Relationship(back_populates='restaurant')
 
 
 class RestaurantSchedule(SQLModel, table=True):
 	__tablename__ = 'restaurant_schedules'
 
 	id: UUID = Field(default_factory=uuid4, primary_key=True)
-	restaurant_id: UUID = Field(foreign_key='restaurants.id')
+	restaurant_id: UUID = Field(foreign_key='restaurants.id', index=True)
 	day_type: str = Field(max_length=10)
 	start_day: str = Field(max_length=10)
 	end_day: str = Field(max_length=10)
@@ -48,3 +50,27 @@ class RestaurantSchedule(SQLModel, table=True):
 	)
 
 	restaurant: Optional['Restaurant'] = Relationship(back_populates='schedules')
+
+
+# Normalized form of weekday and weekend schedules, used to find open restaurants in SQL.
+# Each row is a half-open [start_minute, end_minute) range of minutes since Monday 00:00,
+# rebuilt by the schedules repository whenever a schedule changes
+class RestaurantOpenInterval(SQLModel, table=True):
+	__tablename__ = 'restaurant_open_intervals'
+	# GiST index on the range serves "open at minute M" lookups (`range @> M`)
+	__table_args__ = (
+		Index(
+			'ix_restaurant_open_intervals_minutes',
+			func.int4range(text('start_minute'), text('end_minute')),
+			postgresql_using='gist',
+		),
+	)
+
+	id: UUID = Field(default_factory=uuid4, primary_key=True)
+	restaurant_id: UUID = Field(foreign_key='restaurants.id', index=True)
+	schedule_id: UUID = Field(foreign_key='restaurant_schedules.id', ondelete='CASCADE', index=True)
+	start_minute: int
+	end_minute: int
+
+	# Makes the unit of work insert a new schedule before its intervals
+	schedule: Optional['RestaurantSchedule'] = Relationship()
@@ -1,35 +1,115 @@
 from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import delete, func, select, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
-
+from sqlalchemy.orm import selectinload
+
+from src.core.etag import Version
+from src.core.metrics.database import track_repository
+from src.core.search import icontains
+from src.core.weekly_intervals import weekly_intervals
+from src.enums import DayType
+from src.products.models import Product
 from src.restaurants.exceptions import RestaurantNotFoundError, RestaurantScheduleNotFoundError
-from src.restaurants.models import Restaurant, RestaurantSchedule
-from src.restaurants.schemas import CreateRestaurantScheduleSchema, CreateRestaurantSchema
+from src.restaurants.models import Restaurant, RestaurantOpenInterval, RestaurantSchedule
+from src.restaurants.schemas import (
+	CreateRestaurantScheduleSchema,
+	CreateRestaurantSchema,
+	UpdateRestaurantScheduleSchema,
+	UpdateRestaurantSchema,
+)
 
 
+@track_repository
 class RestaurantRepository:
 	db: AsyncSession
 
 	def __init__(self, db: AsyncSession):
 		self.db = db
 
-	async def list(self, name: str | None, owner_id: UUID | None) -> list[Restaurant]:
-		query = select(Restaurant)
+	async def get_version(self, id: UUID) -> tuple[Version, list[Version]]:
+		"""
+		Get the id and updated_at of a restaurant and of its products, the ones loaded by
+		`get_with_products`, without loading the full rows.
+		"""
+		query = (
+			select(Restaurant.id, Restaurant.updated_at, Product.id, Product.updated_at)  # type: ignore[call-overload]
+			.outerjoin(Product, Product.restaurant_id == Restaurant.id)
+			.where(Restaurant.id == id)
+		)
+
+		async with self.db.begin():
+			result = await self.db.execute(query)
+			rows = result.all()
+
+		if not rows:
+			raise RestaurantNotFoundError(restaurant_id=str(id))
+
+		root = (rows[0][0], rows[0][1])
+		products = [(product_id, updated_at) for _, _, product_id, updated_at in rows if product_id]
+
+		return root, products
+
+	async def list(
+		self,
+		name: str | None,
+		owner_id: UUID | None,
+		limit: int,
+		after: tuple[datetime, UUID] | None = None,
+		open_at_minute: int | None = None,
+	) -> list[Restaurant]:
+		"""
+		List restaurants using keyset pagination ordered by (created_at, id).
+		Rows are fetched after the given keyset instead of using OFFSET, so every page
+		is an index range scan no matter how deep it is. Open restaurants are found by the
+		minute of week on their open intervals, instead of evaluating every schedule.
+		"""
+		query = select(Restaurant).options(selectinload(Restaurant.schedules))  # type: ignore[arg-type]
 
 		if name is not None:
-			query = query.filter(Restaurant.name.contains(name))  # type: ignore[attr-defined]
+			query = query.filter(icontains(Restaurant.name, name))
 		if owner_id is not None:
 			query = query.filter(Restaurant.owner_id == owner_id)  # type: ignore[arg-type]
+		if open_at_minute is not None:
+			open_restaurants = select(RestaurantOpenInterval.restaurant_id).where(  # type: ignore[call-overload]
+				func.int4range(
+					RestaurantOpenInterval.start_minute, RestaurantOpenInterval.end_minute
+				).op('@>')(open_at_minute)
+			)
+			query = query.filter(Restaurant.id.in_(open_restaurants))  # type: ignore[attr-defined]
+		if after is not None:
+			query = query.filter(tuple_(Restaurant.created_at, Restaurant.id) > tuple_(*after))  # type: ignore[arg-type]
+
+		query = query.order_by(Restaurant.created_at, Restaurant.id).limit(limit)  # type: ignore[arg-type]
 
-		result = await self.db.execute(query)
+		async with self.db.begin():
+			result = await self.db.execute(query)
+			restaurants = list(result.scalars().all())
 
-		return list(result.scalars().unique().all())
+		return restaurants
 
 	async def get(self, id: UUID) -> Restaurant:
-		result = await self.db.execute(select(Restaurant).where(Restaurant.id == id))  # type: ignore[arg-type]
-		restaurant = result.scalars().unique().first()
+		"""Get a restaurant without loading any of its relationships."""
+		async with self.db.begin():
+			result = await self.db.execute(select(Restaurant).where(Restaurant.id == id))  # type: ignore[arg-type]
+			restaurant = result.scalars().first()
+
+		if not restaurant:
+			raise RestaurantNotFoundError(restaurant_id=str(id))
+
+		return restaurant
+
+	async def get_with_products(self, id: UUID) -> Restaurant:
+		query = (
+			select(Restaurant)
+			.options(selectinload(Restaurant.products))  # type: ignore[arg-type]
+			.where(Restaurant.id == id)  # type: ignore[arg-type]
+		)
+
+		async with self.db.begin():
+			result = await self.db.execute(query)
+			restaurant = result.scalars().first()
 
 		if not restaurant:
 			raise RestaurantNotFoundError(restaurant_id=str(id))
@@ -39,22 +119,45 @@ class RestaurantRepository:
 	async def create(self, restaurant: CreateRestaurantSchema) -> UUID:
 		new_restaurant = Restaurant(**restaurant.model_dump())
 
-		self.db.add(new_restaurant)
-		await self.db.commit()
+		async with self.db.begin():
+			self.db.add(new_restaurant)
 
 		return new_restaurant.id
 
-	async def update(self, restaurant: Restaurant) -> None:
-		self.db.add(restaurant)
+	async def update(self, id: UUID, restaurant: UpdateRestaurantSchema) -> Restaurant:
+		"""
+		Update a restaurant with a single `UPDATE ... RETURNING` statement, without selecting it
+		first. Instances already in the session are refreshed with the returned row.
+		"""
+		query = (
+			update(Restaurant)
+			.where(Restaurant.id == id)  # type: ignore[arg-type]
+			.values(**restaurant.model_dump())
+			.returning(Restaurant)
+			.execution_options(populate_existing=True)
+		)
+
+		async with self.db.begin():
+			result = await self.db.execute(query)
+			updated_restaurant = result.scalars().first()
+
+			if not updated_restaurant:
+				raise RestaurantNotFoundError(restaurant_id=str(id))
 
-		await self.db.commit()
-		await self.db.refresh(restaurant)
+		return updated_restaurant
 
-	async def delete(self, restaurant: Restaurant) -> None:
-		await self.db.delete(restaurant)
-		await self.db.commit()
+	async def delete(self, id: UUID) -> None:
+		"""Delete a restaurant with a single `DELETE ... RETURNING` statement, without loading it first."""
+		query = delete(Restaurant).where(Restaurant.id == id).returning(Restaurant.id)  # type: ignore[arg-type, call-overload]
 
+		async with self.db.begin():
+			result = await self.db.execute(query)
 
+			if result.scalar_one_or_none() is None:
+				raise RestaurantNotFoundError(restaurant_id=str(id))
+
+
+@track_repository
 class RestaurantScheduleRepository:
 	db: AsyncSession
 
@@ -70,37 +173,117 @@ class RestaurantScheduleRepository:
 		new_schedule.start_day = schedule.start_day.value
 		new_schedule.end_day = schedule.end_day.value
 
-		self.db.add(new_schedule)
-		await self.db.commit()
+		async with self.db.begin():
+			self.db.add(new_schedule)
+			self.db.add_all(self._build_open_intervals(restaurant_id, new_schedule.id, schedule))
 
 		return new_schedule.id
 
 	async def get(self, schedule_id: UUID) -> RestaurantSchedule:
-		result = await self.db.execute(
-			select(RestaurantSchedule).where(RestaurantSchedule.id == schedule_id)  # type: ignore[arg-type]
-		)
-		schedule = result.scalars().unique().first()
+		query = select(RestaurantSchedule).where(RestaurantSchedule.id == schedule_id)  # type: ignore[arg-type]
+
+		async with self.db.begin():
+			result = await self.db.execute(query)
+			schedule = result.scalars().unique().first()
 
 		if not schedule:
 			raise RestaurantScheduleNotFoundError(schedule_id=str(schedule_id))
 
 		return schedule
 
-	async def update(self, schedule: RestaurantSchedule) -> None:
-		self.db.add(schedule)
+	async def update(
+		self, restaurant_id: UUID, schedule_id: UUID, schedule: UpdateRestaurantScheduleSchema
+	) -> RestaurantSchedule:
+		"""
+		Update a schedule with a single `UPDATE ... RETURNING` statement. The schedule must belong
+		to the given restaurant, so no row is returned when either one is missing. Its open
+		intervals are rebuilt in the same transaction.
+		"""
+		query = (
+			update(RestaurantSchedule)
+			.where(
+				RestaurantSchedule.id == schedule_id,  # type: ignore[arg-type]
+				RestaurantSchedule.restaurant_id == restaurant_id,  # type: ignore[arg-type]
+			)
+			.values(
+				day_type=schedule.day_type.value,
+				start_day=schedule.start_day.value,
+				end_day=schedule.end_day.value,
+				start_time=datetime.strptime(schedule.start_time, '%H:%M:%S').time(),
+				end_time=datetime.strptime(schedule.end_time, '%H:%M:%S').time(),
+			)
+			.returning(RestaurantSchedule)
+			.execution_options(populate_existing=True)
+		)
+
+		async with self.db.begin():
+			result = await self.db.execute(query)
+			updated_schedule = result.scalars().first()
 
-		await self.db.commit()
-		await self.db.refresh(schedule)
+			if not updated_schedule:
+				raise RestaurantScheduleNotFoundError(schedule_id=str(schedule_id))
+
+			await self.db.execute(
+				delete(RestaurantOpenInterval).where(
+					RestaurantOpenInterval.schedule_id == schedule_id  # type: ignore[arg-type]
+				)
+			)
+			self.db.add_all(self._build_open_intervals(restaurant_id, schedule_id, schedule))
+
+		return updated_schedule
 
 	async def get_by_restaurant(self, restaurant_id: UUID) -> list[RestaurantSchedule]:
-		result = await self.db.execute(
-			select(RestaurantSchedule).where(
+		query = select(RestaurantSchedule).where(
+			RestaurantSchedule.restaurant_id == restaurant_id,  # type: ignore[arg-type]
+		)
+
+		async with self.db.begin():
+			result = await self.db.execute(query)
+			schedules = list(result.scalars().unique().all())
+
+		return schedules
+
+	async def delete(self, restaurant_id: UUID, schedule_id: UUID) -> None:
+		"""
+		Delete a schedule with a single `DELETE ... RETURNING` statement. The schedule must belong
+		to the given restaurant, so nothing is deleted when either one is missing. Its open
+		intervals are deleted by the database (`ON DELETE CASCADE`).
+		"""
+		query = (
+			delete(RestaurantSchedule)
+			.where(
+				RestaurantSchedule.id == schedule_id,  # type: ignore[arg-type]
 				RestaurantSchedule.restaurant_id == restaurant_id,  # type: ignore[arg-type]
 			)
+			.returning(RestaurantSchedule.id)  # type: ignore[call-overload]
 		)
 
-		return list(result.scalars().unique().all())
+		async with self.db.begin():
+			result = await self.db.execute(query)
+
+			if result.scalar_one_or_none() is None:
+				raise RestaurantScheduleNotFoundError(schedule_id=str(schedule_id))
 
-	async def delete(self, schedule: RestaurantSchedule) -> None:
-		await self.db.delete(schedule)
-		await self.db.commit()
+	def _build_open_intervals(
+		self, restaurant_id: UUID, schedule_id: UUID, schedule: CreateRestaurantScheduleSchema
+	) -> list[RestaurantOpenInterval]:
+		# Holidays have no fixed weekdays, so their schedules are left out of the open intervals
+		if schedule.day_type == DayType.HOLIDAY:
+			return []
+
+		intervals = weekly_intervals(
+			schedule.start_day,
+			schedule.end_day,
+			datetime.strptime(schedule.start_time, '%H:%M:%S').time(),
+			datetime.strptime(schedule.end_time, '%H:%M:%S').time(),
+		)
+
+		return [
+			RestaurantOpenInterval(
+				restaurant_id=restaurant_id,
+				schedule_id=schedule_id,
+				start_minute=start_minute,
+				end_minute=end_minute,
+			)
+			for start_minute, end_minute in intervals
+		]
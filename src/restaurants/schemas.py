@@ -47,6 +47,11 @@ class RestaurantWithProductsSchema(RestaurantSchema):
 	products: list[ProductSchema] = []
 
 
+class RestaurantPageSchema(BaseModel):
+	items: list[RestaurantWithSchedulesSchema]
+	next_cursor: str | None = None
+
+
 class CreateRestaurantSchema(BaseModel):
 	name: str = Field(min_length=1, max_length=256)
 	image_url: HttpUrl | None = None
@@ -1,7 +1,11 @@
 from datetime import datetime
 from uuid import UUID
 
+from src.core.etag import weak_etag
 from src.core.logging.logger import StructLogger
+from src.core.pagination import InvalidCursorError, decode_cursor, encode_cursor
+from src.core.timing import timed
+from src.core.weekly_intervals import minute_of_week
 from src.restaurants.exceptions import (
 	RestaurantNotFoundError,
 	RestaurantScheduleNotFoundError,
@@ -14,6 +18,7 @@ from src.restaurants.schemas import (
 	CreateRestaurantScheduleResponseSchema,
 	CreateRestaurantScheduleSchema,
 	CreateRestaurantSchema,
+	RestaurantPageSchema,
 	RestaurantScheduleSchema,
 	RestaurantSchema,
 	RestaurantWithProductsSchema,
@@ -32,25 +37,56 @@ class RestaurantService:
 		self.repository = repository
 
 	async def list(
-		self, name: str | None, owner_id: UUID | None
-	) -> list[RestaurantWithSchedulesSchema]:
+		self,
+		name: str | None,
+		owner_id: UUID | None,
+		limit: int,
+		cursor: str | None = None,
+		open_at: datetime | None = None,
+	) -> RestaurantPageSchema:
 		try:
-			restaurants = await self.repository.list(name, owner_id)
+			after = decode_cursor(cursor) if cursor is not None else None
+			open_at_minute = minute_of_week(open_at) if open_at is not None else None
+			# Fetching one extra row tells if there's a next page without a COUNT query
+			restaurants = await self.repository.list(
+				name, owner_id, limit + 1, after, open_at_minute
+			)
+			has_next = len(restaurants) > limit
+			restaurants = restaurants[:limit]
 			logger.bind(listed_restaurants_count=len(restaurants))
 
-			return [
-				RestaurantWithSchedulesSchema.model_validate(restaurant)
-				for restaurant in restaurants
-			]
+			last = restaurants[-1] if has_next else None
+			with timed('validation'):
+				return RestaurantPageSchema(
+					items=[
+						RestaurantWithSchedulesSchema.model_validate(restaurant)
+						for restaurant in restaurants
+					],
+					next_cursor=encode_cursor(last.created_at, last.id) if last else None,
+				)
+		except InvalidCursorError:
+			raise
 		except Exception as e:
 			raise RestaurantsInternalError(message=str(e)) from e
 
 	async def get(self, id: UUID) -> RestaurantWithProductsSchema:
 		try:
-			restaurant = await self.repository.get(id)
+			restaurant = await self.repository.get_with_products(id)
 			logger.bind(retrieved_restaurant_id=restaurant.id)
 
-			return RestaurantWithProductsSchema.model_validate(restaurant)
+			with timed('validation'):
+				return RestaurantWithProductsSchema.model_validate(restaurant)
+		except RestaurantNotFoundError:
+			raise
+		except Exception as e:
+			raise RestaurantsInternalError(message=str(e)) from e
+
+	async def get_etag(self, id: UUID) -> str:
+		"""ETag of the restaurant returned by `get`, without loading it."""
+		try:
+			restaurant, products = await self.repository.get_version(id)
+
+			return weak_etag(restaurant, products)
 		except RestaurantNotFoundError:
 			raise
 		except Exception as e:
@@ -67,25 +103,11 @@ class RestaurantService:
 
 	async def update(self, id: UUID, restaurant_update: UpdateRestaurantSchema) -> RestaurantSchema:
 		try:
-			restaurant = await self.repository.get(id)
-
-			restaurant.name = restaurant_update.name
-			restaurant.image_url = (
-				str(restaurant_update.image_url)
-				if restaurant_update.image_url is not None
-				else None
-			)
-			restaurant.owner_id = restaurant_update.owner_id
-			restaurant.street = restaurant_update.street
-			restaurant.number = restaurant_update.number
-			restaurant.neighborhood = restaurant_update.neighborhood
-			restaurant.city = restaurant_update.city
-			restaurant.state_abbr = restaurant_update.state_abbr
-
-			await self.repository.update(restaurant)
+			restaurant = await self.repository.update(id, restaurant_update)
 			logger.bind(updated_restaurant_id=restaurant.id)
 
-			return RestaurantSchema.model_validate(restaurant)
+			with timed('validation'):
+				return RestaurantSchema.model_validate(restaurant)
 		except RestaurantNotFoundError:
 			raise
 		except Exception as e:
@@ -93,9 +115,7 @@ class RestaurantService:
 
 	async def delete(self, id: UUID) -> None:
 		try:
-			restaurant = await self.repository.get(id)
-
-			await self.repository.delete(restaurant)
+			await self.repository.delete(id)
 			logger.bind(deleted_restaurant_id=id)
 		except RestaurantNotFoundError:
 			raise
@@ -149,19 +169,17 @@ class RestaurantScheduleService:
 		schedule_update: UpdateRestaurantScheduleSchema,
 	) -> RestaurantScheduleSchema:
 		try:
-			await self.restaurant_repository.get(restaurant_id)
-			schedule = await self.repository.get(schedule_id)
-
-			schedule.day_type = schedule_update.day_type.value
-			schedule.start_day = schedule_update.start_day.value
-			schedule.end_day = schedule_update.end_day.value
-			schedule.start_time = datetime.strptime(schedule_update.start_time, '%H:%M:%S').time()
-			schedule.end_time = datetime.strptime(schedule_update.end_time, '%H:%M:%S').time()
+			try:
+				schedule = await self.repository.update(restaurant_id, schedule_id, schedule_update)
+			except RestaurantScheduleNotFoundError:
+				# Nothing is updated when the restaurant is missing too, so check which one it was
+				await self.restaurant_repository.get(restaurant_id)
+				raise
 
-			await self.repository.update(schedule)
 			logger.bind(updated_restaurant_schedule_id=schedule.id)
 
-			return RestaurantScheduleSchema.model_validate(schedule)
+			with timed('validation'):
+				return RestaurantScheduleSchema.model_validate(schedule)
 		except (RestaurantNotFoundError, RestaurantScheduleNotFoundError):
 			raise
 		except Exception as e:
@@ -169,10 +187,13 @@ class RestaurantScheduleService:
 
 	async def delete(self, restaurant_id: UUID, schedule_id: UUID) -> None:
 		try:
-			await self.restaurant_repository.get(restaurant_id)
-			schedule = await self.repository.get(schedule_id)
+			try:
+				await self.repository.delete(restaurant_id, schedule_id)
+			except RestaurantScheduleNotFoundError:
+				# Nothing is deleted when the restaurant is missing too, so check which one it was
+				await self.restaurant_repository.get(restaurant_id)
+				raise
 
-			await self.repository.delete(schedule)
 			logger.bind(deleted_restaurant_schedule_id=schedule_id)
 		except (RestaurantNotFoundError, RestaurantScheduleNotFoundError):
 			raise
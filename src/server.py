@@ -0,0 +1,251 @@
+"""
+Production entry point, serving the API with several uvicorn worker processes.
+
+- Workers default to the CPUs the container can use: its CPU quota (cgroup v2 or v1) rounded
+  up, limited to the CPUs the process can run on
+- uvloop and httptools are used when installed, falling back to asyncio and h11
+- Workers are replaced after SERVER_MAX_REQUESTS requests (plus up to
+  SERVER_MAX_REQUESTS_JITTER, so they don't all restart at once), finishing the requests in
+  flight first, and whenever they exit
+- Prometheus metrics are shared by the workers (see src/core/metrics/multiprocess.py)
+
+Usage: python -m src.server [--host 0.0.0.0] [--port 8000] [--workers 0] [--reload]
+
+`--reload` runs a single process restarting on file changes, for development only.
+"""
+
+import argparse
+import asyncio
+import logging
+import math
+import multiprocessing
+import os
+import random
+import signal
+import socket
+import sys
+import tempfile
+import threading
+import time
+from importlib.util import find_spec
+from multiprocessing.process import BaseProcess
+from types import FrameType
+
+import uvicorn
+from prometheus_client import multiprocess
+
+from src.core.config import settings
+from src.core.metrics.multiprocess import (
+	MULTIPROC_DIR_ENV,
+	multiprocess_dir,
+	prepare_multiprocess_dir,
+)
+
+APP = 'src.main:app'
+CGROUP_ROOT = '/sys/fs/cgroup'
+# A worker failing sooner than this after starting is failing to boot (e.g. a bad setting), so
+# the server stops instead of restarting workers in a loop
+BOOT_SECONDS = 5
+# Time given to connections accepted right before a worker stops to send their request
+ACCEPTED_GRACE_SECONDS = 0.1
+
+logger = logging.getLogger('uvicorn.error')
+
+
+def cgroup_cpu_limit(root: str = CGROUP_ROOT) -> float | None:
+	"""
+	CPUs the container is allowed to use by its quota (e.g. 0.5 for a 500m limit), from cgroup
+	v2 `cpu.max` or cgroup v1 `cpu.cfs_quota_us`. None without a quota.
+	"""
+	try:
+		with open(os.path.join(root, 'cpu.max')) as file:
+			quota, period = file.read().split()
+		if quota == 'max':
+			return None
+		return int(quota) / int(period)
+	except (OSError, ValueError):
+		pass
+
+	try:
+		with open(os.path.join(root, 'cpu', 'cpu.cfs_quota_us')) as file:
+			cfs_quota = int(file.read())
+		with open(os.path.join(root, 'cpu', 'cpu.cfs_period_us')) as file:
+			cfs_period = int(file.read())
+	except (OSError, ValueError):
+		return None
+
+	return cfs_quota / cfs_period if cfs_quota > 0 and cfs_period > 0 else None
+
+
+def available_cpus() -> int:
+	if hasattr(os, 'sched_getaffinity'):
+		return len(os.sched_getaffinity(0))
+
+	return os.cpu_count() or 1
+
+
+def default_workers(root: str = CGROUP_ROOT) -> int:
+	"""One worker per CPU the container can use, rounding a partial quota up."""
+	cpus = available_cpus()
+	limit = cgroup_cpu_limit(root)
+	if limit is not None:
+		cpus = min(cpus, math.ceil(limit))
+
+	return max(cpus, 1)
+
+
+def build_config(host: str, port: int) -> uvicorn.Config:
+	max_requests = None
+	if settings.SERVER_MAX_REQUESTS > 0:
+		jitter = random.randint(0, settings.SERVER_MAX_REQUESTS_JITTER)  # noqa: S311
+		max_requests = settings.SERVER_MAX_REQUESTS + jitter
+
+	# `auto` picks uvloop and httptools when they're installed
+	return uvicorn.Config(
+		APP,
+		host=host,
+		port=port,
+		loop='auto',
+		http='auto',
+		limit_max_requests=max_requests,
+		timeout_graceful_shutdown=settings.SERVER_GRACEFUL_TIMEOUT,
+	)
+
+
+class WorkerServer(uvicorn.Server):
+	"""
+	uvicorn server which lets the connections it just accepted send their request before
+	stopping. A worker only notices it reached its max requests on the next tick, and may accept
+	connections meanwhile: uvicorn closes the ones without a request yet right away, so their
+	clients would get a disconnection instead of a response.
+	"""
+
+	async def shutdown(self, sockets: list[socket.socket] | None = None) -> None:
+		for server in self.servers:
+			server.close()
+		await asyncio.sleep(ACCEPTED_GRACE_SECONDS)
+
+		await super().shutdown(sockets=sockets)
+
+
+def run_worker(config: uvicorn.Config, sock: socket.socket) -> None:
+	WorkerServer(config).run(sockets=[sock])
+
+
+class Supervisor:
+	"""
+	Keep `workers` worker processes serving on a shared socket, starting a new one whenever a
+	worker exits (recycled after its max requests, or crashed). On SIGTERM or SIGINT, workers
+	are asked to stop and given SERVER_GRACEFUL_TIMEOUT seconds to finish their requests.
+	"""
+
+	def __init__(self, host: str, port: int, workers: int) -> None:
+		self.host = host
+		self.port = port
+		self.workers = workers
+		self.processes: list[BaseProcess] = []
+		self.started_at: dict[int | None, float] = {}
+		self.should_exit = threading.Event()
+		self.failed = False
+		self._context = multiprocessing.get_context('spawn')
+
+	def spawn(self, sock: socket.socket) -> BaseProcess:
+		config = build_config(self.host, self.port)
+		process = self._context.Process(target=run_worker, args=(config, sock))
+		process.start()
+		self.started_at[process.pid] = time.monotonic()
+
+		return process
+
+	def replace_exited(self, sock: socket.socket) -> None:
+		for index, process in enumerate(self.processes):
+			if process.is_alive():
+				continue
+
+			process.join()
+			# Its live gauges (e.g. pool connections) aren't summed anymore
+			metrics_dir = multiprocess_dir()
+			if metrics_dir is not None and process.pid is not None:
+				multiprocess.mark_process_dead(process.pid, metrics_dir)
+
+			uptime = time.monotonic() - self.started_at.pop(process.pid, 0)
+			if process.exitcode != 0 and uptime < BOOT_SECONDS:
+				logger.error('Worker %s failed to boot, stopping', process.pid)
+				self.failed = True
+				self.should_exit.set()
+				return
+
+			logger.info(
+				'Worker %s exited with code %s, starting a new one', process.pid, process.exitcode
+			)
+			self.processes[index] = self.spawn(sock)
+
+	def stop(self) -> None:
+		for process in self.processes:
+			process.terminate()
+
+		for process in self.processes:
+			# Besides the requests in flight, workers run the app shutdown
+			process.join(settings.SERVER_GRACEFUL_TIMEOUT + BOOT_SECONDS)
+			if process.is_alive():
+				logger.warning('Worker %s did not stop in time, killing it', process.pid)
+				process.kill()
+				process.join()
+
+	def handle_exit(self, signum: int, frame: FrameType | None) -> None:
+		self.should_exit.set()
+
+	def run(self) -> None:
+		for signum in (signal.SIGINT, signal.SIGTERM):
+			signal.signal(signum, self.handle_exit)
+
+		# Building a config also sets up the uvicorn loggers of this process
+		sock = build_config(self.host, self.port).bind_socket()
+		loop = 'uvloop' if find_spec('uvloop') else 'asyncio'
+		http = 'httptools' if find_spec('httptools') else 'h11'
+		logger.info('Starting %s workers (%s loop, %s parser)', self.workers, loop, http)
+
+		self.processes = [self.spawn(sock) for _ in range(self.workers)]
+
+		while not self.should_exit.wait(0.5):
+			self.replace_exited(sock)
+
+		self.stop()
+		sock.close()
+		if self.failed:
+			sys.exit(1)
+
+
+def serve(host: str, port: int, workers: int) -> None:
+	# Workers are started with this environment, so they all write to the same directory
+	metrics_dir = multiprocess_dir()
+	if metrics_dir is None and workers > 1:
+		metrics_dir = os.environ[MULTIPROC_DIR_ENV] = tempfile.mkdtemp(prefix='prometheus-')
+	if metrics_dir is not None:
+		prepare_multiprocess_dir(metrics_dir)
+
+	Supervisor(host, port, workers).run()
+
+
+def main() -> None:
+	parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+	parser.add_argument('--host', default=settings.APP_HOST)
+	parser.add_argument('--port', type=int, default=settings.APP_PORT)
+	parser.add_argument(
+		'--workers',
+		type=int,
+		default=settings.SERVER_WORKERS,
+		help='Worker processes, 0 for one per CPU available',
+	)
+	parser.add_argument('--reload', action='store_true', help='Restart on changes (development)')
+	args = parser.parse_args()
+
+	if args.reload:
+		uvicorn.run(APP, host=args.host, port=args.port, reload=True)
+		return
+
+	serve(args.host, args.port, args.workers or default_workers())
+
+
+if __name__ == '__main__':
+	main()
@@ -2,7 +2,8 @@ from uuid import UUID
 
 from fastapi import APIRouter, status
 
-from src.users.deps import UserServiceDeps
+from src.core.responses import ModelResponse
+from src.users.deps import UserReadServiceDeps, UserServiceDeps
 from src.users.schemas import (
 	CreateUserResponseSchema,
 	CreateUserSchema,
@@ -21,8 +22,8 @@ router = APIRouter()
 	description='Get all users',
 	response_model=list[UserSchema],
 )
-async def list_users(service: UserServiceDeps) -> list[UserSchema]:
-	return await service.list()
+async def list_users(service: UserReadServiceDeps) -> ModelResponse:
+	return ModelResponse(await service.list())
 
 
 @router.get(
@@ -32,8 +33,8 @@ async def list_users(service: UserServiceDeps) -> list[UserSchema]:
 	description='Get a user by id with all its restaurants',
 	response_model=UserDetailsSchema,
 )
-async def find_user(id: UUID, service: UserServiceDeps) -> UserDetailsSchema:
-	return await service.get(id)
+async def find_user(id: UUID, service: UserReadServiceDeps) -> ModelResponse:
+	return ModelResponse(await service.get(id))
 
 
 @router.post(
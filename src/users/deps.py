@@ -3,7 +3,7 @@ from typing import Annotated
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.core.deps import get_session
+from src.core.deps import get_read_session, get_session
 from src.users.repository import UserRepository
 from src.users.service import UserService
 
@@ -21,3 +21,19 @@ def get_user_service(
 
 
 UserServiceDeps = Annotated[UserService, Depends(get_user_service)]
+
+
+def get_user_read_repository(
+	db: AsyncSession = Depends(get_read_session),
+) -> UserRepository:
+	return UserRepository(db)
+
+
+def get_user_read_service(
+	repository: UserRepository = Depends(get_user_read_repository),
+) -> UserService:
+	return UserService(repository)
+
+
+# Read-only routes may be served by a read replica
+UserReadServiceDeps = Annotated[UserService, Depends(get_user_read_service)]
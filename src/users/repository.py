@@ -1,14 +1,17 @@
 from uuid import UUID
 
+from sqlalchemy import delete, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.orm import selectinload
 
+from src.core.metrics.database import track_repository
 from src.users.exceptions import UserNotFoundError
 from src.users.models import User
-from src.users.schemas import CreateUserSchema
+from src.users.schemas import CreateUserSchema, UpdateUserSchema
 
 
+@track_repository
 class UserRepository:
 	db: AsyncSession
 
@@ -16,15 +19,18 @@ class UserRepository:
 		self.db = db
 
 	async def list(self) -> list[User]:
-		result = await self.db.execute(select(User))
-		users: list[User] = list(result.scalars().unique().all())
+		async with self.db.begin():
+			result = await self.db.execute(select(User))
+			users: list[User] = list(result.scalars().unique().all())
 
 		return users
 
 	async def get(self, id: UUID) -> User:
 		query = select(User).options(selectinload(User.restaurants)).where(User.id == id)  # type: ignore[arg-type]
-		result = await self.db.execute(query)
-		user: User | None = result.scalars().unique().first()
+
+		async with self.db.begin():
+			result = await self.db.execute(query)
+			user: User | None = result.scalars().unique().first()
 
 		if not user:
 			raise UserNotFoundError(user_id=str(id))
@@ -34,17 +40,39 @@ class UserRepository:
 	async def create(self, user: CreateUserSchema) -> UUID:
 		new_user = User(**user.model_dump())
 
-		self.db.add(new_user)
-		await self.db.commit()
+		async with self.db.begin():
+			self.db.add(new_user)
 
 		return new_user.id
 
-	async def update(self, user: User) -> None:
-		self.db.add(user)
-
-		await self.db.commit()
-		await self.db.refresh(user)
-
-	async def delete(self, user: User) -> None:
-		await self.db.delete(user)
-		await self.db.commit()
+	async def update(self, id: UUID, user: UpdateUserSchema) -> User:
+		"""
+		Update a user with a single `UPDATE ... RETURNING` statement, without selecting it
+		first. Instances already in the session are refreshed with the returned row.
+		"""
+		query = (
+			update(User)
+			.where(User.id == id)  # type: ignore[arg-type]
+			.values(**user.model_dump())
+			.returning(User)
+			.execution_options(populate_existing=True)
+		)
+
+		async with self.db.begin():
+			result = await self.db.execute(query)
+			updated_user: User | None = result.scalars().first()
+
+			if not updated_user:
+				raise UserNotFoundError(user_id=str(id))
+
+		return updated_user
+
+	async def delete(self, id: UUID) -> None:
+		"""Delete a user with a single `DELETE ... RETURNING` statement, without loading it first."""
+		query = delete(User).where(User.id == id).returning(User.id)  # type: ignore[arg-type, call-overload]
+
+		async with self.db.begin():
+			result = await self.db.execute(query)
+
+			if result.scalar_one_or_none() is None:
+				raise UserNotFoundError(user_id=str(id))
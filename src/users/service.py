@@ -1,6 +1,7 @@
 from uuid import UUID
 
 from src.core.logging.logger import StructLogger
+from src.core.timing import timed
 from src.users.exceptions import UserNotFoundError, UsersInternalError
 from src.users.repository import UserRepository
 from src.users.schemas import (
@@ -25,7 +26,8 @@ class UserService:
 			users = await self.repository.list()
 			logger.bind(listed_users_count=len(users))
 
-			return [UserSchema.model_validate(user) for user in users]
+			with timed('validation'):
+				return [UserSchema.model_validate(user) for user in users]
 		except Exception as e:
 			raise UsersInternalError(message=str(e)) from e
 
@@ -34,7 +36,8 @@ class UserService:
 			user = await self.repository.get(id)
 			logger.bind(retrieved_user_id=user.id)
 
-			return UserDetailsSchema.model_validate(user)
+			with timed('validation'):
+				return UserDetailsSchema.model_validate(user)
 		except UserNotFoundError:
 			raise
 		except Exception as e:
@@ -51,15 +54,11 @@ class UserService:
 
 	async def update(self, id: UUID, user_update: UpdateUserSchema) -> UserSchema:
 		try:
-			user = await self.repository.get(id)
-
-			user.first_name = user_update.first_name
-			user.last_name = user_update.last_name
-
-			await self.repository.update(user)
+			user = await self.repository.update(id, user_update)
 			logger.bind(updated_user_id=user.id)
 
-			return UserSchema.model_validate(user)
+			with timed('validation'):
+				return UserSchema.model_validate(user)
 		except UserNotFoundError:
 			raise
 		except Exception as e:
@@ -67,9 +66,7 @@ class UserService:
 
 	async def delete(self, id: UUID) -> None:
 		try:
-			user = await self.repository.get(id)
-
-			await self.repository.delete(user)
+			await self.repository.delete(id)
 			logger.bind(deleted_user_id=id)
 		except UserNotFoundError:
 			raise
@@ -6,7 +6,8 @@ from sqlalchemy.orm import sessionmaker
 from sqlmodel import SQLModel
 
 from src.core.config import settings
-from src.core.deps import get_session
+from src.core.deps import get_read_session, get_session
+from src.core.metrics.database import TimedQueuePool
 from src.main import app
 
 # Since tests are not on Docker, we use localhost as DB host
@@ -51,8 +52,11 @@ async def session():
 	Create a new database session for a test.
 	First, creates an async engine and creates all tables.
 	After the test, drops all tables and disposes the engine (drop_all).
+
+	Like the app sessions, it doesn't begin transactions on its own: tests wrap their setup in
+	`async with session.begin()`.
 	"""
-	engine = create_async_engine(TEST_DB_URL, echo=False)
+	engine = create_async_engine(TEST_DB_URL, echo=False, poolclass=TimedQueuePool)
 
 	async with engine.begin() as conn:
 		await conn.run_sync(SQLModel.metadata.create_all)
@@ -61,6 +65,7 @@ async def session():
 		bind=engine,
 		class_=AsyncSession,
 		autoflush=False,
+		autobegin=False,
 		expire_on_commit=False,
 	)
 
@@ -77,13 +82,14 @@ async def session():
 async def client(session):
 	"""
 	Create an HTTPX AsyncClient that uses the FastAPI app with
-	an overridden get_session dependency to use the test session.
+	an overridden get_session (and get_read_session) dependency to use the test session.
 	"""
 
 	async def override_get_session():
 		yield session
 
 	app.dependency_overrides[get_session] = override_get_session
+	app.dependency_overrides[get_read_session] = override_get_session
 
 	transport = ASGITransport(app=app)
 	async with AsyncClient(transport=transport, base_url='http://testserver') as ac:
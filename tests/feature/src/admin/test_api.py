@@ -0,0 +1,74 @@
+from unittest.mock import patch
+
+import pytest
+from fastapi import status
+
+from src.core.config import settings
+
+PROFILE_URL = '/api/v1/admin/profile'
+
+
+@pytest.fixture
+def profiler_settings():
+	with patch('src.admin.deps.settings') as mock_settings:
+		mock_settings.PROFILER_ENABLED = True
+		mock_settings.ADMIN_TOKEN = 'flamengo-2019'
+
+		yield mock_settings
+
+
+def admin_headers(token):
+	return {settings.ADMIN_HEADER_NAME: token}
+
+
+@pytest.mark.asyncio
+async def test_profile(client, profiler_settings):
+	response = await client.get(
+		PROFILE_URL,
+		params={'seconds': 0.05, 'interval_ms': 5},
+		headers=admin_headers('flamengo-2019'),
+	)
+
+	assert response.status_code == status.HTTP_200_OK
+	assert response.headers['Content-Type'].startswith('text/plain')
+	lines = response.text.splitlines()
+	assert lines
+	assert all(line.rsplit(' ', 1)[1].isdigit() for line in lines)
+
+
+@pytest.mark.asyncio
+async def test_profile_disabled(client, profiler_settings):
+	profiler_settings.PROFILER_ENABLED = False
+
+	response = await client.get(PROFILE_URL, headers=admin_headers('flamengo-2019'))
+
+	assert response.status_code == status.HTTP_404_NOT_FOUND
+	assert response.json()['error'] == 'profiler_disabled'
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+	'admin_token, headers',
+	[
+		('flamengo-2019', {}),
+		('flamengo-2019', admin_headers('flamengo-1981')),
+		('', admin_headers('')),
+	],
+)
+async def test_profile_unauthorized(client, profiler_settings, admin_token, headers):
+	profiler_settings.ADMIN_TOKEN = admin_token
+
+	response = await client.get(PROFILE_URL, headers=headers)
+
+	assert response.status_code == status.HTTP_401_UNAUTHORIZED
+	assert response.json()['error'] == 'admin_token_invalid'
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+	'params', [{'seconds': 0}, {'seconds': settings.PROFILER_MAX_SECONDS + 1}, {'interval_ms': 0}]
+)
+async def test_profile_invalid_params(client, profiler_settings, params):
+	response = await client.get(PROFILE_URL, params=params, headers=admin_headers('flamengo-2019'))
+
+	assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
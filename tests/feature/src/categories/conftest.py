@@ -1,4 +1,19 @@
 import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from src.categories.deps import categories_cache
+from src.categories.models import Category
+from src.core.deps import get_read_session
+from src.main import app
+
+
+@pytest.fixture(autouse=True)
+def clear_categories_cache():
+	categories_cache.invalidate()
+	yield
+	categories_cache.invalidate()
 
 
 @pytest.fixture
@@ -7,3 +22,25 @@ def build_category_create_payload():
 		return {'name': 'Burgers'}
 
 	return _build
+
+
+@pytest_asyncio.fixture
+async def lagging_read_session(client, session):
+	"""
+	Serve read-only routes from a session behind the primary, like a lagging replica: it reads a
+	snapshot of the database taken when the fixture starts, without the later writes.
+	"""
+	async with session.bind.connect() as connection:
+		await connection.execution_options(isolation_level='REPEATABLE READ')
+		await connection.begin()
+		await connection.execute(select(Category))
+
+		async with AsyncSession(
+			bind=connection, autobegin=False, expire_on_commit=False
+		) as read_session:
+
+			async def override_get_read_session():
+				yield read_session
+
+			app.dependency_overrides[get_read_session] = override_get_read_session
+			yield read_session
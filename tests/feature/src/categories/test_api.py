@@ -9,10 +9,9 @@ from src.categories.models import Category
 
 @pytest.mark.asyncio
 async def test_get_categories(client, session, category_factory):
-	category_factory(session, name='Pizza')
-	category_factory(session, name='Drinks')
-
-	await session.commit()
+	async with session.begin():
+		category_factory(session, name='Pizza')
+		category_factory(session, name='Drinks')
 
 	response = await client.get('/api/v1/categories')
 
@@ -23,6 +22,53 @@ async def test_get_categories(client, session, category_factory):
 	assert data[0]['name'] in ['Pizza', 'Drinks']
 
 
+@pytest.mark.asyncio
+async def test_get_categories_from_cache(client, session, category_factory, executed_statements):
+	async with session.begin():
+		category_factory(session, name='Pizza')
+
+	first_response = await client.get('/api/v1/categories')
+	executed_statements.clear()
+	second_response = await client.get('/api/v1/categories')
+
+	assert second_response.status_code == status.HTTP_200_OK
+	assert second_response.json() == first_response.json()
+	assert executed_statements == []
+
+
+@pytest.mark.asyncio
+async def test_get_categories_after_create_and_delete(
+	client, session, category_factory, build_category_create_payload
+):
+	async with session.begin():
+		category_factory(session, name='Pizza')
+
+	await client.get('/api/v1/categories')
+	create_response = await client.post('/api/v1/categories', json=build_category_create_payload())
+	created_response = await client.get('/api/v1/categories')
+
+	assert sorted(category['name'] for category in created_response.json()) == ['Burgers', 'Pizza']
+
+	await client.delete(f'/api/v1/categories/{create_response.json()["id"]}')
+	deleted_response = await client.get('/api/v1/categories')
+
+	assert [category['name'] for category in deleted_response.json()] == ['Pizza']
+
+
+@pytest.mark.asyncio
+async def test_get_categories_after_create_with_lagging_read_session(
+	client, session, category_factory, build_category_create_payload, lagging_read_session
+):
+	async with session.begin():
+		category_factory(session, name='Pizza')
+
+	await client.get('/api/v1/categories')
+	await client.post('/api/v1/categories', json=build_category_create_payload())
+	response = await client.get('/api/v1/categories')
+
+	assert sorted(category['name'] for category in response.json()) == ['Burgers', 'Pizza']
+
+
 @pytest.mark.asyncio
 async def test_create_category(client, build_category_create_payload):
 	payload = build_category_create_payload()
@@ -53,14 +99,14 @@ async def test_create_category_bad_request_error(client, payload):
 
 @pytest.mark.asyncio
 async def test_delete_category(client, session, category_factory):
-	category = category_factory(session, name='Sushi')
-
-	await session.commit()
+	async with session.begin():
+		category = category_factory(session, name='Sushi')
 
 	response = await client.delete(f'/api/v1/categories/{category.id}')
 
-	result = await session.execute(select(Category).where(Category.id == category.id))
-	deleted_category = result.scalars().first()
+	async with session.begin():
+		result = await session.execute(select(Category).where(Category.id == category.id))
+		deleted_category = result.scalars().first()
 
 	assert response.status_code == status.HTTP_204_NO_CONTENT
 	assert deleted_category is None
@@ -1,6 +1,7 @@
 from uuid import uuid4
 
 import pytest
+from sqlalchemy import event
 
 from src.categories.models import Category
 from src.offers.models import Offer
@@ -110,3 +111,22 @@ def product_factory(restaurant_factory, category_factory):
 		return obj
 
 	return create
+
+
+@pytest.fixture
+def executed_statements(session):
+	"""
+	Record the kind (SELECT, UPDATE, ...) of every statement sent to the database driver,
+	so tests can assert how many round trips an endpoint takes.
+	"""
+	statements: list[str] = []
+
+	def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+		statements.append(statement.split(maxsplit=1)[0].upper())
+
+	engine = session.bind.sync_engine
+	event.listen(engine, 'after_cursor_execute', after_cursor_execute)
+
+	yield statements
+
+	event.remove(engine, 'after_cursor_execute', after_cursor_execute)
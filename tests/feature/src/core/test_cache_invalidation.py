@@ -0,0 +1,106 @@
+import asyncio
+from functools import partial
+
+import asyncpg
+import pytest
+import pytest_asyncio
+from fastapi import status
+
+from src.core.cache import TTLCache
+from src.core.cache_invalidation import CacheInvalidationListener
+
+
+async def wait_for(condition, timeout=5):
+	"""Notifications are delivered in the background, so poll until they're handled"""
+	for _ in range(int(timeout / 0.01)):
+		if condition():
+			return
+		await asyncio.sleep(0.01)
+
+	raise AssertionError('Condition not met before the timeout')
+
+
+@pytest.fixture
+def dsn(session):
+	return session.bind.url.set(drivername='postgresql').render_as_string(hide_password=False)
+
+
+@pytest_asyncio.fixture
+async def app_instances(dsn):
+	"""Two app instances (pods) listening on the same database, each with its own cache"""
+	instances = []
+	for _ in range(2):
+		cache = TTLCache(name='categories_test', ttl_seconds=60, max_size=16)
+		listener = CacheInvalidationListener(connect=partial(asyncpg.connect, dsn), retry_seconds=0)
+		listener.register('categories', cache)
+		instances.append((listener, cache))
+
+	# Listening starts with an invalidation, so an emptied cache means LISTEN already ran
+	for listener, cache in instances:
+		cache.set('list', ['stale'])
+		listener.start()
+		await wait_for(lambda cache=cache: len(cache) == 0)
+		cache.set('list', ['stale'])
+
+	yield instances
+
+	for listener, _ in instances:
+		await listener.stop()
+
+
+@pytest.mark.asyncio
+async def test_create_category_invalidates_every_instance(client, app_instances):
+	response = await client.post('/api/v1/categories', json={'name': 'Burgers'})
+
+	assert response.status_code == status.HTTP_201_CREATED
+	for _, cache in app_instances:
+		await wait_for(lambda cache=cache: cache.get('list') is None)
+
+
+@pytest.mark.asyncio
+async def test_delete_category_invalidates_every_instance(
+	client, session, category_factory, app_instances
+):
+	async with session.begin():
+		category = category_factory(session, name='Sushi')
+	# Factory inserts don't notify, so the caches are filled again after them
+	for _, cache in app_instances:
+		cache.set('list', ['stale'])
+
+	response = await client.delete(f'/api/v1/categories/{category.id}')
+
+	assert response.status_code == status.HTTP_204_NO_CONTENT
+	for _, cache in app_instances:
+		await wait_for(lambda cache=cache: cache.get('list') is None)
+
+
+@pytest.mark.asyncio
+async def test_failed_delete_does_not_invalidate(client, app_instances):
+	response = await client.delete('/api/v1/categories/00000000-0000-0000-0000-000000000000')
+	await asyncio.sleep(0.1)
+
+	assert response.status_code == status.HTTP_404_NOT_FOUND
+	for _, cache in app_instances:
+		assert cache.get('list') == ['stale']
+
+
+@pytest.mark.asyncio
+async def test_listener_reconnects_after_connection_loss(dsn, app_instances):
+	connection = await asyncpg.connect(dsn)
+	await connection.execute(
+		'SELECT pg_terminate_backend(pid) FROM pg_stat_activity '
+		"WHERE query LIKE 'LISTEN%' AND pid <> pg_backend_pid()"
+	)
+
+	# Notifications missed while disconnected are lost, so reconnecting drops every cache
+	for _, cache in app_instances:
+		await wait_for(lambda cache=cache: cache.get('list') is None)
+		cache.set('list', ['stale'])
+
+	await connection.execute(
+		'SELECT pg_notify(\'cache_invalidation\', \'{"entity": "categories", "id": "1"}\')'
+	)
+	await connection.close()
+
+	for _, cache in app_instances:
+		await wait_for(lambda cache=cache: cache.get('list') is None)
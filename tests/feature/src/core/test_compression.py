@@ -0,0 +1,24 @@
+import pytest
+from fastapi import status
+
+
+@pytest.mark.asyncio
+async def test_list_restaurants_compressed(client, session, restaurant_factory):
+	async with session.begin():
+		for n in range(20):
+			restaurant_factory(session, name=f'Restaurant {n}')
+
+	response = await client.get('/api/v1/restaurants', headers={'Accept-Encoding': 'gzip, br'})
+
+	assert response.status_code == status.HTTP_200_OK
+	assert response.headers['Content-Encoding'] == 'br'
+	assert int(response.headers['Content-Length']) < len(response.content)
+	assert len(response.json()['items']) == 20
+
+
+@pytest.mark.asyncio
+async def test_ping_not_compressed(client):
+	response = await client.get('/ping', headers={'Accept-Encoding': 'gzip, br'})
+
+	assert response.status_code == status.HTTP_200_OK
+	assert 'Content-Encoding' not in response.headers
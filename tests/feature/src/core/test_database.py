@@ -0,0 +1,103 @@
+from unittest.mock import patch
+
+import pytest
+from fastapi import status
+from prometheus_client import REGISTRY
+
+from src.core.metrics.database import register_query_metrics
+from src.core.responses import ModelResponse
+
+
+@pytest.fixture
+def checked_out_on_serialize(session):
+	"""
+	Record how many pool connections are checked out when a response is serialized, which
+	happens before the request dependencies (and sessions) are closed.
+	"""
+	pool = session.bind.sync_engine.pool
+	checked_out = []
+	render = ModelResponse.render
+
+	def serialize(self, content):
+		checked_out.append(pool.checkedout())
+		return render(self, content)
+
+	with patch.object(ModelResponse, 'render', serialize):
+		yield checked_out
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('path', ['/api/v1/restaurants', '/api/v1/restaurants/{id}'])
+async def test_connection_is_returned_before_serializing_reads(
+	client, session, restaurant_factory, checked_out_on_serialize, path
+):
+	async with session.begin():
+		restaurant = restaurant_factory(session)
+
+	response = await client.get(path.format(id=restaurant.id))
+
+	assert response.status_code == status.HTTP_200_OK
+	assert checked_out_on_serialize == [0]
+	assert not session.in_transaction()
+
+
+@pytest.mark.asyncio
+async def test_connection_is_returned_before_serializing_writes(
+	client, session, user_factory, checked_out_on_serialize
+):
+	async with session.begin():
+		owner = user_factory(session)
+
+	payload = {
+		'name': 'Gerson',
+		'owner_id': str(owner.id),
+		'street': 'Rua Uruguai',
+		'number': 8,
+		'neighborhood': 'Tijuca',
+		'city': 'Rio de Janeiro',
+		'state_abbr': 'RJ',
+	}
+	response = await client.post('/api/v1/restaurants', json=payload)
+
+	assert response.status_code == status.HTTP_201_CREATED
+	assert checked_out_on_serialize == [0]
+	assert not session.in_transaction()
+
+
+@pytest.fixture
+def query_metrics(session):
+	# Every test has its own engine, so the listeners go away with it
+	register_query_metrics(session.bind)
+
+
+def statement_sample(name, method, statement='SELECT'):
+	labels = {'method': method, 'statement': statement}
+
+	return REGISTRY.get_sample_value(name, labels) or 0
+
+
+@pytest.mark.asyncio
+async def test_statements_timed_by_repository_method(
+	client, session, restaurant_factory, query_metrics
+):
+	async with session.begin():
+		for _ in range(3):
+			restaurant_factory(session)
+	method = 'RestaurantRepository.list'
+	statements = statement_sample('db_statement_duration_seconds_count', method)
+	rows = statement_sample('db_statement_rows_total', method)
+	calls = REGISTRY.get_sample_value(
+		'db_repository_method_duration_seconds_count', {'method': method}
+	)
+
+	response = await client.get('/api/v1/restaurants')
+
+	assert response.status_code == status.HTTP_200_OK
+	# Restaurants, then their schedules with selectinload
+	assert statement_sample('db_statement_duration_seconds_count', method) - statements == 2
+	assert statement_sample('db_statement_rows_total', method) - rows >= 3
+	assert (
+		REGISTRY.get_sample_value('db_repository_method_duration_seconds_count', {'method': method})
+		- (calls or 0)
+		== 1
+	)
@@ -0,0 +1,55 @@
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import text
+
+from src.core.db_checks import (
+	find_unindexed_foreign_keys,
+	relationship_foreign_keys,
+	warn_unindexed_foreign_keys,
+)
+
+
+def test_relationship_foreign_keys():
+	assert relationship_foreign_keys() == {
+		('products', 'restaurant_id'),
+		('products', 'category_id'),
+		('offers', 'product_id'),
+		('offer_schedules', 'offer_id'),
+		('restaurant_schedules', 'restaurant_id'),
+		('restaurants', 'owner_id'),
+		('restaurant_open_intervals', 'schedule_id'),
+		('offer_availability_intervals', 'schedule_id'),
+	}
+
+
+@pytest.mark.asyncio
+async def test_find_unindexed_foreign_keys_when_all_indexed(session):
+	async with session.begin():
+		conn = await session.connection()
+
+		assert await conn.run_sync(find_unindexed_foreign_keys) == []
+
+
+@pytest.mark.asyncio
+async def test_find_unindexed_foreign_keys_when_index_is_missing(session):
+	async with session.begin():
+		await session.execute(text('DROP INDEX ix_products_category_id'))
+		conn = await session.connection()
+
+		assert await conn.run_sync(find_unindexed_foreign_keys) == [('products', 'category_id')]
+
+
+@pytest.mark.asyncio
+@patch('src.core.db_checks.logger')
+async def test_warn_unindexed_foreign_keys(mock_logger, session):
+	async with session.begin():
+		await session.execute(text('DROP INDEX ix_restaurants_owner_id'))
+
+	await warn_unindexed_foreign_keys(session.bind)
+
+	mock_logger.warning.assert_called_once_with(
+		'Foreign key column used by a relationship has no index',
+		table='restaurants',
+		column='owner_id',
+	)
@@ -0,0 +1,84 @@
+from unittest.mock import patch
+
+import pytest
+import pytest_asyncio
+from fastapi import Request
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.core.database import engine as primary_engine
+from src.core.deps import get_read_session
+from src.core.replicas import ReplicaRouter
+
+
+def build_request(headers=None):
+	return Request(
+		{
+			'type': 'http',
+			'headers': [
+				(key.lower().encode(), value.encode()) for key, value in (headers or {}).items()
+			],
+		}
+	)
+
+
+@pytest_asyncio.fixture
+async def unreachable_engine():
+	# Nothing listens on port 1, so every connection attempt is refused
+	engine = create_async_engine('postgresql+asyncpg://postgres@localhost:1/rafood_db')
+
+	yield engine
+
+	await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_get_read_session_ejects_unreachable_replica(session, unreachable_engine):
+	"""The test database engine plays a healthy replica next to an unreachable one"""
+	healthy_engine = session.bind
+	router = ReplicaRouter([unreachable_engine, healthy_engine], ejection_seconds=30)
+
+	with patch('src.core.deps.replica_router', router):
+		dependency = get_read_session(build_request())
+		read_session = await anext(dependency)
+		assert read_session.bind is unreachable_engine
+
+		with pytest.raises(OSError) as exc_info:
+			async with read_session.begin():
+				await read_session.execute(select(1))
+		with pytest.raises(OSError):
+			await dependency.athrow(exc_info.value)
+
+		for _ in range(2):
+			dependency = get_read_session(build_request())
+			read_session = await anext(dependency)
+
+			assert read_session.bind is healthy_engine
+			async with read_session.begin():
+				assert (await read_session.execute(select(1))).scalar_one() == 1
+
+			await dependency.aclose()
+
+
+@pytest.mark.asyncio
+async def test_get_read_session_uses_primary_to_read_own_writes(session):
+	router = ReplicaRouter([session.bind], ejection_seconds=30)
+
+	with patch('src.core.deps.replica_router', router):
+		dependency = get_read_session(build_request({'X-Read-Primary': '1'}))
+		read_session = await anext(dependency)
+
+		assert read_session.bind is primary_engine
+
+		await dependency.aclose()
+
+
+@pytest.mark.asyncio
+async def test_get_read_session_uses_primary_without_replicas():
+	with patch('src.core.deps.replica_router', ReplicaRouter([], ejection_seconds=30)):
+		dependency = get_read_session(build_request())
+		read_session = await anext(dependency)
+
+		assert read_session.bind is primary_engine
+
+		await dependency.aclose()
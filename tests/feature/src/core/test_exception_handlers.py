@@ -8,8 +8,10 @@ from src.exceptions import NOT_FOUND_ERROR
 
 @pytest.mark.asyncio
 async def test_handled_app_internal_server_error(session, client, category_factory):
-	"""Forcing a IntegrityError on categories API to return an app 500 error example"""
-	category_factory(session, name='Filipe Luis')
+	async with session.begin():
+		"""Forcing a IntegrityError on categories API to return an app 500 error example"""
+		category_factory(session, name='Filipe Luis')
+
 	response = await client.post('/api/v1/categories', json={'name': 'Filipe Luis'})
 
 	data = response.json()
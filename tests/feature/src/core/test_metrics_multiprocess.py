@@ -0,0 +1,120 @@
+import os
+import socket
+import subprocess
+import sys
+import time
+
+import httpx
+import pytest
+from prometheus_client.parser import text_string_to_metric_families
+
+from src.core.config import settings
+from src.core.metrics.multiprocess import prepare_multiprocess_dir
+
+WORKERS = 3
+REQUESTS = 30
+
+
+def free_port():
+	with socket.socket() as sock:
+		sock.bind(('localhost', 0))
+		return sock.getsockname()[1]
+
+
+def wait_until_up(base_url, timeout=30):
+	"""Workers import the app on start, so poll until they answer"""
+	for _ in range(int(timeout / 0.1)):
+		try:
+			httpx.get(f'{base_url}/ping')
+			return
+		except httpx.TransportError:
+			time.sleep(0.1)
+
+	raise AssertionError('API not up before the timeout')
+
+
+@pytest.fixture
+def server(session, tmp_path):
+	"""The API served by several uvicorn workers on the test database"""
+	metrics_dir = str(tmp_path / 'metrics')
+	prepare_multiprocess_dir(metrics_dir)
+
+	url = session.bind.url
+	port = free_port()
+	env = {
+		**os.environ,
+		'PROMETHEUS_MULTIPROC_DIR': metrics_dir,
+		'DB_HOST': url.host,
+		'DB_PORT': str(url.port),
+		'DB_NAME': url.database,
+		'DB_USER': url.username,
+		'DB_PASSWORD': url.password or '',
+		'DB_CHECK_FK_INDEXES': 'False',
+		'CACHE_INVALIDATION_ENABLED': 'False',
+		'LOG_LEVEL': 'WARNING',
+	}
+	process = subprocess.Popen(
+		[sys.executable, '-m', 'uvicorn', 'src.main:app', '--port', str(port)]
+		+ ['--workers', str(WORKERS)],
+		env=env,
+		stdout=subprocess.DEVNULL,
+		stderr=subprocess.DEVNULL,
+	)
+	base_url = f'http://localhost:{port}'
+	wait_until_up(base_url)
+
+	yield base_url, metrics_dir
+
+	process.terminate()
+	process.wait(timeout=10)
+
+
+def scrape(base_url):
+	metrics = httpx.get(f'{base_url}/metrics').text
+
+	return {
+		(sample.name, sample.labels.get('handler')): sample.value
+		for family in text_string_to_metric_families(metrics)
+		for sample in family.samples
+		if not sample.labels.get('le')
+	}
+
+
+def scrape_by_pid(base_url, name):
+	metrics = httpx.get(f'{base_url}/metrics').text
+
+	return {
+		sample.labels['pid']: sample.value
+		for family in text_string_to_metric_families(metrics)
+		for sample in family.samples
+		if sample.name == name
+	}
+
+
+def test_metrics_summed_across_workers(server):
+	base_url, metrics_dir = server
+
+	# A new connection per request, so requests are spread among the workers
+	for _ in range(REQUESTS):
+		response = httpx.get(f'{base_url}/api/v1/categories')
+		assert response.status_code == 200
+
+	# Any worker may answer the scrape, each one reads the files of all of them
+	for _ in range(WORKERS):
+		metrics = scrape(base_url)
+		assert metrics[('http_requests_total', '/api/v1/categories')] == REQUESTS
+		assert metrics[('http_request_duration_seconds_count', '/api/v1/categories')] == REQUESTS
+		# Pool gauges are summed across the running workers
+		assert metrics[('db_pool_size', None)] == WORKERS * settings.DB_POOL_SIZE
+
+	workers = {file.rsplit('_', 1)[1] for file in os.listdir(metrics_dir)}
+	assert len(workers) > 1
+
+
+def test_process_metrics_by_worker(server):
+	base_url, _ = server
+
+	memory = scrape_by_pid(base_url, 'process_resident_memory_bytes')
+
+	assert len(memory) == WORKERS
+	assert all(value > 0 for value in memory.values())
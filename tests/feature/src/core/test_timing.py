@@ -0,0 +1,33 @@
+import pytest
+from fastapi import status
+
+from src.core.metrics.database import register_query_metrics
+
+
+@pytest.fixture
+def query_metrics(session):
+	# Statements are timed by the engine hooks, registered on the production engine only
+	register_query_metrics(session.bind)
+
+
+def server_timing(response):
+	return {
+		metric.split(';dur=')[0]: float(metric.split(';dur=')[1])
+		for metric in response.headers['Server-Timing'].split(', ')
+	}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('path', ['/api/v1/restaurants', '/api/v1/users/{owner_id}'])
+async def test_server_timing_phases(client, session, restaurant_factory, query_metrics, path):
+	async with session.begin():
+		restaurant = restaurant_factory(session)
+
+	response = await client.get(path.format(owner_id=restaurant.owner_id))
+
+	assert response.status_code == status.HTTP_200_OK
+	timings = server_timing(response)
+	assert list(timings) == ['pool', 'db', 'commit', 'orm', 'validation', 'render', 'total']
+	assert timings['db'] > 0
+	assert timings['commit'] > 0
+	assert timings['total'] >= sum(timings[phase] for phase in list(timings)[:-1])
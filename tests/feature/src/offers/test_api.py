@@ -1,16 +1,18 @@
+from datetime import datetime, timedelta
 from uuid import uuid4
 
 import pytest
 from fastapi import status
 
+from src.enums import Day
+
 
 @pytest.mark.asyncio
 async def test_list_offers(session, client, offer_factory):
-	offer_factory(session, price=10.99)
-	offer_factory(session, price=15.99)
-	offer_factory(session, price=20.99)
-
-	await session.commit()
+	async with session.begin():
+		offer_factory(session, price=10.99)
+		offer_factory(session, price=15.99)
+		offer_factory(session, price=20.99)
 
 	response = await client.get('/api/v1/offers')
 	data = response.json()
@@ -19,10 +21,105 @@ async def test_list_offers(session, client, offer_factory):
 	assert len(data) == 3
 
 
+async def create_schedule(client, offer_id, day, start_time, end_time, repeats=True):
+	response = await client.post(
+		f'/api/v1/offers/{offer_id}/schedules',
+		json={'day': day, 'start_time': start_time, 'end_time': end_time, 'repeats': repeats},
+	)
+	assert response.status_code == status.HTTP_201_CREATED
+
+	return response.json()['id']
+
+
+async def list_live_offer_ids(client, at=None):
+	response = await client.get('/api/v1/offers/live', params={'at': at} if at else None)
+	assert response.status_code == status.HTTP_200_OK
+
+	return sorted(offer['id'] for offer in response.json())
+
+
+@pytest.mark.asyncio
+async def test_list_live_offers(session, client, offer_factory):
+	async with session.begin():
+		happy_hour = offer_factory(session)
+		inactive = offer_factory(session, active=False)
+		late_night = offer_factory(session)
+
+	await create_schedule(client, happy_hour.id, 'friday', '18:00:00', '23:00:00')
+	await create_schedule(client, inactive.id, 'friday', '18:00:00', '23:00:00')
+	await create_schedule(client, late_night.id, 'sunday', '22:00:00', '02:00:00')
+
+	# Friday evening
+	assert await list_live_offer_ids(client, '2026-01-30T19:00:00') == [str(happy_hour.id)]
+	# Monday early morning, crossing the end of the week
+	assert await list_live_offer_ids(client, '2026-02-02T01:00:00') == [str(late_night.id)]
+	# Friday after the happy hour
+	assert await list_live_offer_ids(client, '2026-01-30T23:00:00') == []
+
+
+@pytest.mark.asyncio
+async def test_list_live_offers_now_by_default(session, client, offer_factory):
+	async with session.begin():
+		offer = offer_factory(session)
+
+	# Today and tomorrow, whole day, so the test doesn't depend on the time it runs
+	now = datetime.now()
+	for moment in (now, now + timedelta(days=1)):
+		await create_schedule(
+			client, offer.id, list(Day)[moment.weekday()].value, '00:00:00', '00:00:00'
+		)
+
+	assert await list_live_offer_ids(client) == [str(offer.id)]
+
+
+@pytest.mark.asyncio
+async def test_list_live_offers_schedules_not_repeating_expire(session, client, offer_factory):
+	async with session.begin():
+		offer = offer_factory(session)
+
+	next_occurrence = datetime.now().replace(hour=12, minute=0, second=0) + timedelta(days=2)
+	day = list(Day)[next_occurrence.weekday()].value
+	await create_schedule(client, offer.id, day, '00:00:00', '00:00:00', repeats=False)
+
+	assert await list_live_offer_ids(client, next_occurrence.isoformat()) == [str(offer.id)]
+	for weeks in (-1, 1):
+		at = next_occurrence + timedelta(weeks=weeks)
+		assert await list_live_offer_ids(client, at.isoformat()) == []
+
+
+@pytest.mark.asyncio
+async def test_list_live_offers_follows_schedule_changes(session, client, offer_factory):
+	async with session.begin():
+		offer = offer_factory(session)
+
+	schedule_id = await create_schedule(client, offer.id, 'monday', '10:00:00', '14:00:00')
+	at = '2026-01-26T20:00:00'
+
+	assert await list_live_offer_ids(client, at) == []
+
+	response = await client.patch(
+		f'/api/v1/offers/{offer.id}/schedules/{schedule_id}',
+		json={'day': 'monday', 'start_time': '18:00:00', 'end_time': '22:00:00', 'repeats': True},
+	)
+	assert response.status_code == status.HTTP_200_OK
+	assert await list_live_offer_ids(client, at) == [str(offer.id)]
+
+	response = await client.delete(f'/api/v1/offers/{offer.id}/schedules/{schedule_id}')
+	assert response.status_code == status.HTTP_204_NO_CONTENT
+	assert await list_live_offer_ids(client, at) == []
+
+
+@pytest.mark.asyncio
+async def test_list_live_offers_bad_request_error(client):
+	response = await client.get('/api/v1/offers/live', params={'at': 'happy hour'})
+
+	assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
 @pytest.mark.asyncio
 async def test_find_offer_by_id(session, client, offer_factory):
-	offer = offer_factory(session, price=12.50, active=True)
-	await session.commit()
+	async with session.begin():
+		offer = offer_factory(session, price=12.50, active=True)
 
 	response = await client.get(f'/api/v1/offers/{offer.id}')
 	data = response.json()
@@ -42,8 +139,8 @@ async def test_find_offer_by_id_not_found_error(client):
 
 @pytest.mark.asyncio
 async def test_create_offer(client, session, product_factory, build_create_payload):
-	product = product_factory(session, name='Pizza Especial')
-	await session.commit()
+	async with session.begin():
+		product = product_factory(session, name='Pizza Especial')
 
 	payload = build_create_payload(product_id=product.id)
 
@@ -70,8 +167,8 @@ async def test_create_offer(client, session, product_factory, build_create_paylo
 async def test_create_offer_bad_request_error(
 	client, session, product_factory, build_create_payload, payload_override
 ):
-	product = product_factory(session)
-	await session.commit()
+	async with session.begin():
+		product = product_factory(session)
 
 	payload = build_create_payload(product_id=product.id)
 	payload.update(payload_override)
@@ -83,8 +180,8 @@ async def test_create_offer_bad_request_error(
 
 @pytest.mark.asyncio
 async def test_update_offer(client, session, offer_factory, build_update_payload):
-	offer = offer_factory(session, price=10.00)
-	await session.commit()
+	async with session.begin():
+		offer = offer_factory(session, price=10.00)
 
 	payload = build_update_payload()
 
@@ -121,8 +218,8 @@ async def test_update_offer_not_found_error(client, build_update_payload):
 async def test_update_offer_bad_request_error(
 	client, session, offer_factory, build_update_payload, payload_override
 ):
-	offer = offer_factory(session, price=15.00)
-	await session.commit()
+	async with session.begin():
+		offer = offer_factory(session, price=15.00)
 
 	payload = build_update_payload()
 	payload.update(payload_override)
@@ -134,8 +231,8 @@ async def test_update_offer_bad_request_error(
 
 @pytest.mark.asyncio
 async def test_delete_offer(client, session, offer_factory):
-	offer = offer_factory(session, price=30.00)
-	await session.commit()
+	async with session.begin():
+		offer = offer_factory(session, price=30.00)
 
 	response = await client.delete(f'/api/v1/offers/{offer.id}')
 
@@ -153,8 +250,8 @@ async def test_delete_offer_not_found_error(client):
 async def test_create_offer_schedule(
 	client, session, offer_factory, build_offer_schedule_create_payload
 ):
-	offer = offer_factory(session, price=20.00)
-	await session.commit()
+	async with session.begin():
+		offer = offer_factory(session, price=20.00)
 
 	payload = build_offer_schedule_create_payload()
 
@@ -193,8 +290,8 @@ async def test_create_offer_schedule_not_found_error(client, build_offer_schedul
 async def test_create_offer_schedule_bad_request_error(
 	client, session, offer_factory, build_offer_schedule_create_payload, payload_override
 ):
-	offer = offer_factory(session)
-	await session.commit()
+	async with session.begin():
+		offer = offer_factory(session)
 
 	payload = build_offer_schedule_create_payload()
 	payload.update(payload_override)
@@ -208,8 +305,8 @@ async def test_create_offer_schedule_bad_request_error(
 async def test_update_offer_schedule(
 	client, session, offer_schedule_factory, build_offer_schedule_update_payload
 ):
-	schedule = offer_schedule_factory(session, day='monday', repeats=True)
-	await session.commit()
+	async with session.begin():
+		schedule = offer_schedule_factory(session, day='monday', repeats=True)
 
 	payload = build_offer_schedule_update_payload()
 
@@ -229,8 +326,8 @@ async def test_update_offer_schedule(
 async def test_update_offer_schedule_not_found_error(
 	client, session, offer_schedule_factory, build_offer_schedule_update_payload
 ):
-	schedule = offer_schedule_factory(session)
-	await session.commit()
+	async with session.begin():
+		schedule = offer_schedule_factory(session)
 
 	payload = build_offer_schedule_update_payload()
 
@@ -239,14 +336,15 @@ async def test_update_offer_schedule_not_found_error(
 	)
 
 	assert response.status_code == status.HTTP_404_NOT_FOUND
+	assert response.json()['error'] == 'offer_schedule_not_found'
 
 
 @pytest.mark.asyncio
 async def test_update_offer_schedule_offer_not_found_error(
 	client, session, offer_schedule_factory, build_offer_schedule_update_payload
 ):
-	schedule = offer_schedule_factory(session)
-	await session.commit()
+	async with session.begin():
+		schedule = offer_schedule_factory(session)
 
 	payload = build_offer_schedule_update_payload()
 
@@ -255,6 +353,7 @@ async def test_update_offer_schedule_offer_not_found_error(
 	)
 
 	assert response.status_code == status.HTTP_404_NOT_FOUND
+	assert response.json()['error'] == 'offer_not_found'
 
 
 @pytest.mark.asyncio
@@ -276,8 +375,8 @@ async def test_update_offer_schedule_offer_not_found_error(
 async def test_update_offer_schedule_bad_request_error(
 	client, session, offer_schedule_factory, build_offer_schedule_update_payload, payload_override
 ):
-	schedule = offer_schedule_factory(session)
-	await session.commit()
+	async with session.begin():
+		schedule = offer_schedule_factory(session)
 
 	payload = build_offer_schedule_update_payload()
 	payload.update(payload_override)
@@ -291,8 +390,8 @@ async def test_update_offer_schedule_bad_request_error(
 
 @pytest.mark.asyncio
 async def test_delete_offer_schedule(client, session, offer_schedule_factory):
-	schedule = offer_schedule_factory(session)
-	await session.commit()
+	async with session.begin():
+		schedule = offer_schedule_factory(session)
 
 	response = await client.delete(f'/api/v1/offers/{schedule.offer_id}/schedules/{schedule.id}')
 
@@ -301,8 +400,8 @@ async def test_delete_offer_schedule(client, session, offer_schedule_factory):
 
 @pytest.mark.asyncio
 async def test_delete_offer_schedule_not_found_error(client, session, offer_schedule_factory):
-	schedule = offer_schedule_factory(session)
-	await session.commit()
+	async with session.begin():
+		schedule = offer_schedule_factory(session)
 
 	response = await client.delete(f'/api/v1/offers/{schedule.offer_id}/schedules/{str(uuid4())}')
 
@@ -311,9 +410,24 @@ async def test_delete_offer_schedule_not_found_error(client, session, offer_sche
 
 @pytest.mark.asyncio
 async def test_delete_offer_schedule_offer_not_found_error(client, session, offer_schedule_factory):
-	schedule = offer_schedule_factory(session)
-	await session.commit()
+	async with session.begin():
+		schedule = offer_schedule_factory(session)
 
 	response = await client.delete(f'/api/v1/offers/{str(uuid4())}/schedules/{schedule.id}')
 
 	assert response.status_code == status.HTTP_404_NOT_FOUND
+	assert response.json()['error'] == 'offer_not_found'
+
+
+@pytest.mark.asyncio
+async def test_delete_offer_schedule_from_another_offer_not_found_error(
+	client, session, offer_factory, offer_schedule_factory
+):
+	async with session.begin():
+		schedule = offer_schedule_factory(session)
+		another_offer = offer_factory(session)
+
+	response = await client.delete(f'/api/v1/offers/{another_offer.id}/schedules/{schedule.id}')
+
+	assert response.status_code == status.HTTP_404_NOT_FOUND
+	assert response.json()['error'] == 'offer_schedule_not_found'
@@ -0,0 +1,48 @@
+import importlib.util
+from datetime import time
+from pathlib import Path
+
+import pytest
+from sqlalchemy import select, text
+
+from src.offers.models import OfferAvailabilityInterval, OfferSchedule
+
+MIGRATION = (
+	Path(__file__).parents[4]
+	/ 'alembic'
+	/ 'versions'
+	/ 'ca45faea1e72_add_offer_availability_intervals_table.py'
+)
+
+
+def load_migration():
+	spec = importlib.util.spec_from_file_location('availability_intervals_migration', MIGRATION)
+	module = importlib.util.module_from_spec(spec)
+	spec.loader.exec_module(module)
+
+	return module
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('repeats, expires', [(True, False), (False, True), (None, True)])
+async def test_backfill_availability_intervals_expiration(session, offer_factory, repeats, expires):
+	async with session.begin():
+		offer = offer_factory(session)
+		session.add(
+			OfferSchedule(offer_id=offer.id, day='monday', start_time=time(18), end_time=time(22))
+		)
+
+	async with session.begin():
+		# The migrations created `repeats` as nullable, unlike the model
+		await session.execute(
+			text('ALTER TABLE offer_schedules ALTER COLUMN repeats DROP NOT NULL')
+		)
+		await session.execute(
+			text('UPDATE offer_schedules SET repeats = :repeats'), {'repeats': repeats}
+		)
+		await session.execute(text(load_migration().BACKFILL_AVAILABILITY_INTERVALS))
+		result = await session.execute(select(OfferAvailabilityInterval.expires_at))
+		expires_at = result.scalars().all()
+
+	assert len(expires_at) == 1
+	assert (expires_at[0] is not None) is expires
@@ -6,11 +6,10 @@ from fastapi import status
 
 @pytest.mark.asyncio
 async def test_get_products(session, client, product_factory):
-	product_factory(session, name='Everton Araujo')
-	product_factory(session, name='Pedro')
-	product_factory(session, name='Cebolinha')
-
-	await session.commit()
+	async with session.begin():
+		product_factory(session, name='Everton Araujo')
+		product_factory(session, name='Pedro')
+		product_factory(session, name='Cebolinha')
 
 	response = await client.get('/api/v1/products')
 	data = response.json()
@@ -23,11 +22,10 @@ async def test_get_products(session, client, product_factory):
 async def test_get_products_filter_by_name(session, client, product_factory):
 	expected_name = 'Saul'
 
-	product_factory(session, name=expected_name)
-	product_factory(session, name=expected_name)
-	product_factory(session, name='Delacruz')
-
-	await session.commit()
+	async with session.begin():
+		product_factory(session, name=expected_name)
+		product_factory(session, name=expected_name)
+		product_factory(session, name='Delacruz')
 
 	response = await client.get(f'/api/v1/products?name={expected_name}')
 	data = response.json()
@@ -37,18 +35,47 @@ async def test_get_products_filter_by_name(session, client, product_factory):
 	assert all(expected_name in product['name'] for product in data)
 
 
+@pytest.mark.asyncio
+async def test_get_products_filter_by_name_case_insensitive(session, client, product_factory):
+	async with session.begin():
+		product_factory(session, name='Pizza Calabresa')
+		product_factory(session, name='PIZZA Margherita')
+		product_factory(session, name='Lasanha')
+
+	response = await client.get('/api/v1/products?name=pizza')
+	data = response.json()
+
+	assert response.status_code == status.HTTP_200_OK
+	assert len(data) == 2
+
+
+@pytest.mark.asyncio
+async def test_get_products_filter_by_name_matches_wildcards_literally(
+	session, client, product_factory
+):
+	async with session.begin():
+		product_factory(session, name='Combo 100% Carioca')
+		product_factory(session, name='Combo 1000 Carioca')
+
+	response = await client.get('/api/v1/products', params={'name': '100%'})
+	data = response.json()
+
+	assert response.status_code == status.HTTP_200_OK
+	assert len(data) == 1
+	assert data[0]['name'] == 'Combo 100% Carioca'
+
+
 @pytest.mark.asyncio
 async def test_get_products_filter_by_category_id(
 	session, client, product_factory, category_factory
 ):
-	first_category = category_factory(session, name='Filipe Luis')
-	second_category = category_factory(session, name='Rodrigo Caio')
-
-	product_factory(session, name='Diego Ribas', category_id=first_category.id)
-	product_factory(session, name='Gabriel Barbosa', category_id=first_category.id)
-	product_factory(session, name='João Gomes', category_id=second_category.id)
+	async with session.begin():
+		first_category = category_factory(session, name='Filipe Luis')
+		second_category = category_factory(session, name='Rodrigo Caio')
 
-	await session.commit()
+		product_factory(session, name='Diego Ribas', category_id=first_category.id)
+		product_factory(session, name='Gabriel Barbosa', category_id=first_category.id)
+		product_factory(session, name='João Gomes', category_id=second_category.id)
 
 	response = await client.get(f'/api/v1/products?category_id={first_category.id}')
 	data = response.json()
@@ -60,8 +87,8 @@ async def test_get_products_filter_by_category_id(
 
 @pytest.mark.asyncio
 async def test_find_product_by_id(session, client, product_factory):
-	product = product_factory(session, name='Michael', price=45.90)
-	await session.commit()
+	async with session.begin():
+		product = product_factory(session, name='Michael', price=45.90)
 
 	response = await client.get(f'/api/v1/products/{product.id}')
 	data = response.json()
@@ -74,10 +101,10 @@ async def test_find_product_by_id(session, client, product_factory):
 
 @pytest.mark.asyncio
 async def test_find_product_by_id_with_offers(session, client, product_factory, offer_factory):
-	product = product_factory(session, name='Ibson', price=60.00)
-	first_offer = offer_factory(session, product_id=product.id, price=10.0)
-	second_offer = offer_factory(session, product_id=product.id, price=15.0)
-	await session.commit()
+	async with session.begin():
+		product = product_factory(session, name='Ibson', price=60.00)
+		first_offer = offer_factory(session, product_id=product.id, price=10.0)
+		second_offer = offer_factory(session, product_id=product.id, price=15.0)
 
 	response = await client.get(f'/api/v1/products/{product.id}')
 	data = response.json()
@@ -93,6 +120,53 @@ async def test_find_product_by_id_with_offers(session, client, product_factory,
 	assert str(second_offer.id) in offer_ids
 
 
+@pytest.mark.asyncio
+async def test_find_product_by_id_not_modified(
+	session, client, product_factory, offer_factory, executed_statements
+):
+	async with session.begin():
+		product = product_factory(session, name='Gerson', price=30.00)
+		offer_factory(session, product_id=product.id, price=20.0)
+
+	first_response = await client.get(f'/api/v1/products/{product.id}')
+	etag = first_response.headers['ETag']
+	executed_statements.clear()
+
+	response = await client.get(f'/api/v1/products/{product.id}', headers={'If-None-Match': etag})
+
+	assert response.status_code == status.HTTP_304_NOT_MODIFIED
+	assert response.headers['ETag'] == etag
+	assert response.content == b''
+	# Only the versions query, without loading the product and its offers
+	assert executed_statements == ['SELECT']
+
+
+@pytest.mark.parametrize('change', ['update_product', 'add_offer', 'update_offer'])
+@pytest.mark.asyncio
+async def test_find_product_by_id_modified(session, client, product_factory, offer_factory, change):
+	async with session.begin():
+		product = product_factory(session, name='Gerson', price=30.00)
+		offer = offer_factory(session, product_id=product.id, price=20.0)
+
+	first_response = await client.get(f'/api/v1/products/{product.id}')
+	etag = first_response.headers['ETag']
+
+	async with session.begin():
+		if change == 'update_product':
+			product.price = 35.0
+		elif change == 'add_offer':
+			offer_factory(session, product_id=product.id, price=25.0)
+		else:
+			offer.active = False
+	session.expunge_all()
+
+	response = await client.get(f'/api/v1/products/{product.id}', headers={'If-None-Match': etag})
+
+	assert response.status_code == status.HTTP_200_OK
+	assert response.headers['ETag'] != etag
+	assert response.json()['id'] == str(product.id)
+
+
 @pytest.mark.asyncio
 async def test_find_product_by_id_not_found_error(client):
 	response = await client.get(f'/api/v1/products/{str(uuid4())}')
@@ -104,9 +178,9 @@ async def test_find_product_by_id_not_found_error(client):
 async def test_create_product(
 	client, session, restaurant_factory, category_factory, build_create_payload
 ):
-	restaurant = restaurant_factory(session, name='Jorge Jesus')
-	category = category_factory(session, name='João de Deus')
-	await session.commit()
+	async with session.begin():
+		restaurant = restaurant_factory(session, name='Jorge Jesus')
+		category = category_factory(session, name='João de Deus')
 
 	payload = build_create_payload(restaurant_id=restaurant.id, category_id=category.id)
 
@@ -141,9 +215,9 @@ async def test_create_product(
 async def test_create_product_bad_request_error(
 	client, session, restaurant_factory, category_factory, build_create_payload, payload_override
 ):
-	restaurant = restaurant_factory(session)
-	category = category_factory(session)
-	await session.commit()
+	async with session.begin():
+		restaurant = restaurant_factory(session)
+		category = category_factory(session)
 
 	payload = build_create_payload(restaurant_id=restaurant.id, category_id=category.id)
 	payload.update(payload_override)
@@ -155,8 +229,8 @@ async def test_create_product_bad_request_error(
 
 @pytest.mark.asyncio
 async def test_update_product(client, session, product_factory, build_update_payload):
-	product = product_factory(session, name='Ayrton Lucas', price=10.00)
-	await session.commit()
+	async with session.begin():
+		product = product_factory(session, name='Ayrton Lucas', price=10.00)
 
 	payload = build_update_payload(
 		restaurant_id=product.restaurant_id,
@@ -171,12 +245,35 @@ async def test_update_product(client, session, product_factory, build_update_pay
 	assert data['price'] == 39.99
 
 
+@pytest.mark.asyncio
+async def test_update_product_in_a_single_statement(
+	client, session, product_factory, build_update_payload, executed_statements
+):
+	async with session.begin():
+		product = product_factory(session, name='Ayrton Lucas', price=10.00)
+	executed_statements.clear()
+	updated_at = product.updated_at
+
+	payload = build_update_payload(
+		restaurant_id=product.restaurant_id,
+		category_id=product.category_id,
+	)
+
+	response = await client.patch(f'/api/v1/products/{product.id}', json=payload)
+	data = response.json()
+
+	assert response.status_code == status.HTTP_200_OK
+	assert data['name'] == 'Alex Sandro'
+	assert data['updated_at'] > updated_at.isoformat()
+	assert executed_statements == ['UPDATE']
+
+
 @pytest.mark.asyncio
 async def test_update_product_not_found_error(
 	client, session, product_factory, build_update_payload
 ):
-	product = product_factory(session)
-	await session.commit()
+	async with session.begin():
+		product = product_factory(session)
 
 	payload = build_update_payload(
 		restaurant_id=product.restaurant_id, category_id=product.category_id
@@ -207,8 +304,8 @@ async def test_update_product_not_found_error(
 async def test_update_product_bad_request_error(
 	client, session, product_factory, build_update_payload, payload_override
 ):
-	product = product_factory(session, name='Vitinho')
-	await session.commit()
+	async with session.begin():
+		product = product_factory(session, name='Vitinho')
 
 	payload = build_update_payload(
 		restaurant_id=product.restaurant_id, category_id=product.category_id
@@ -222,8 +319,8 @@ async def test_update_product_bad_request_error(
 
 @pytest.mark.asyncio
 async def test_delete_product(client, session, product_factory):
-	product = product_factory(session, name='Gerson')
-	await session.commit()
+	async with session.begin():
+		product = product_factory(session, name='Gerson')
 
 	response = await client.delete(f'/api/v1/products/{product.id}')
 
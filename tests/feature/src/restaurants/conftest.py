@@ -2,6 +2,7 @@ from datetime import time
 from uuid import uuid4
 
 import pytest
+from sqlalchemy import event
 
 from src.restaurants.models import RestaurantSchedule
 
@@ -96,3 +97,24 @@ def build_schedule_update_payload():
 		}
 
 	return _build
+
+
+@pytest.fixture
+def fetched_rows(session):
+	"""
+	Count rows fetched from the database driver by SELECT statements.
+	Each executed SELECT appends its row count, so tests can assert both the number
+	of queries and how many rows each one brought back.
+	"""
+	rows: list[int] = []
+
+	def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+		if statement.lstrip().upper().startswith('SELECT'):
+			rows.append(cursor.rowcount)
+
+	engine = session.bind.sync_engine
+	event.listen(engine, 'after_cursor_execute', after_cursor_execute)
+
+	yield rows
+
+	event.remove(engine, 'after_cursor_execute', after_cursor_execute)
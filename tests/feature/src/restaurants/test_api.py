@@ -6,60 +6,257 @@ from fastapi import status
 
 @pytest.mark.asyncio
 async def test_get_restaurants(session, client, restaurant_factory):
-	restaurant_factory(session, name='Arrascaeta')
-	restaurant_factory(session, name='Bruno Henrique')
-	restaurant_factory(session, name='Carrascal')
-
-	await session.commit()
+	async with session.begin():
+		restaurant_factory(session, name='Arrascaeta')
+		restaurant_factory(session, name='Bruno Henrique')
+		restaurant_factory(session, name='Carrascal')
 
 	response = await client.get('/api/v1/restaurants')
 	data = response.json()
 
 	assert response.status_code == 200
-	assert len(data) == 3
+	assert len(data['items']) == 3
+	assert data['next_cursor'] is None
 
 
 @pytest.mark.asyncio
-async def test_get_restaurants_filter_by_name(session, client, restaurant_factory):
-	restaurant_factory(session, name='Arrascaeta')
-	restaurant_factory(session, name='Bruno Henrique')
-	restaurant_factory(session, name='Carrascal')
+async def test_get_restaurants_paginated_with_cursor(session, client, restaurant_factory):
+	async with session.begin():
+		for name in [
+			'Arrascaeta',
+			'Bruno Henrique',
+			'Carrascal',
+			'De La Cruz',
+			'Everton Cebolinha',
+		]:
+			restaurant_factory(session, name=name)
+
+	first_response = await client.get('/api/v1/restaurants?limit=2')
+	first_page = first_response.json()
+
+	assert first_response.status_code == status.HTTP_200_OK
+	assert len(first_page['items']) == 2
+	assert first_page['next_cursor'] is not None
+
+	second_response = await client.get(
+		f'/api/v1/restaurants?limit=2&cursor={first_page["next_cursor"]}'
+	)
+	second_page = second_response.json()
+
+	third_response = await client.get(
+		f'/api/v1/restaurants?limit=2&cursor={second_page["next_cursor"]}'
+	)
+	third_page = third_response.json()
+
+	assert len(second_page['items']) == 2
+	assert len(third_page['items']) == 1
+	assert third_page['next_cursor'] is None
+
+	listed_ids = [r['id'] for page in [first_page, second_page, third_page] for r in page['items']]
+	assert len(set(listed_ids)) == 5
+
+
+@pytest.mark.asyncio
+async def test_get_restaurants_paginated_keeps_filters(session, client, restaurant_factory):
+	async with session.begin():
+		restaurant_factory(session, name='Bruno Henrique')
+		restaurant_factory(session, name='Arrascaeta')
+		restaurant_factory(session, name='Bruno Henrique II')
+		restaurant_factory(session, name='Bruno Henrique III')
+
+	first_page = (await client.get('/api/v1/restaurants?name=Bruno&limit=2')).json()
+	second_page = (
+		await client.get(
+			f'/api/v1/restaurants?name=Bruno&limit=2&cursor={first_page["next_cursor"]}'
+		)
+	).json()
+
+	assert len(first_page['items']) == 2
+	assert len(second_page['items']) == 1
+	assert second_page['next_cursor'] is None
+	assert all('Bruno' in r['name'] for r in first_page['items'] + second_page['items'])
+
+
+@pytest.mark.asyncio
+async def test_get_restaurants_invalid_cursor_error(client):
+	response = await client.get('/api/v1/restaurants?cursor=not-a-valid-cursor')
+	data = response.json()
+
+	assert response.status_code == status.HTTP_400_BAD_REQUEST
+	assert data['error'] == 'invalid_cursor'
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('limit', [0, -1, 101, 'abc'])
+async def test_get_restaurants_invalid_limit_error(client, limit):
+	response = await client.get(f'/api/v1/restaurants?limit={limit}')
 
-	await session.commit()
+	assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+@pytest.mark.asyncio
+async def test_get_restaurants_filter_by_name(session, client, restaurant_factory):
+	async with session.begin():
+		restaurant_factory(session, name='Arrascaeta')
+		restaurant_factory(session, name='Bruno Henrique')
+		restaurant_factory(session, name='Carrascal')
 
 	response = await client.get('/api/v1/restaurants?name=Bruno')
 	data = response.json()
 
 	assert response.status_code == status.HTTP_200_OK
-	assert len(data) == 1
-	assert data[0]['name'] == 'Bruno Henrique'
+	assert len(data['items']) == 1
+	assert data['items'][0]['name'] == 'Bruno Henrique'
+
+
+@pytest.mark.asyncio
+async def test_get_restaurants_filter_by_name_case_insensitive(session, client, restaurant_factory):
+	async with session.begin():
+		restaurant_factory(session, name='Arrascaeta')
+		restaurant_factory(session, name='Bruno Henrique')
+		restaurant_factory(session, name='Carrascal')
+
+	response = await client.get('/api/v1/restaurants?name=bRUNO')
+	data = response.json()
+
+	assert response.status_code == status.HTTP_200_OK
+	assert len(data['items']) == 1
+	assert data['items'][0]['name'] == 'Bruno Henrique'
 
 
 @pytest.mark.asyncio
 async def test_get_restaurants_filter_by_owner_id(
 	session, client, restaurant_factory, user_factory
 ):
-	first_owner = user_factory(session, email='filipe@test.com')
-	second_owner = user_factory(session, email='luis@test.com')
+	async with session.begin():
+		first_owner = user_factory(session, email='filipe@test.com')
+		second_owner = user_factory(session, email='luis@test.com')
 
-	restaurant_factory(session, name='Arrascaeta', owner_id=first_owner.id)
-	restaurant_factory(session, name='Bruno Henrique', owner_id=second_owner.id)
-	restaurant_factory(session, name='Carrascal', owner_id=first_owner.id)
-
-	await session.commit()
+		restaurant_factory(session, name='Arrascaeta', owner_id=first_owner.id)
+		restaurant_factory(session, name='Bruno Henrique', owner_id=second_owner.id)
+		restaurant_factory(session, name='Carrascal', owner_id=first_owner.id)
 
 	response = await client.get(f'/api/v1/restaurants?owner_id={first_owner.id}')
 	data = response.json()
 
 	assert response.status_code == status.HTTP_200_OK
-	assert len(data) == 2
-	assert all(str(restaurant['owner_id']) == str(first_owner.id) for restaurant in data)
+	assert len(data['items']) == 2
+	assert all(str(restaurant['owner_id']) == str(first_owner.id) for restaurant in data['items'])
+
+
+async def create_schedule(
+	client, restaurant_id, day_type, start_day, end_day, start_time, end_time
+):
+	response = await client.post(
+		f'/api/v1/restaurants/{restaurant_id}/schedules',
+		json={
+			'day_type': day_type,
+			'start_day': start_day,
+			'end_day': end_day,
+			'start_time': start_time,
+			'end_time': end_time,
+		},
+	)
+	assert response.status_code == status.HTTP_201_CREATED
+
+	return response.json()['id']
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+	'open_at, expected_names',
+	[
+		# Friday afternoon
+		('2026-01-30T15:00:00', ['Arrascaeta']),
+		# Friday night, overnight schedule
+		('2026-01-30T23:30:00', ['Bruno Henrique']),
+		# Saturday early morning, still open since friday
+		('2026-01-31T01:59:00', ['Bruno Henrique']),
+		# Sunday night, crossing the end of the week
+		('2026-02-01T23:00:00', ['Carrascal']),
+		# Monday early morning, still open since sunday
+		('2026-02-02T00:30:00', ['Carrascal']),
+		# Wednesday early morning, only the holiday schedule covers it
+		('2026-01-28T03:00:00', []),
+	],
+)
+async def test_get_restaurants_filter_by_open_at(
+	session, client, restaurant_factory, open_at, expected_names
+):
+	async with session.begin():
+		arrascaeta = restaurant_factory(session, name='Arrascaeta')
+		bruno_henrique = restaurant_factory(session, name='Bruno Henrique')
+		carrascal = restaurant_factory(session, name='Carrascal')
+
+	await create_schedule(
+		client, arrascaeta.id, 'weekday', 'monday', 'friday', '08:00:00', '18:00:00'
+	)
+	await create_schedule(
+		client, bruno_henrique.id, 'weekend', 'friday', 'saturday', '18:00:00', '02:00:00'
+	)
+	await create_schedule(
+		client, carrascal.id, 'weekend', 'sunday', 'sunday', '20:00:00', '01:00:00'
+	)
+	# Holidays have no weekdays, so they never match
+	await create_schedule(
+		client, carrascal.id, 'holiday', 'wednesday', 'wednesday', '02:00:00', '04:00:00'
+	)
+
+	response = await client.get('/api/v1/restaurants', params={'open_at': open_at})
+	data = response.json()
+
+	assert response.status_code == status.HTTP_200_OK
+	assert sorted(item['name'] for item in data['items']) == expected_names
+
+
+@pytest.mark.asyncio
+async def test_get_restaurants_filter_by_open_at_follows_schedule_changes(
+	session, client, restaurant_factory
+):
+	async with session.begin():
+		restaurant = restaurant_factory(session, name='Arrascaeta')
+
+	schedule_id = await create_schedule(
+		client, restaurant.id, 'weekday', 'monday', 'friday', '09:00:00', '18:00:00'
+	)
+	params = {'open_at': '2026-01-26T20:00:00'}
+
+	response = await client.get('/api/v1/restaurants', params=params)
+	assert response.json()['items'] == []
+
+	response = await client.patch(
+		f'/api/v1/restaurants/{restaurant.id}/schedules/{schedule_id}',
+		json={
+			'day_type': 'weekday',
+			'start_day': 'monday',
+			'end_day': 'friday',
+			'start_time': '18:00:00',
+			'end_time': '23:00:00',
+		},
+	)
+	assert response.status_code == status.HTTP_200_OK
+
+	response = await client.get('/api/v1/restaurants', params=params)
+	assert [item['id'] for item in response.json()['items']] == [str(restaurant.id)]
+
+	response = await client.delete(f'/api/v1/restaurants/{restaurant.id}/schedules/{schedule_id}')
+	assert response.status_code == status.HTTP_204_NO_CONTENT
+
+	response = await client.get('/api/v1/restaurants', params=params)
+	assert response.json()['items'] == []
+
+
+@pytest.mark.asyncio
+async def test_get_restaurants_filter_by_open_at_bad_request_error(client):
+	response = await client.get('/api/v1/restaurants', params={'open_at': 'friday night'})
+
+	assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
 
 
 @pytest.mark.asyncio
 async def test_find_restaurant_by_id(client, session, restaurant_factory):
-	restaurant = restaurant_factory(session, name='Varela')
-	await session.commit()
+	async with session.begin():
+		restaurant = restaurant_factory(session, name='Varela')
 
 	response = await client.get(f'/api/v1/restaurants/{restaurant.id}')
 	data = response.json()
@@ -69,6 +266,110 @@ async def test_find_restaurant_by_id(client, session, restaurant_factory):
 	assert data['name'] == 'Varela'
 
 
+@pytest.mark.asyncio
+async def test_find_restaurant_by_id_loads_only_products(
+	client, session, restaurant_factory, product_factory, restaurant_schedule_factory, fetched_rows
+):
+	async with session.begin():
+		restaurant = restaurant_factory(session, name='Jorge Jesus')
+		for _ in range(50):
+			product_factory(session, restaurant_id=restaurant.id)
+		for _ in range(3):
+			restaurant_schedule_factory(session, restaurant_id=restaurant.id)
+	session.expunge_all()
+
+	response = await client.get(f'/api/v1/restaurants/{restaurant.id}')
+	data = response.json()
+
+	assert response.status_code == status.HTTP_200_OK
+	assert len(data['products']) == 50
+	# One row for the restaurant and one per product, instead of a 50 x 3 cartesian join
+	assert fetched_rows == [1, 50]
+
+
+@pytest.mark.asyncio
+async def test_get_restaurants_loads_only_schedules(
+	client, session, restaurant_factory, product_factory, restaurant_schedule_factory, fetched_rows
+):
+	async with session.begin():
+		restaurant = restaurant_factory(session, name='Jorge Jesus')
+		for _ in range(50):
+			product_factory(session, restaurant_id=restaurant.id)
+		for _ in range(3):
+			restaurant_schedule_factory(session, restaurant_id=restaurant.id)
+	session.expunge_all()
+
+	response = await client.get('/api/v1/restaurants')
+	data = response.json()
+
+	assert response.status_code == status.HTTP_200_OK
+	assert len(data['items'][0]['schedules']) == 3
+	assert fetched_rows == [1, 3]
+
+
+@pytest.mark.asyncio
+async def test_find_restaurant_by_id_not_modified(
+	client, session, restaurant_factory, product_factory, executed_statements
+):
+	async with session.begin():
+		restaurant = restaurant_factory(session, name='Filipe Luis')
+		product_factory(session, restaurant_id=restaurant.id)
+
+	first_response = await client.get(f'/api/v1/restaurants/{restaurant.id}')
+	etag = first_response.headers['ETag']
+	executed_statements.clear()
+
+	response = await client.get(
+		f'/api/v1/restaurants/{restaurant.id}', headers={'If-None-Match': etag}
+	)
+
+	assert etag.startswith('W/')
+	assert response.status_code == status.HTTP_304_NOT_MODIFIED
+	assert response.headers['ETag'] == etag
+	assert response.content == b''
+	# Only the versions query, without loading the restaurant and its products
+	assert executed_statements == ['SELECT']
+
+
+@pytest.mark.parametrize('change', ['update_restaurant', 'add_product', 'update_product'])
+@pytest.mark.asyncio
+async def test_find_restaurant_by_id_modified(
+	client, session, restaurant_factory, product_factory, change
+):
+	async with session.begin():
+		restaurant = restaurant_factory(session, name='Filipe Luis')
+		product = product_factory(session, restaurant_id=restaurant.id)
+
+	first_response = await client.get(f'/api/v1/restaurants/{restaurant.id}')
+	etag = first_response.headers['ETag']
+
+	async with session.begin():
+		if change == 'update_restaurant':
+			restaurant.name = 'Filipinho'
+		elif change == 'add_product':
+			product_factory(session, restaurant_id=restaurant.id)
+		else:
+			product.price = 99.9
+	session.expunge_all()
+
+	response = await client.get(
+		f'/api/v1/restaurants/{restaurant.id}', headers={'If-None-Match': etag}
+	)
+
+	assert response.status_code == status.HTTP_200_OK
+	assert response.headers['ETag'] != etag
+	assert response.json()['id'] == str(restaurant.id)
+
+
+@pytest.mark.asyncio
+async def test_find_restaurant_by_id_not_modified_not_found_error(client):
+	response = await client.get(
+		f'/api/v1/restaurants/{str(uuid4())}', headers={'If-None-Match': 'W/"etag"'}
+	)
+
+	assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
 @pytest.mark.asyncio
 async def test_find_restaurant_by_id_not_found_error(client):
 	response = await client.get(f'/api/v1/restaurants/{str(uuid4())}')
@@ -78,8 +379,8 @@ async def test_find_restaurant_by_id_not_found_error(client):
 
 @pytest.mark.asyncio
 async def test_create_restaurant(client, session, user_factory, build_create_payload):
-	owner = user_factory(session, email='pulgar@test.com')
-	await session.commit()
+	async with session.begin():
+		owner = user_factory(session, email='pulgar@test.com')
 
 	payload = build_create_payload(owner_id=owner.id)
 
@@ -119,8 +420,8 @@ async def test_create_restaurant(client, session, user_factory, build_create_pay
 async def test_create_restaurant_bad_request_error(
 	client, session, user_factory, build_create_payload, payload_override
 ):
-	owner = user_factory(session, email=f'owner_{id(payload_override)}@test.com')
-	await session.commit()
+	async with session.begin():
+		owner = user_factory(session, email=f'owner_{id(payload_override)}@test.com')
 
 	payload = build_create_payload(owner_id=owner.id)
 	payload.update(payload_override)
@@ -132,8 +433,8 @@ async def test_create_restaurant_bad_request_error(
 
 @pytest.mark.asyncio
 async def test_update_restaurant(client, session, restaurant_factory, build_update_payload):
-	restaurant = restaurant_factory(session, name='João Gomes')
-	await session.commit()
+	async with session.begin():
+		restaurant = restaurant_factory(session, name='João Gomes')
 
 	payload = build_update_payload(owner_id=restaurant.owner_id)
 
@@ -149,8 +450,8 @@ async def test_update_restaurant(client, session, restaurant_factory, build_upda
 async def test_update_restaurant_not_found_error(
 	client, session, restaurant_factory, build_update_payload
 ):
-	restaurant = restaurant_factory(session, name='João Gomes')
-	await session.commit()
+	async with session.begin():
+		restaurant = restaurant_factory(session, name='João Gomes')
 
 	payload = build_update_payload(owner_id=restaurant.owner_id)
 
@@ -187,8 +488,8 @@ async def test_update_restaurant_not_found_error(
 async def test_update_restaurant_bad_request_error(
 	client, session, restaurant_factory, build_update_payload, payload_override
 ):
-	restaurant = restaurant_factory(session, name='João Gomes')
-	await session.commit()
+	async with session.begin():
+		restaurant = restaurant_factory(session, name='João Gomes')
 
 	payload = build_update_payload(owner_id=restaurant.owner_id)
 	payload.update(payload_override)
@@ -200,8 +501,8 @@ async def test_update_restaurant_bad_request_error(
 
 @pytest.mark.asyncio
 async def test_delete_restaurant(client, session, restaurant_factory):
-	restaurant = restaurant_factory(session, name='To Be Deleted')
-	await session.commit()
+	async with session.begin():
+		restaurant = restaurant_factory(session, name='To Be Deleted')
 
 	response = await client.delete(f'/api/v1/restaurants/{restaurant.id}')
 
@@ -215,12 +516,26 @@ async def test_delete_restaurant_not_found_error(client):
 	assert response.status_code == status.HTTP_404_NOT_FOUND
 
 
+@pytest.mark.asyncio
+async def test_delete_restaurant_in_a_single_statement(
+	client, session, restaurant_factory, executed_statements
+):
+	async with session.begin():
+		restaurant = restaurant_factory(session, name='To Be Deleted')
+	executed_statements.clear()
+
+	response = await client.delete(f'/api/v1/restaurants/{restaurant.id}')
+
+	assert response.status_code == status.HTTP_204_NO_CONTENT
+	assert executed_statements == ['DELETE']
+
+
 @pytest.mark.asyncio
 async def test_create_restaurant_schedules(
 	client, session, restaurant_factory, build_schedule_create_payload
 ):
-	restaurant = restaurant_factory(session, name='Léo Ortiz')
-	await session.commit()
+	async with session.begin():
+		restaurant = restaurant_factory(session, name='Léo Ortiz')
 
 	payload = build_schedule_create_payload()
 
@@ -235,8 +550,8 @@ async def test_create_restaurant_schedules(
 async def test_create_restaurant_schedules_not_found_error(
 	client, session, restaurant_factory, build_schedule_create_payload
 ):
-	_ = restaurant_factory(session, name='Léo Pereira')
-	await session.commit()
+	async with session.begin():
+		_ = restaurant_factory(session, name='Léo Pereira')
 
 	payload = build_schedule_create_payload()
 
@@ -264,8 +579,8 @@ async def test_create_restaurant_schedules_not_found_error(
 async def test_create_restaurant_schedules_bad_request_error(
 	client, session, restaurant_factory, build_schedule_create_payload, payload_override
 ):
-	restaurant = restaurant_factory(session, name='Léo Pereira')
-	await session.commit()
+	async with session.begin():
+		restaurant = restaurant_factory(session, name='Léo Pereira')
 
 	payload = build_schedule_create_payload()
 	payload.update(payload_override)
@@ -279,13 +594,13 @@ async def test_create_restaurant_schedules_bad_request_error(
 async def test_create_restaurant_schedules_limit_error(
 	client, session, restaurant_factory, restaurant_schedule_factory, build_schedule_create_payload
 ):
-	restaurant = restaurant_factory(session, name='Adriano Imperador')
-	await session.commit()
+	async with session.begin():
+		restaurant = restaurant_factory(session, name='Adriano Imperador')
 
-	restaurant_schedule_factory(session, restaurant_id=restaurant.id, day_type='weekday')
-	restaurant_schedule_factory(session, restaurant_id=restaurant.id, day_type='weekend')
-	restaurant_schedule_factory(session, restaurant_id=restaurant.id, day_type='holiday')
-	await session.commit()
+	async with session.begin():
+		restaurant_schedule_factory(session, restaurant_id=restaurant.id, day_type='weekday')
+		restaurant_schedule_factory(session, restaurant_id=restaurant.id, day_type='weekend')
+		restaurant_schedule_factory(session, restaurant_id=restaurant.id, day_type='holiday')
 
 	payload = build_schedule_create_payload()
 	payload.update({'restaurant_id': str(restaurant.id)})
@@ -301,8 +616,8 @@ async def test_create_restaurant_schedules_limit_error(
 async def test_update_restaurant_schedule(
 	client, session, restaurant_schedule_factory, build_schedule_update_payload
 ):
-	schedule = restaurant_schedule_factory(session, day_type='weekday')
-	await session.commit()
+	async with session.begin():
+		schedule = restaurant_schedule_factory(session, day_type='weekday')
 
 	payload = build_schedule_update_payload()
 
@@ -319,12 +634,31 @@ async def test_update_restaurant_schedule(
 	assert data['end_time'] == '23:00:00'
 
 
+@pytest.mark.asyncio
+async def test_update_restaurant_schedule_without_selecting_it(
+	client, session, restaurant_schedule_factory, build_schedule_update_payload, executed_statements
+):
+	async with session.begin():
+		schedule = restaurant_schedule_factory(session, day_type='weekday')
+	executed_statements.clear()
+
+	payload = build_schedule_update_payload()
+
+	response = await client.patch(
+		f'/api/v1/restaurants/{schedule.restaurant_id}/schedules/{schedule.id}', json=payload
+	)
+
+	assert response.status_code == status.HTTP_200_OK
+	# The schedule update, then its open intervals rebuild
+	assert executed_statements == ['UPDATE', 'DELETE', 'INSERT']
+
+
 @pytest.mark.asyncio
 async def test_update_restaurant_schedule_not_found_error(
 	client, session, restaurant_schedule_factory, build_schedule_update_payload
 ):
-	schedule = restaurant_schedule_factory(session, day_type='weekday')
-	await session.commit()
+	async with session.begin():
+		schedule = restaurant_schedule_factory(session, day_type='weekday')
 
 	payload = build_schedule_update_payload()
 
@@ -333,14 +667,15 @@ async def test_update_restaurant_schedule_not_found_error(
 	)
 
 	assert response.status_code == status.HTTP_404_NOT_FOUND
+	assert response.json()['error'] == 'restaurant_schedule_not_found'
 
 
 @pytest.mark.asyncio
 async def test_update_restaurant_schedule_restaurant_not_found_error(
 	client, session, restaurant_schedule_factory, build_schedule_update_payload
 ):
-	schedule = restaurant_schedule_factory(session, day_type='weekday')
-	await session.commit()
+	async with session.begin():
+		schedule = restaurant_schedule_factory(session, day_type='weekday')
 
 	payload = build_schedule_update_payload()
 
@@ -349,6 +684,7 @@ async def test_update_restaurant_schedule_restaurant_not_found_error(
 	)
 
 	assert response.status_code == status.HTTP_404_NOT_FOUND
+	assert response.json()['error'] == 'restaurant_not_found'
 
 
 @pytest.mark.asyncio
@@ -370,8 +706,8 @@ async def test_update_restaurant_schedule_restaurant_not_found_error(
 async def test_update_restaurant_schedule_bad_request_error(
 	client, session, restaurant_schedule_factory, build_schedule_update_payload, payload_override
 ):
-	schedule = restaurant_schedule_factory(session, day_type='weekday')
-	await session.commit()
+	async with session.begin():
+		schedule = restaurant_schedule_factory(session, day_type='weekday')
 
 	payload = build_schedule_update_payload()
 	payload.update(payload_override)
@@ -385,8 +721,8 @@ async def test_update_restaurant_schedule_bad_request_error(
 
 @pytest.mark.asyncio
 async def test_delete_restaurant_schedule(client, session, restaurant_schedule_factory):
-	schedule = restaurant_schedule_factory(session, day_type='weekday')
-	await session.commit()
+	async with session.begin():
+		schedule = restaurant_schedule_factory(session, day_type='weekday')
 
 	response = await client.delete(
 		f'/api/v1/restaurants/{schedule.restaurant_id}/schedules/{schedule.id}'
@@ -399,8 +735,8 @@ async def test_delete_restaurant_schedule(client, session, restaurant_schedule_f
 async def test_delete_restaurant_schedule_not_found_error(
 	client, session, restaurant_schedule_factory
 ):
-	schedule = restaurant_schedule_factory(session, day_type='weekday')
-	await session.commit()
+	async with session.begin():
+		schedule = restaurant_schedule_factory(session, day_type='weekday')
 
 	response = await client.delete(
 		f'/api/v1/restaurants/{schedule.restaurant_id}/schedules/{str(uuid4())}'
@@ -413,9 +749,26 @@ async def test_delete_restaurant_schedule_not_found_error(
 async def test_delete_restaurant_schedule_restaurant_not_found_error(
 	client, session, restaurant_schedule_factory
 ):
-	schedule = restaurant_schedule_factory(session, day_type='weekday')
-	await session.commit()
+	async with session.begin():
+		schedule = restaurant_schedule_factory(session, day_type='weekday')
 
 	response = await client.delete(f'/api/v1/restaurants/{str(uuid4())}/schedules/{schedule.id}')
 
 	assert response.status_code == status.HTTP_404_NOT_FOUND
+	assert response.json()['error'] == 'restaurant_not_found'
+
+
+@pytest.mark.asyncio
+async def test_delete_restaurant_schedule_from_another_restaurant_not_found_error(
+	client, session, restaurant_factory, restaurant_schedule_factory
+):
+	async with session.begin():
+		schedule = restaurant_schedule_factory(session, day_type='weekday')
+		another_restaurant = restaurant_factory(session, name='Vitão')
+
+	response = await client.delete(
+		f'/api/v1/restaurants/{another_restaurant.id}/schedules/{schedule.id}'
+	)
+
+	assert response.status_code == status.HTTP_404_NOT_FOUND
+	assert response.json()['error'] == 'restaurant_schedule_not_found'
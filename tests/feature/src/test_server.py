@@ -0,0 +1,76 @@
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+
+import httpx
+import pytest
+
+REQUESTS = 20
+
+
+def free_port():
+	with socket.socket() as sock:
+		sock.bind(('localhost', 0))
+		return sock.getsockname()[1]
+
+
+def wait_until_up(base_url, timeout=30):
+	"""Workers import the app on start, so poll until they answer"""
+	for _ in range(int(timeout / 0.1)):
+		try:
+			httpx.get(f'{base_url}/ping')
+			return
+		except httpx.TransportError:
+			time.sleep(0.1)
+
+	raise AssertionError('API not up before the timeout')
+
+
+@pytest.fixture
+def server():
+	"""The launcher with two workers, each replaced after a few requests"""
+	port = free_port()
+	env = {
+		**os.environ,
+		'SERVER_MAX_REQUESTS': '3',
+		'SERVER_MAX_REQUESTS_JITTER': '0',
+		'DB_CHECK_FK_INDEXES': 'False',
+		'CACHE_INVALIDATION_ENABLED': 'False',
+		'LOG_LEVEL': 'WARNING',
+	}
+	env.pop('PROMETHEUS_MULTIPROC_DIR', None)
+	process = subprocess.Popen(
+		[sys.executable, '-m', 'src.server', '--host', 'localhost', '--port', str(port)]
+		+ ['--workers', '2'],
+		env=env,
+		stdout=subprocess.DEVNULL,
+		stderr=subprocess.PIPE,
+		text=True,
+	)
+	base_url = f'http://localhost:{port}'
+	wait_until_up(base_url)
+
+	yield base_url, process
+
+	if process.poll() is None:
+		process.kill()
+		process.wait()
+
+
+def test_workers_recycled_without_failing_requests(server):
+	base_url, process = server
+
+	# A new connection per request, spread among the workers
+	for _ in range(REQUESTS):
+		response = httpx.get(f'{base_url}/ping', timeout=10)
+		assert response.status_code == 200
+
+	process.send_signal(signal.SIGTERM)
+	_, logs = process.communicate(timeout=60)
+
+	assert process.returncode == 0
+	assert 'Starting 2 workers' in logs
+	assert 'exited with code 0, starting a new one' in logs
@@ -6,11 +6,10 @@ from fastapi import status
 
 @pytest.mark.asyncio
 async def test_list_users(session, client, user_factory):
-	user_factory(session, first_name='Gabigol', last_name='Barbosa')
-	user_factory(session, first_name='Pedro', last_name='Guilherme')
-	user_factory(session, first_name='Giorgian', last_name='De Arrascaeta')
-
-	await session.commit()
+	async with session.begin():
+		user_factory(session, first_name='Gabigol', last_name='Barbosa')
+		user_factory(session, first_name='Pedro', last_name='Guilherme')
+		user_factory(session, first_name='Giorgian', last_name='De Arrascaeta')
 
 	response = await client.get('/api/v1/users')
 	data = response.json()
@@ -21,8 +20,10 @@ async def test_list_users(session, client, user_factory):
 
 @pytest.mark.asyncio
 async def test_find_user_by_id(session, client, user_factory):
-	user = user_factory(session, first_name='Bruno', last_name='Henrique', email='bruno@test.com')
-	await session.commit()
+	async with session.begin():
+		user = user_factory(
+			session, first_name='Bruno', last_name='Henrique', email='bruno@test.com'
+		)
 
 	response = await client.get(f'/api/v1/users/{user.id}')
 	data = response.json()
@@ -37,10 +38,10 @@ async def test_find_user_by_id(session, client, user_factory):
 
 @pytest.mark.asyncio
 async def test_find_user_by_id_with_restaurants(session, client, user_factory, restaurant_factory):
-	user = user_factory(session, first_name='Ronaldo', last_name='Angelim')
-	first_restaurant = restaurant_factory(session, name='Ninho', owner_id=user.id)
-	second_restaurant = restaurant_factory(session, name='Do Urubu', owner_id=user.id)
-	await session.commit()
+	async with session.begin():
+		user = user_factory(session, first_name='Ronaldo', last_name='Angelim')
+		first_restaurant = restaurant_factory(session, name='Ninho', owner_id=user.id)
+		second_restaurant = restaurant_factory(session, name='Do Urubu', owner_id=user.id)
 
 	response = await client.get(f'/api/v1/users/{user.id}')
 	data = response.json()
@@ -107,8 +108,8 @@ async def test_create_user_bad_request_error(client, build_create_payload, paylo
 
 @pytest.mark.asyncio
 async def test_update_user(client, session, user_factory, build_update_payload):
-	user = user_factory(session, first_name='Everton', last_name='Ribeiro')
-	await session.commit()
+	async with session.begin():
+		user = user_factory(session, first_name='Everton', last_name='Ribeiro')
 
 	payload = build_update_payload()
 
@@ -144,8 +145,8 @@ async def test_update_user_not_found_error(client, build_update_payload):
 async def test_update_user_bad_request_error(
 	client, session, user_factory, build_update_payload, payload_override
 ):
-	user = user_factory(session, first_name='Diego', last_name='Alves')
-	await session.commit()
+	async with session.begin():
+		user = user_factory(session, first_name='Diego', last_name='Alves')
 
 	payload = build_update_payload()
 	payload.update(payload_override)
@@ -157,8 +158,8 @@ async def test_update_user_bad_request_error(
 
 @pytest.mark.asyncio
 async def test_delete_user(client, session, user_factory):
-	user = user_factory(session, first_name='Rodrigo', last_name='Caio')
-	await session.commit()
+	async with session.begin():
+		user = user_factory(session, first_name='Rodrigo', last_name='Caio')
 
 	response = await client.delete(f'/api/v1/users/{user.id}')
 
@@ -0,0 +1,15 @@
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_metrics_exports_database_pool_usage(client):
+	response = await client.get('/metrics')
+
+	assert response.status_code == 200
+	for metric in (
+		'db_pool_size',
+		'db_pool_connections_checked_out',
+		'db_pool_connections_idle',
+		'db_pool_connections_overflow',
+	):
+		assert f'\n{metric} ' in response.text
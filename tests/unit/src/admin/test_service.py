@@ -0,0 +1,79 @@
+import asyncio
+import sys
+import threading
+from collections import Counter
+
+import pytest
+
+from src.admin.exceptions import ProfilerBusyError
+from src.admin.service import ProfilerService, collapse, format_collapsed, sample_stacks
+
+
+def test_collapse():
+	def inner():
+		return collapse(sys._getframe())
+
+	stack = inner().split(';')
+
+	assert stack[-1].startswith('inner (')
+	assert stack[-2].startswith('test_collapse (')
+	assert __file__ in stack[-1]
+
+
+def test_sample_stacks():
+	stop = threading.Event()
+
+	def spin():
+		while not stop.is_set():
+			pass
+
+	thread = threading.Thread(target=spin)
+	thread.start()
+	try:
+		stacks = sample_stacks(thread.ident, seconds=0.05, interval=0.005)
+	finally:
+		stop.set()
+		thread.join()
+
+	assert sum(stacks.values()) > 1
+	assert all('spin (' in stack for stack in stacks)
+
+
+def test_sample_stacks_of_finished_thread():
+	thread = threading.Thread(target=lambda: None)
+	thread.start()
+	thread.join()
+
+	assert sample_stacks(thread.ident, seconds=1, interval=0.005) == Counter()
+
+
+def test_format_collapsed():
+	stacks = Counter({'main;serve': 2, 'main;serve;list': 5})
+
+	assert format_collapsed(stacks) == 'main;serve;list 5\nmain;serve 2\n'
+
+
+@pytest.mark.asyncio
+async def test_profile_event_loop():
+	service = ProfilerService()
+
+	collapsed = await service.profile(seconds=0.05, interval=0.005)
+
+	lines = collapsed.splitlines()
+	assert lines
+	# Samples are taken from the event loop thread, waiting on the profile to end
+	assert all('_run_once' in line for line in lines)
+	assert all(line.rsplit(' ', 1)[1].isdigit() for line in lines)
+
+
+@pytest.mark.asyncio
+async def test_profile_one_at_a_time():
+	service = ProfilerService()
+	running = asyncio.create_task(service.profile(seconds=0.05, interval=0.005))
+	await asyncio.sleep(0)
+
+	with pytest.raises(ProfilerBusyError):
+		await service.profile(seconds=0.05, interval=0.005)
+
+	await running
+	assert await service.profile(seconds=0.01, interval=0.005)
@@ -10,6 +10,7 @@ from src.categories.schemas import (
 	CategorySchema,
 )
 from src.categories.service import CategoryService
+from src.core.cache import TTLCache
 
 
 @pytest.fixture
@@ -18,8 +19,13 @@ def mock_category_repository():
 
 
 @pytest.fixture
-def category_service(mock_category_repository):
-	return CategoryService(repository=mock_category_repository)
+def categories_cache():
+	return TTLCache(name='categories', ttl_seconds=60, max_size=16)
+
+
+@pytest.fixture
+def category_service(mock_category_repository, categories_cache):
+	return CategoryService(repository=mock_category_repository, cache=categories_cache)
 
 
 @pytest.fixture
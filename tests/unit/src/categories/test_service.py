@@ -35,6 +35,53 @@ async def test_list_categories_internal_error(category_service, mock_category_re
 	mock_category_repository.list.assert_awaited_once()
 
 
+@pytest.mark.asyncio
+async def test_list_categories_from_cache(
+	category_service, mock_category_repository, sample_category_schema
+):
+	mock_category_repository.list = AsyncMock(return_value=[sample_category_schema])
+
+	await category_service.list()
+	result = await category_service.list()
+
+	assert [category.id for category in result] == [sample_category_schema.id]
+
+	mock_category_repository.list.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_list_categories_internal_error_not_cached(
+	category_service, mock_category_repository, sample_category_schema
+):
+	mock_category_repository.list = AsyncMock(
+		side_effect=[Exception('Ih! Deu ruim!'), [sample_category_schema]]
+	)
+
+	with pytest.raises(CategoriesInternalError):
+		await category_service.list()
+	result = await category_service.list()
+
+	assert len(result) == 1
+	assert mock_category_repository.list.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_create_category_invalidates_cache(
+	category_service, mock_category_repository, categories_cache, sample_category_schema
+):
+	mock_category_repository.list = AsyncMock(return_value=[sample_category_schema])
+	mock_category_repository.create = AsyncMock(return_value=uuid4())
+
+	await category_service.list()
+	await category_service.create(category=CreateCategorySchema(name='Pizza'))
+
+	assert len(categories_cache) == 0
+
+	await category_service.list()
+
+	assert mock_category_repository.list.await_count == 2
+
+
 @pytest.mark.asyncio
 async def test_create_category_success(category_service, mock_category_repository):
 	category_id = uuid4()
@@ -69,33 +116,44 @@ async def test_create_category_internal_error(category_service, mock_category_re
 async def test_delete_category_success(
 	category_service, mock_category_repository, sample_category_schema
 ):
-	mock_category_repository.get = AsyncMock(return_value=sample_category_schema)
 	mock_category_repository.delete = AsyncMock()
 
 	await category_service.delete(id=sample_category_schema.id)
 
-	mock_category_repository.get.assert_awaited_once_with(sample_category_schema.id)
-	mock_category_repository.delete.assert_awaited_once_with(sample_category_schema)
+	mock_category_repository.delete.assert_awaited_once_with(sample_category_schema.id)
+	mock_category_repository.get.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_delete_category_invalidates_cache(
+	category_service, mock_category_repository, categories_cache, sample_category_schema
+):
+	mock_category_repository.list = AsyncMock(return_value=[sample_category_schema])
+	mock_category_repository.delete = AsyncMock()
+
+	await category_service.list()
+	await category_service.delete(id=sample_category_schema.id)
+
+	assert len(categories_cache) == 0
 
 
 @pytest.mark.asyncio
 async def test_delete_category_not_found(category_service, mock_category_repository):
 	category_id = uuid4()
-	mock_category_repository.get = AsyncMock(
+	mock_category_repository.delete = AsyncMock(
 		side_effect=CategoryNotFoundError(category_id=str(category_id))
 	)
 
 	with pytest.raises(CategoryNotFoundError):
 		await category_service.delete(id=category_id)
 
-	mock_category_repository.get.assert_awaited_once_with(category_id)
+	mock_category_repository.delete.assert_awaited_once_with(category_id)
 
 
 @pytest.mark.asyncio
 async def test_delete_category_internal_error(
 	category_service, mock_category_repository, sample_category_schema
 ):
-	mock_category_repository.get = AsyncMock(return_value=sample_category_schema)
 	mock_category_repository.delete = AsyncMock(side_effect=Exception('Ih! Deu ruim!'))
 
 	with pytest.raises(CategoriesInternalError) as exc_info:
@@ -0,0 +1,74 @@
+import logging
+import queue
+import time
+
+import pytest
+import structlog
+from prometheus_client import REGISTRY
+
+from src.core.logging.handlers import BoundedQueueHandler
+
+
+def build_record(msg, *args, level=logging.INFO):
+	return logging.LogRecord('rafood-test', level, __file__, 1, msg, args, None)
+
+
+def dropped(level):
+	return REGISTRY.get_sample_value('log_records_dropped_total', {'level': level}) or 0
+
+
+@pytest.fixture
+def request_context():
+	structlog.contextvars.bind_contextvars(request_id='flamengo-2019')
+
+	yield
+
+	structlog.contextvars.clear_contextvars()
+
+
+def test_prepare_keeps_structlog_records(request_context):
+	event_dict = {'event': 'Called', 'request_id': 'flamengo-2019'}
+	record = build_record(event_dict)
+	handler = BoundedQueueHandler(queue.Queue(), full_policy='drop', block_timeout=0)
+
+	prepared = handler.prepare(record)
+
+	assert prepared.msg is event_dict
+	assert not hasattr(prepared, 'request_id')
+
+
+def test_prepare_formats_foreign_records_with_request_context(request_context):
+	record = build_record('Connection to %s lost', 'replica-1')
+	handler = BoundedQueueHandler(queue.Queue(), full_policy='drop', block_timeout=0)
+
+	prepared = handler.prepare(record)
+
+	assert prepared.msg == 'Connection to replica-1 lost'
+	assert prepared.args is None
+	assert prepared.request_id == 'flamengo-2019'
+
+
+def test_emit_drops_records_when_queue_is_full():
+	log_queue = queue.Queue(maxsize=1)
+	handler = BoundedQueueHandler(log_queue, full_policy='drop', block_timeout=0)
+	before = dropped('WARNING')
+
+	handler.emit(build_record('first', level=logging.WARNING))
+	handler.emit(build_record('second', level=logging.WARNING))
+
+	assert log_queue.qsize() == 1
+	assert log_queue.get_nowait().msg == 'first'
+	assert dropped('WARNING') - before == 1
+
+
+def test_emit_blocks_until_timeout_when_queue_is_full():
+	log_queue = queue.Queue(maxsize=1)
+	handler = BoundedQueueHandler(log_queue, full_policy='block', block_timeout=0.05)
+	before = dropped('ERROR')
+
+	handler.emit(build_record('first', level=logging.ERROR))
+	start = time.monotonic()
+	handler.emit(build_record('second', level=logging.ERROR))
+
+	assert time.monotonic() - start >= 0.05
+	assert dropped('ERROR') - before == 1
@@ -3,6 +3,7 @@ from unittest.mock import Mock, call, patch
 import pytest
 from structlog.types import EventDict  # noqa: TCH002
 
+from src.core.logging.handlers import BoundedQueueHandler
 from src.core.logging.logger import StructLogger, drop_color_message_key, setup_logging
 
 
@@ -38,6 +39,13 @@ def test_setup_logging_with_json_renderer(mock_logging, mock_structlog):
 
 	mock_structlog.configure.assert_called_once()
 	mock_root_logger.setLevel.assert_called_with('INFO')
+	# Records are queued on the root logger and written by the listener thread
+	listener_queue, listener_handler = mock_logging.handlers.QueueListener.call_args.args
+	assert listener_handler is mock_handler
+	mock_logging.handlers.QueueListener.return_value.start.assert_called_once()
+	(queue_handler,) = mock_root_logger.addHandler.call_args.args
+	assert isinstance(queue_handler, BoundedQueueHandler)
+	assert queue_handler.queue is listener_queue
 
 
 def test_struct_logger_to_snake_case():
@@ -1,22 +1,28 @@
+import logging
 from unittest.mock import AsyncMock, Mock, patch
 from uuid import uuid4
 
 import pytest
 
-from src.core.logging.middleware import StructLogMiddleware
+from src.core.logging.middleware import (
+	StructLogMiddleware,
+	access_stdlib_logger,
+	find_headers,
+	should_log_access,
+)
+from src.core.timing import ServerTimingMiddleware, record
 
 
-@pytest.mark.asyncio
-@patch('src.core.logging.middleware.access_logger')
-@patch('src.core.logging.middleware.correlation_id')
-async def test_structlog_middleware_logs_access(mock_correlation_id, mock_access_logger):
-	mock_correlation_id.get.return_value = str(uuid4())
+@pytest.fixture
+def access_log_level():
+	level = access_stdlib_logger.level
 
-	async def app(scope, receive, send):
-		await send({'type': 'http.response.start', 'status': 200})
+	yield access_stdlib_logger.setLevel
+
+	access_stdlib_logger.setLevel(level)
 
-	middleware = StructLogMiddleware(app)
 
+def build_scope():
 	scope = {
 		'type': 'http',
 		'client': ('127.0.0.1', 12345),
@@ -35,12 +41,128 @@ async def test_structlog_middleware_logs_access(mock_correlation_id, mock_access
 	scope['route'].name = 'test_route'
 	scope['endpoint'].__name__ = 'test_endpoint'
 
-	async def fake_send(message):
-		pass
+	return scope
+
+
+async def app(scope, receive, send):
+	await send({'type': 'http.response.start', 'status': 200})
+
+
+async def fake_send(message):
+	pass
+
+
+@pytest.mark.asyncio
+@patch('src.core.logging.middleware.access_logger')
+@patch('src.core.logging.middleware.correlation_id')
+async def test_structlog_middleware_logs_access(
+	mock_correlation_id, mock_access_logger, access_log_level
+):
+	mock_correlation_id.get.return_value = str(uuid4())
+	access_log_level(logging.INFO)
+	middleware = StructLogMiddleware(app)
 
-	await middleware(scope, AsyncMock(), fake_send)
+	await middleware(build_scope(), AsyncMock(), fake_send)
 
 	assert mock_access_logger.info.called
 	args, kwargs = mock_access_logger.info.call_args
 	assert 'GET' in args[0]
 	assert kwargs['http']['url'] == '/test'
+	assert kwargs['http']['host'] == 'testserver'
+	assert kwargs['http']['status_code'] == 200
+	assert kwargs['user_agent'] == 'test-agent'
+	assert kwargs['timings'] is None
+
+
+@pytest.mark.asyncio
+@patch('src.core.logging.middleware.get_path_with_query_string')
+@patch('src.core.logging.middleware.access_logger')
+async def test_structlog_middleware_skips_disabled_access_log(
+	mock_access_logger, mock_get_path_with_query_string, access_log_level
+):
+	access_log_level(logging.WARNING)
+	middleware = StructLogMiddleware(app)
+
+	await middleware(build_scope(), AsyncMock(), fake_send)
+
+	mock_access_logger.info.assert_not_called()
+	mock_get_path_with_query_string.assert_not_called()
+
+
+@pytest.mark.asyncio
+@patch('src.core.logging.middleware.access_logger')
+async def test_structlog_middleware_logs_request_timings(mock_access_logger, access_log_level):
+	access_log_level(logging.INFO)
+
+	async def timed_app(scope, receive, send):
+		record('db', 0.002)
+		record('validation', 0.0005)
+		await app(scope, receive, send)
+
+	middleware = ServerTimingMiddleware(StructLogMiddleware(timed_app), header_enabled=False)
+
+	await middleware(build_scope(), AsyncMock(), fake_send)
+
+	_, kwargs = mock_access_logger.info.call_args
+	assert kwargs['timings'] == {'db': 2.0, 'validation': 0.5}
+
+
+@pytest.mark.parametrize(
+	'headers, expected',
+	[
+		(
+			[(b'accept', b'*/*'), (b'host', b'rafood.com'), (b'user-agent', b'curl/8.0')],
+			('curl/8.0', 'rafood.com'),
+		),
+		([(b'accept', b'*/*')], (None, None)),
+		([], (None, None)),
+	],
+)
+def test_find_headers(headers, expected):
+	assert find_headers({'headers': headers}) == expected
+
+
+@pytest.fixture
+def sampling():
+	with patch('src.core.logging.middleware.settings') as mock_settings:
+		mock_settings.LOG_ACCESS_SAMPLE_RATE = 0
+		mock_settings.LOG_ACCESS_SLOW_THRESHOLD_MS = 500
+
+		yield mock_settings
+
+
+@pytest.mark.parametrize(
+	'status_code, process_time_ms, expected',
+	[
+		(200, 10, False),
+		(200, 500, True),
+		(404, 10, True),
+		(500, 10, True),
+		(None, 10, True),
+	],
+)
+@patch('src.core.logging.middleware.correlation_id')
+def test_should_log_access_keeps_errors_and_slow_requests(
+	mock_correlation_id, sampling, status_code, process_time_ms, expected
+):
+	mock_correlation_id.get.return_value = str(uuid4())
+
+	assert should_log_access(status_code, process_time_ms * 1_000_000) is expected
+
+
+@patch('src.core.logging.middleware.correlation_id')
+def test_should_log_access_samples_by_request_id(mock_correlation_id, sampling):
+	sampling.LOG_ACCESS_SAMPLE_RATE = 0.1
+	request_ids = [str(uuid4()) for _ in range(5_000)]
+
+	def sampled():
+		kept = []
+		for request_id in request_ids:
+			mock_correlation_id.get.return_value = request_id
+			kept.append(should_log_access(200, 0))
+		return kept
+
+	first, second = sampled(), sampled()
+
+	assert first == second
+	assert 0.08 < sum(first) / len(request_ids) < 0.12
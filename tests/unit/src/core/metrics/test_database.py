@@ -0,0 +1,220 @@
+import asyncio
+import logging
+from unittest.mock import Mock, patch
+
+import pytest
+from prometheus_client import REGISTRY, CollectorRegistry
+from sqlalchemy.pool import NullPool, QueuePool
+
+from src.core.metrics.database import (
+	DatabasePoolCollector,
+	DatabasePoolGauges,
+	TimedQueuePool,
+	_after_cursor_execute,
+	_before_cursor_execute,
+	_checkin,
+	_end_transaction,
+	_handle_error,
+	repository_method,
+	statement_kind,
+	track_repository,
+)
+from src.core.timing import RequestTimings, request_timings, timed
+
+
+@pytest.fixture
+def pool():
+	return QueuePool(creator=Mock, pool_size=2, max_overflow=2)
+
+
+def collect(pool):
+	collector = DatabasePoolCollector(Mock(pool=pool))
+
+	return {metric.name: metric.samples[0].value for metric in collector.collect()}
+
+
+def test_collect_idle_pool(pool):
+	connection = pool.connect()
+	connection.close()
+
+	assert collect(pool) == {
+		'db_pool_size': 2,
+		'db_pool_connections_checked_out': 0,
+		'db_pool_connections_idle': 1,
+		'db_pool_connections_overflow': 0,
+	}
+
+
+def test_collect_pool_in_overflow(pool):
+	connections = [pool.connect() for _ in range(3)]
+
+	assert collect(pool) == {
+		'db_pool_size': 2,
+		'db_pool_connections_checked_out': 3,
+		'db_pool_connections_idle': 0,
+		'db_pool_connections_overflow': 1,
+	}
+
+	for connection in connections:
+		connection.close()
+
+
+def test_collect_nothing_without_queue_pool():
+	assert collect(NullPool(creator=Mock)) == {}
+
+
+def test_pool_gauges_refresh(pool):
+	registry = CollectorRegistry()
+	gauges = DatabasePoolGauges(Mock(pool=pool), interval_seconds=5, registry=registry)
+	connections = [pool.connect() for _ in range(3)]
+
+	gauges.refresh()
+
+	assert registry.get_sample_value('db_pool_size') == 2
+	assert registry.get_sample_value('db_pool_connections_checked_out') == 3
+	assert registry.get_sample_value('db_pool_connections_idle') == 0
+	assert registry.get_sample_value('db_pool_connections_overflow') == 1
+
+	for connection in connections:
+		connection.close()
+
+
+@pytest.mark.asyncio
+async def test_pool_gauges_refresh_until_stopped(pool):
+	gauges = DatabasePoolGauges(
+		Mock(pool=pool), interval_seconds=0.01, registry=CollectorRegistry()
+	)
+
+	with patch.object(gauges, 'refresh') as refresh:
+		gauges.start()
+		await asyncio.sleep(0.05)
+		await gauges.stop()
+
+	assert refresh.call_count > 1
+	assert gauges._task is None
+
+
+@pytest.mark.parametrize(
+	'statement, kind',
+	[
+		('SELECT restaurants.id FROM restaurants', 'SELECT'),
+		('\n  insert INTO categories (name) VALUES ($1)', 'INSERT'),
+		('UPDATE products SET price = $1', 'UPDATE'),
+		('DELETE FROM offers WHERE offers.id = $1', 'DELETE'),
+		('SAVEPOINT sa_savepoint_1', 'OTHER'),
+		('', 'OTHER'),
+	],
+)
+def test_statement_kind(statement, kind):
+	assert statement_kind(statement) == kind
+
+
+@track_repository
+class FlamengoRepository:
+	async def list(self):
+		return repository_method.get()
+
+	async def _load(self):
+		return repository_method.get()
+
+	def build(self):
+		return repository_method.get()
+
+	async def update(self):
+		with timed('pool'):
+			await asyncio.sleep(0.02)
+		with timed('commit'):
+			await asyncio.sleep(0.02)
+		await asyncio.sleep(0.02)
+
+
+def method_calls(method):
+	return (
+		REGISTRY.get_sample_value('db_repository_method_duration_seconds_count', {'method': method})
+		or 0
+	)
+
+
+@pytest.mark.asyncio
+async def test_track_repository_public_async_methods():
+	repository = FlamengoRepository()
+	calls = method_calls('FlamengoRepository.list')
+
+	assert await repository.list() == 'FlamengoRepository.list'
+	assert await repository._load() == 'unknown'
+	assert repository.build() == 'unknown'
+	assert repository_method.get() == 'unknown'
+	assert method_calls('FlamengoRepository.list') - calls == 1
+
+
+@pytest.mark.asyncio
+async def test_track_repository_orm_time_excludes_database_phases():
+	timings = RequestTimings()
+	token = request_timings.set(timings)
+
+	await FlamengoRepository().update()
+	request_timings.reset(token)
+
+	assert 0.02 <= timings.get('orm') < 0.04
+
+
+def test_timed_pool_logs_warnings_only():
+	pool = TimedQueuePool(creator=Mock)
+
+	assert not pool.logger.isEnabledFor(logging.INFO)
+	assert pool.logger.isEnabledFor(logging.WARNING)
+
+
+def test_transaction_end_timed_until_checkin():
+	timings = RequestTimings()
+	token = request_timings.set(timings)
+	record_info = {}
+
+	_end_transaction(Mock(info=record_info))
+	_checkin(Mock(), Mock(info=record_info))
+	_checkin(Mock(), Mock(info=record_info))
+	request_timings.reset(token)
+
+	assert timings.get('commit') > 0
+	assert record_info == {}
+
+
+def statement_count(method, statement):
+	labels = {'method': method, 'statement': statement}
+
+	return (
+		REGISTRY.get_sample_value('db_statement_duration_seconds_count', labels) or 0,
+		REGISTRY.get_sample_value('db_statement_rows_total', labels) or 0,
+	)
+
+
+@pytest.mark.parametrize(
+	'statement, description, rowcount, rows',
+	[
+		('SELECT * FROM restaurants', [('id',)], 3, 3),
+		('UPDATE restaurants SET name = $1', None, 2, 0),
+	],
+)
+def test_cursor_execute_hooks(statement, description, rowcount, rows):
+	conn = Mock(info={})
+	cursor = Mock(description=description, rowcount=rowcount)
+	token = repository_method.set('RestaurantRepository.update')
+	kind = statement_kind(statement)
+	before = statement_count('RestaurantRepository.update', kind)
+
+	_before_cursor_execute(conn, cursor, statement, (), Mock(), False)
+	_after_cursor_execute(conn, cursor, statement, (), Mock(), False)
+	repository_method.reset(token)
+
+	after = statement_count('RestaurantRepository.update', kind)
+	assert (after[0] - before[0], after[1] - before[1]) == (1, rows)
+	assert conn.info['statement_start'] == []
+
+
+def test_handle_error_drops_statement_start():
+	conn = Mock(info={})
+
+	_before_cursor_execute(conn, Mock(), 'SELECT 1', (), Mock(), False)
+	_handle_error(Mock(connection=conn))
+
+	assert conn.info['statement_start'] == []
@@ -0,0 +1,78 @@
+import asyncio
+import time
+from unittest.mock import patch
+
+import pytest
+from prometheus_client import REGISTRY
+
+from src.core.metrics.event_loop import EventLoopMonitor
+
+
+def lag_sum():
+	return REGISTRY.get_sample_value('event_loop_lag_seconds_sum') or 0
+
+
+def crunch(seconds):
+	"""CPU work (or a blocking call) keeping the loop from running anything else"""
+	time.sleep(seconds)
+
+
+def build_monitor(blocking_detection):
+	return EventLoopMonitor(
+		interval_seconds=0.01,
+		blocking_detection=blocking_detection,
+		blocking_threshold_seconds=0.02,
+	)
+
+
+@pytest.mark.asyncio
+async def test_monitor_observes_lag():
+	monitor = build_monitor(blocking_detection=False)
+	before = lag_sum()
+
+	monitor.start()
+	await asyncio.sleep(0.005)
+	crunch(0.05)
+	await asyncio.sleep(0.02)
+	await monitor.stop()
+
+	assert lag_sum() - before >= 0.04
+	assert monitor._task is None
+
+
+@pytest.mark.asyncio
+@patch('src.core.metrics.event_loop.logger')
+async def test_monitor_logs_blocking_stack(mock_logger):
+	monitor = build_monitor(blocking_detection=True)
+
+	monitor.start()
+	await asyncio.sleep(0.02)
+	crunch(0.1)
+	await asyncio.sleep(0.02)
+	await monitor.stop()
+
+	mock_logger.warning.assert_called_once()
+	args, kwargs = mock_logger.warning.call_args
+	assert args == ('Event loop blocked',)
+	assert kwargs['blocked_ms'] >= 20
+	assert 'in crunch' in kwargs['stack']
+	assert monitor._watchdog is None
+
+
+@pytest.mark.asyncio
+@patch('src.core.metrics.event_loop.logger')
+async def test_monitor_without_blocking_detection(mock_logger):
+	monitor = build_monitor(blocking_detection=False)
+
+	monitor.start()
+	crunch(0.05)
+	await asyncio.sleep(0.01)
+	await monitor.stop()
+
+	assert monitor._watchdog is None
+	mock_logger.warning.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_stop_without_start():
+	await build_monitor(blocking_detection=True).stop()
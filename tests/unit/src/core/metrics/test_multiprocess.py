@@ -0,0 +1,83 @@
+import os
+import subprocess
+import sys
+
+import pytest
+from prometheus_client import CollectorRegistry
+from prometheus_client.multiprocess import MultiProcessCollector
+
+from src.core.metrics.multiprocess import prepare_multiprocess_dir, remove_dead_workers
+
+WORKER = """
+import sys
+
+from prometheus_client import Counter, Gauge
+
+Counter('worker_requests', 'Requests served').inc(3)
+Gauge('worker_connections', 'Connections in use', multiprocess_mode='livesum').set(2)
+print('ready', flush=True)
+sys.stdin.readline()
+"""
+
+
+@pytest.fixture
+def metrics_dir(tmp_path):
+	return str(tmp_path)
+
+
+def start_worker(metrics_dir):
+	worker = subprocess.Popen(
+		[sys.executable, '-c', WORKER],
+		env={**os.environ, 'PROMETHEUS_MULTIPROC_DIR': metrics_dir},
+		stdin=subprocess.PIPE,
+		stdout=subprocess.PIPE,
+		text=True,
+	)
+	assert worker.stdout is not None
+	assert worker.stdout.readline() == 'ready\n'
+
+	return worker
+
+
+def collect(metrics_dir):
+	registry = CollectorRegistry()
+	MultiProcessCollector(registry, path=metrics_dir)
+
+	return (
+		registry.get_sample_value('worker_requests_total'),
+		registry.get_sample_value('worker_connections'),
+	)
+
+
+def test_prepare_multiprocess_dir(tmp_path):
+	metrics_dir = tmp_path / 'metrics'
+	metrics_dir.mkdir()
+	(metrics_dir / 'counter_1234.db').write_bytes(b'')
+	(metrics_dir / 'README').write_text('')
+
+	prepare_multiprocess_dir(str(metrics_dir))
+
+	assert [file.name for file in metrics_dir.iterdir()] == ['README']
+
+
+def test_prepare_multiprocess_dir_creates_it(tmp_path):
+	prepare_multiprocess_dir(str(tmp_path / 'metrics'))
+
+	assert (tmp_path / 'metrics').is_dir()
+
+
+def test_remove_dead_workers(metrics_dir):
+	alive = start_worker(metrics_dir)
+	dead = start_worker(metrics_dir)
+	dead.kill()
+	dead.wait()
+
+	assert collect(metrics_dir) == (6, 4)
+
+	assert remove_dead_workers(metrics_dir) == [dead.pid]
+
+	# Counters of the dead worker are kept, its live gauges aren't summed anymore
+	assert collect(metrics_dir) == (6, 2)
+	assert remove_dead_workers(metrics_dir) == []
+
+	alive.communicate('\n')
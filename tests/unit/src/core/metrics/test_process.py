@@ -0,0 +1,34 @@
+import asyncio
+import os
+from unittest.mock import patch
+
+import pytest
+from prometheus_client import CollectorRegistry
+
+from src.core.metrics.process import PROCESS_METRICS, ProcessGauges
+
+
+@pytest.mark.skipif(not os.path.exists('/proc/self/stat'), reason='Process metrics need /proc')
+def test_process_gauges_refresh():
+	registry = CollectorRegistry()
+	gauges = ProcessGauges(interval_seconds=5, registry=registry)
+
+	gauges.refresh()
+
+	for name in PROCESS_METRICS:
+		assert registry.get_sample_value(name) is not None
+	assert registry.get_sample_value('process_resident_memory_bytes') > 0
+	assert registry.get_sample_value('process_open_fds') > 0
+
+
+@pytest.mark.asyncio
+async def test_process_gauges_refresh_until_stopped():
+	gauges = ProcessGauges(interval_seconds=0.01, registry=CollectorRegistry())
+
+	with patch.object(gauges, 'refresh') as refresh:
+		gauges.start()
+		await asyncio.sleep(0.05)
+		await gauges.stop()
+
+	assert refresh.call_count > 1
+	assert gauges._task is None
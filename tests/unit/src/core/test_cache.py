@@ -0,0 +1,100 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+from prometheus_client import REGISTRY
+
+from src.core.cache import TTLCache
+
+
+class FakeClock:
+	def __init__(self):
+		self.now = 0.0
+
+	def __call__(self):
+		return self.now
+
+
+@pytest.fixture
+def clock():
+	return FakeClock()
+
+
+def metric(name, cache):
+	return REGISTRY.get_sample_value(name, {'cache': cache}) or 0
+
+
+def test_get_returns_stored_value_until_it_expires(clock):
+	cache = TTLCache(name='test_expire', ttl_seconds=60, max_size=4, clock=clock)
+	cache.set('key', 'value')
+
+	clock.now = 59.9
+	assert cache.get('key') == 'value'
+
+	clock.now = 60
+	assert cache.get('key') is None
+	assert len(cache) == 0
+
+
+def test_set_evicts_least_recently_used(clock):
+	cache = TTLCache(name='test_evict', ttl_seconds=60, max_size=2, clock=clock)
+	cache.set('first', 1)
+	cache.set('second', 2)
+	cache.get('first')
+
+	cache.set('third', 3)
+
+	assert cache.get('second') is None
+	assert cache.get('first') == 1
+	assert cache.get('third') == 3
+	assert metric('cache_evictions_total', 'test_evict') == 1
+
+
+def test_set_disabled_without_ttl(clock):
+	cache = TTLCache(name='test_disabled', ttl_seconds=0, max_size=2, clock=clock)
+	cache.set('key', 'value')
+
+	assert cache.get('key') is None
+
+
+def test_get_counts_hits_and_misses(clock):
+	cache = TTLCache(name='test_counters', ttl_seconds=60, max_size=2, clock=clock)
+
+	cache.get('key')
+	cache.set('key', 'value')
+	cache.get('key')
+	cache.get('key')
+
+	assert metric('cache_hits_total', 'test_counters') == 2
+	assert metric('cache_misses_total', 'test_counters') == 1
+
+
+@pytest.mark.asyncio
+async def test_get_or_load_loads_once(clock):
+	cache = TTLCache(name='test_load', ttl_seconds=60, max_size=2, clock=clock)
+	load = AsyncMock(return_value=['value'])
+
+	assert await cache.get_or_load('key', load) == ['value']
+	assert await cache.get_or_load('key', load) == ['value']
+
+	load.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_get_or_load_skips_storing_value_loaded_before_invalidation(clock):
+	cache = TTLCache(name='test_stale', ttl_seconds=60, max_size=2, clock=clock)
+	loading = asyncio.Event()
+	release = asyncio.Event()
+
+	async def load():
+		loading.set()
+		await release.wait()
+		return ['stale']
+
+	task = asyncio.create_task(cache.get_or_load('key', load))
+	await loading.wait()
+	cache.invalidate()
+	release.set()
+
+	assert await task == ['stale']
+	assert cache.get('key') is None
@@ -0,0 +1,62 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import asyncpg
+import pytest
+
+from src.core.cache import TTLCache
+from src.core.cache_invalidation import CacheInvalidationListener
+
+
+@pytest.fixture
+def listener():
+	return CacheInvalidationListener(connect=AsyncMock(), retry_seconds=0)
+
+
+def build_cache(name):
+	cache = TTLCache(name=name, ttl_seconds=60, max_size=4)
+	cache.set('list', ['cached'])
+
+	return cache
+
+
+def test_invalidate_caches_registered_for_entity(listener):
+	categories_cache = build_cache('test_categories')
+	products_cache = build_cache('test_products')
+	listener.register('categories', categories_cache)
+	listener.register('products', products_cache)
+
+	listener.invalidate('{"entity": "categories", "id": "1"}')
+
+	assert len(categories_cache) == 0
+	assert len(products_cache) == 1
+
+
+@pytest.mark.parametrize('payload', ['not json', '{"id": "1"}', '["categories"]'])
+def test_invalidate_ignores_malformed_payload(listener, payload):
+	cache = build_cache('test_malformed')
+	listener.register('categories', cache)
+
+	listener.invalidate(payload)
+
+	assert len(cache) == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+	'error',
+	[
+		OSError('Connection refused'),
+		asyncio.TimeoutError(),
+		asyncpg.InterfaceError('connection is closed'),
+	],
+)
+async def test_run_retries_when_connection_fails(error):
+	connect = AsyncMock(side_effect=error)
+	listener = CacheInvalidationListener(connect=connect, retry_seconds=0)
+
+	listener.start()
+	await asyncio.sleep(0.01)
+	await listener.stop()
+
+	assert connect.await_count > 1
@@ -0,0 +1,137 @@
+import asyncio
+import gzip
+from unittest.mock import patch
+
+import brotli
+import pytest
+from httpx import ASGITransport, AsyncClient
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse, PlainTextResponse, Response, StreamingResponse
+from starlette.routing import Route
+
+from src.core.compression import CompressionMiddleware, negotiate_encoding
+
+LARGE_BODY = [{'name': f'Restaurant {n}'} for n in range(200)]
+
+
+def build_app(**options):
+	async def large(request):
+		return JSONResponse(LARGE_BODY)
+
+	async def small(request):
+		return JSONResponse({'message': 'pong'})
+
+	async def image(request):
+		return Response(b'\x89PNG' * 1024, media_type='image/png')
+
+	async def streamed(request):
+		return StreamingResponse(iter([b'a' * 2048, b'b' * 2048]), media_type='text/plain')
+
+	async def encoded(request):
+		return PlainTextResponse('a' * 2048, headers={'Content-Encoding': 'identity'})
+
+	app = Starlette(
+		routes=[
+			Route('/large', large),
+			Route('/small', small),
+			Route('/image', image),
+			Route('/streamed', streamed),
+			Route('/encoded', encoded),
+		]
+	)
+
+	return CompressionMiddleware(
+		app,
+		**{
+			'minimum_size': 1024,
+			'gzip_level': 6,
+			'brotli_quality': 4,
+			'thread_minimum_size': 1024 * 1024,
+			'cache_ttl_seconds': 60,
+			'cache_max_size': 4,
+			**options,
+		},
+	)
+
+
+async def get(app, path, accept_encoding):
+	transport = ASGITransport(app=app)
+	headers = {'Accept-Encoding': accept_encoding}
+
+	# Reading the raw stream keeps httpx from decoding the body
+	async with (
+		AsyncClient(transport=transport, base_url='http://testserver') as client,
+		client.stream('GET', path, headers=headers) as response,
+	):
+		return response, b''.join([chunk async for chunk in response.aiter_raw()])
+
+
+@pytest.mark.parametrize(
+	'accept_encoding, encoding',
+	[
+		('gzip, deflate, br', 'br'),
+		('gzip', 'gzip'),
+		('br;q=0.5, gzip', 'gzip'),
+		('br;q=0, gzip;q=0.1', 'gzip'),
+		('*', 'br'),
+		('*;q=0.5, br;q=0', 'gzip'),
+		('identity', None),
+		('', None),
+		('gzip;q=invalid', None),
+	],
+)
+def test_negotiate_encoding(accept_encoding, encoding):
+	assert negotiate_encoding(accept_encoding) == encoding
+
+
+@pytest.mark.parametrize(
+	'encoding, decompress', [('br', brotli.decompress), ('gzip', gzip.decompress)]
+)
+@pytest.mark.asyncio
+async def test_compress_large_response(encoding, decompress):
+	response, body = await get(build_app(), '/large', encoding)
+
+	assert response.headers['Content-Encoding'] == encoding
+	assert response.headers['Content-Length'] == str(len(body))
+	assert response.headers['Vary'] == 'Accept-Encoding'
+	assert decompress(body) == JSONResponse(LARGE_BODY).body
+
+
+@pytest.mark.parametrize('path', ['/small', '/image', '/streamed', '/encoded'])
+@pytest.mark.asyncio
+async def test_skip_compression(path):
+	response, _ = await get(build_app(), path, 'gzip, br')
+
+	assert response.headers.get('Content-Encoding') in (None, 'identity')
+
+
+@pytest.mark.asyncio
+async def test_skip_compression_without_accepted_encoding():
+	response, body = await get(build_app(), '/large', 'identity')
+
+	assert 'Content-Encoding' not in response.headers
+	assert body == JSONResponse(LARGE_BODY).body
+
+
+@pytest.mark.asyncio
+async def test_compress_same_body_once():
+	app = build_app()
+
+	with patch.object(app, '_compress', wraps=app._compress) as compress:
+		first_response, first_body = await get(app, '/large', 'br')
+		second_response, second_body = await get(app, '/large', 'br')
+		await get(app, '/large', 'gzip')
+
+	assert first_body == second_body
+	assert compress.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_compress_large_body_in_thread():
+	app = build_app(thread_minimum_size=1024, cache_max_size=0)
+
+	with patch('src.core.compression.asyncio.to_thread', wraps=asyncio.to_thread) as to_thread:
+		response, _ = await get(app, '/large', 'gzip')
+
+	assert response.headers['Content-Encoding'] == 'gzip'
+	to_thread.assert_called_once()
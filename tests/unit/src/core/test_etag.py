@@ -0,0 +1,53 @@
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+
+from src.core.etag import etag_matches, not_modified, weak_etag
+
+ROOT = (uuid4(), datetime(2026, 1, 30, 12, 0))
+FIRST_CHILD = (uuid4(), datetime(2026, 1, 30, 12, 5))
+SECOND_CHILD = (uuid4(), datetime(2026, 1, 30, 12, 10))
+
+
+def test_weak_etag_ignores_children_order():
+	etag = weak_etag(ROOT, [FIRST_CHILD, SECOND_CHILD])
+
+	assert etag.startswith('W/"')
+	assert etag == weak_etag(ROOT, [SECOND_CHILD, FIRST_CHILD])
+
+
+@pytest.mark.parametrize(
+	'root, children',
+	[
+		((ROOT[0], datetime(2026, 1, 30, 13, 0)), [FIRST_CHILD, SECOND_CHILD]),
+		(ROOT, [FIRST_CHILD]),
+		(ROOT, [FIRST_CHILD, SECOND_CHILD, (uuid4(), datetime(2026, 1, 30, 12, 0))]),
+		(ROOT, [FIRST_CHILD, (SECOND_CHILD[0], datetime(2026, 1, 30, 13, 0))]),
+	],
+)
+def test_weak_etag_changes_with_root_or_children(root, children):
+	assert weak_etag(root, children) != weak_etag(ROOT, [FIRST_CHILD, SECOND_CHILD])
+
+
+@pytest.mark.parametrize(
+	'if_none_match, matches',
+	[
+		('W/"abc"', True),
+		('"abc"', True),
+		('"xyz", W/"abc"', True),
+		('*', True),
+		('W/"xyz"', False),
+		('W/"abcd"', False),
+	],
+)
+def test_etag_matches(if_none_match, matches):
+	assert etag_matches(if_none_match, 'W/"abc"') is matches
+
+
+def test_not_modified():
+	response = not_modified('W/"abc"')
+
+	assert response.status_code == 304
+	assert response.headers['ETag'] == 'W/"abc"'
+	assert response.body == b''
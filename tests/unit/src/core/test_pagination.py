@@ -0,0 +1,33 @@
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+
+from src.core.pagination import InvalidCursorError, decode_cursor, encode_cursor
+
+
+def test_encode_and_decode_cursor():
+	created_at = datetime(2019, 11, 23, 17, 45, 12, 123456)
+	restaurant_id = uuid4()
+
+	cursor = encode_cursor(created_at, restaurant_id)
+
+	assert '=' not in cursor
+	assert decode_cursor(cursor) == (created_at, restaurant_id)
+
+
+@pytest.mark.parametrize(
+	'cursor',
+	[
+		'',
+		'gabigol',
+		'!!!',
+		encode_cursor(datetime.now(), uuid4())[:-4],
+	],
+)
+def test_decode_invalid_cursor(cursor):
+	with pytest.raises(InvalidCursorError) as exc_info:
+		decode_cursor(cursor)
+
+	assert exc_info.value.status_code == 400
+	assert exc_info.value.error_code == 'invalid_cursor'
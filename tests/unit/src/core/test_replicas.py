@@ -0,0 +1,103 @@
+from unittest.mock import Mock
+
+import pytest
+from fastapi import Request
+from sqlalchemy.exc import DBAPIError, IntegrityError
+
+from src.core.replicas import ReplicaRouter, is_connection_error, reads_from_primary
+from src.restaurants.exceptions import RestaurantsInternalError
+
+
+class FakeClock:
+	def __init__(self):
+		self.now = 0.0
+
+	def __call__(self):
+		return self.now
+
+
+@pytest.fixture
+def clock():
+	return FakeClock()
+
+
+@pytest.fixture
+def engines():
+	return [Mock(name='replica_1'), Mock(name='replica_2'), Mock(name='replica_3')]
+
+
+def build_request(headers=None, cookies=None):
+	raw_headers = [(key.lower().encode(), value.encode()) for key, value in (headers or {}).items()]
+	if cookies:
+		cookie = '; '.join(f'{key}={value}' for key, value in cookies.items())
+		raw_headers.append((b'cookie', cookie.encode()))
+
+	return Request({'type': 'http', 'headers': raw_headers})
+
+
+def test_choose_round_robin(engines, clock):
+	router = ReplicaRouter(engines, ejection_seconds=30, clock=clock)
+
+	assert [router.choose() for _ in range(4)] == [engines[0], engines[1], engines[2], engines[0]]
+
+
+def test_choose_skips_ejected_replica_until_cooldown_ends(engines, clock):
+	router = ReplicaRouter(engines, ejection_seconds=30, clock=clock)
+	router.eject(engines[1])
+
+	assert [router.choose() for _ in range(3)] == [engines[0], engines[2], engines[0]]
+
+	clock.now = 30
+	assert [router.choose() for _ in range(3)] == [engines[1], engines[2], engines[0]]
+
+
+def test_choose_none_when_all_replicas_are_ejected(engines, clock):
+	router = ReplicaRouter(engines, ejection_seconds=30, clock=clock)
+	for engine in engines:
+		router.eject(engine)
+
+	assert router.choose() is None
+
+
+def test_choose_none_without_replicas(clock):
+	assert ReplicaRouter([], ejection_seconds=30, clock=clock).choose() is None
+
+
+@pytest.mark.parametrize(
+	'error, expected',
+	[
+		(ConnectionRefusedError(), True),
+		(TimeoutError(), True),
+		(DBAPIError('SELECT 1', None, Exception(), connection_invalidated=True), True),
+		(IntegrityError('INSERT', None, Exception()), False),
+		(ValueError(), False),
+	],
+)
+def test_is_connection_error(error, expected):
+	assert is_connection_error(error) is expected
+
+
+def test_is_connection_error_wrapped_by_service():
+	try:
+		try:
+			raise ConnectionRefusedError()
+		except ConnectionRefusedError as e:
+			raise RestaurantsInternalError(message=str(e)) from e
+	except RestaurantsInternalError as wrapped:
+		assert is_connection_error(wrapped) is True
+
+
+@pytest.mark.parametrize(
+	'headers, cookies, expected',
+	[
+		({}, {}, False),
+		({'X-Read-Primary': '1'}, {}, True),
+		({'X-Read-Primary': 'true'}, {}, True),
+		({'X-Read-Primary': 'false'}, {}, False),
+		({}, {'read_primary': '1'}, True),
+		({}, {'read_primary': '0'}, False),
+		({'X-Read-Primary': '0'}, {'read_primary': '1'}, False),
+	],
+)
+def test_reads_from_primary(headers, cookies, expected):
+	assert reads_from_primary(build_request(headers, cookies)) is expected
@@ -0,0 +1,41 @@
+import json
+from datetime import datetime
+from uuid import uuid4
+
+from fastapi.encoders import jsonable_encoder
+
+from src.categories.schemas import CategorySchema
+from src.core.responses import ModelResponse
+from src.products.schemas import ProductWithCategoriesSchema
+
+
+def build_product(name='Bruno Henrique'):
+	now = datetime.now()
+	category = CategorySchema(id=uuid4(), name='Atacante', created_at=now, updated_at=now)
+
+	return ProductWithCategoriesSchema(
+		id=uuid4(),
+		restaurant_id=uuid4(),
+		name=name,
+		price=27.0,
+		category_id=category.id,
+		image_url='https://example.com/image.jpg',
+		created_at=now,
+		updated_at=now,
+		category=category,
+	)
+
+
+def test_model_response_renders_models_like_jsonable_encoder():
+	products = [build_product(), build_product('Pedro')]
+	response = ModelResponse(products)
+
+	assert response.media_type == 'application/json'
+	assert response.headers['content-type'] == 'application/json'
+	assert json.loads(response.body) == jsonable_encoder(products)
+
+
+def test_model_response_renders_plain_content():
+	response = ModelResponse({'message': 'Olé', 'ids': [1, 2]})
+
+	assert response.body == '{"message":"Olé","ids":[1,2]}'.encode()
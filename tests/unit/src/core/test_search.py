@@ -0,0 +1,27 @@
+import pytest
+from sqlalchemy import column
+from sqlalchemy.dialects import postgresql
+
+from src.core.search import escape_like, icontains
+
+
+@pytest.mark.parametrize(
+	'value, expected',
+	[
+		('Arrascaeta', 'Arrascaeta'),
+		('100%', '100\\%'),
+		('de_la_cruz', 'de\\_la\\_cruz'),
+		('back\\slash', 'back\\\\slash'),
+	],
+)
+def test_escape_like(value, expected):
+	assert escape_like(value) == expected
+
+
+def test_icontains_compiles_to_ilike():
+	clause = icontains(column('name'), '10%')
+	compiled = clause.compile(dialect=postgresql.dialect())
+
+	assert 'ILIKE' in str(compiled)
+	assert clause.modifiers['escape'] == '\\'
+	assert compiled.params == {'name_1': '%10\\%%'}
@@ -0,0 +1,72 @@
+import pytest
+from httpx import ASGITransport, AsyncClient
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from src.core.timing import RequestTimings, ServerTimingMiddleware, record, request_timings, timed
+
+
+def test_request_timings_sum_phases():
+	timings = RequestTimings()
+
+	timings.add('db', 0.002)
+	timings.add('db', 0.003)
+	timings.add('render', 0.00012)
+
+	assert timings.get('db') == pytest.approx(0.005)
+	assert timings.get('validation') == 0
+	assert timings.as_milliseconds() == {'db': 5.0, 'render': 0.12}
+	assert timings.server_timing(total=0.01) == 'db;dur=5.0, render;dur=0.12, total;dur=10.0'
+
+
+def test_record_without_request():
+	record('db', 0.002)
+
+	assert request_timings.get() is None
+
+
+def test_timed():
+	timings = RequestTimings()
+	token = request_timings.set(timings)
+
+	with timed('validation'):
+		pass
+
+	request_timings.reset(token)
+	assert list(timings.phases) == ['validation']
+
+
+def build_app(header_enabled):
+	async def restaurants(request):
+		record('db', 0.004)
+		with timed('render'):
+			return JSONResponse([])
+
+	app = Starlette(routes=[Route('/restaurants', restaurants)])
+
+	return ServerTimingMiddleware(app, header_enabled=header_enabled)
+
+
+async def get(app):
+	transport = ASGITransport(app=app)
+
+	async with AsyncClient(transport=transport, base_url='http://testserver') as client:
+		return await client.get('/restaurants')
+
+
+@pytest.mark.asyncio
+async def test_server_timing_header():
+	response = await get(build_app(header_enabled=True))
+
+	phases = [metric.split(';')[0] for metric in response.headers['Server-Timing'].split(', ')]
+	assert phases == ['db', 'render', 'total']
+	assert 'db;dur=4.0' in response.headers['Server-Timing']
+	assert request_timings.get() is None
+
+
+@pytest.mark.asyncio
+async def test_server_timing_header_disabled():
+	response = await get(build_app(header_enabled=False))
+
+	assert 'Server-Timing' not in response.headers
@@ -0,0 +1,87 @@
+from datetime import datetime, time
+
+import pytest
+
+from src.core.weekly_intervals import (
+	MINUTES_PER_WEEK,
+	minute_of_week,
+	next_occurrence_end,
+	weekly_intervals,
+)
+from src.enums import Day
+
+MONDAY = 0
+FRIDAY = 4 * 1440
+SATURDAY = 5 * 1440
+SUNDAY = 6 * 1440
+
+
+@pytest.mark.parametrize(
+	'moment, expected',
+	[
+		(datetime(2026, 1, 26, 0, 0), 0),
+		(datetime(2026, 1, 30, 22, 30, 59), FRIDAY + 22 * 60 + 30),
+		(datetime(2026, 2, 1, 23, 59), MINUTES_PER_WEEK - 1),
+	],
+)
+def test_minute_of_week(moment, expected):
+	assert minute_of_week(moment) == expected
+
+
+@pytest.mark.parametrize(
+	'start_day, end_day, start_time, end_time, expected',
+	[
+		(
+			Day.MONDAY,
+			Day.TUESDAY,
+			time(9),
+			time(18),
+			[(MONDAY + 540, MONDAY + 1080), (1440 + 540, 1440 + 1080)],
+		),
+		# Overnight spans run into the next day
+		(
+			Day.FRIDAY,
+			Day.SATURDAY,
+			time(18),
+			time(2),
+			[(FRIDAY + 1080, SATURDAY + 120), (SATURDAY + 1080, SUNDAY + 120)],
+		),
+		# Sunday night spans are split at the end of the week
+		(
+			Day.SUNDAY,
+			Day.SUNDAY,
+			time(22),
+			time(1, 30),
+			[(SUNDAY + 1320, MINUTES_PER_WEEK), (0, 90)],
+		),
+		# Day ranges wrap around the week
+		(
+			Day.SATURDAY,
+			Day.MONDAY,
+			time(10),
+			time(23, 59, 59),
+			[(SATURDAY + 600, SUNDAY), (SUNDAY + 600, MINUTES_PER_WEEK), (600, 1440)],
+		),
+		# Equal times mean the whole day
+		(Day.WEDNESDAY, Day.WEDNESDAY, time(0), time(0), [(2 * 1440, 3 * 1440)]),
+	],
+)
+def test_weekly_intervals(start_day, end_day, start_time, end_time, expected):
+	assert weekly_intervals(start_day, end_day, start_time, end_time) == expected
+
+
+@pytest.mark.parametrize(
+	'day, start_time, end_time, after, expected',
+	[
+		# Later this week
+		(Day.FRIDAY, time(18), time(22), datetime(2026, 1, 28, 9), datetime(2026, 1, 30, 22)),
+		# Still running
+		(Day.FRIDAY, time(18), time(22), datetime(2026, 1, 30, 19), datetime(2026, 1, 30, 22)),
+		# Already over this week
+		(Day.MONDAY, time(9), time(12), datetime(2026, 1, 28, 9), datetime(2026, 2, 2, 12)),
+		# Overnight span started last Sunday and still running on Monday
+		(Day.SUNDAY, time(22), time(2), datetime(2026, 1, 26, 1), datetime(2026, 1, 26, 2)),
+	],
+)
+def test_next_occurrence_end(day, start_time, end_time, after, expected):
+	assert next_occurrence_end(day, start_time, end_time, after) == expected
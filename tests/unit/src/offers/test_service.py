@@ -1,4 +1,4 @@
-from datetime import time
+from datetime import datetime, time, timedelta, timezone
 from unittest.mock import AsyncMock
 from uuid import uuid4
 
@@ -42,6 +42,43 @@ async def test_list_offers_internal_error(offer_service, mock_offer_repository):
 	mock_offer_repository.list.assert_awaited_once()
 
 
+@pytest.mark.asyncio
+async def test_list_live_offers_success(offer_service, mock_offer_repository, sample_offer):
+	mock_offer_repository.list_live = AsyncMock(return_value=[sample_offer])
+	at = datetime(2026, 1, 30, 22, 30, tzinfo=timezone(timedelta(hours=-3)))
+
+	result = await offer_service.list_live(at)
+
+	assert len(result) == 1
+	assert result[0].id == sample_offer.id
+
+	# Schedules are wall clock times, so only the timezone is dropped
+	mock_offer_repository.list_live.assert_awaited_once_with(datetime(2026, 1, 30, 22, 30))
+
+
+@pytest.mark.asyncio
+async def test_list_live_offers_now_by_default(offer_service, mock_offer_repository):
+	mock_offer_repository.list_live = AsyncMock(return_value=[])
+	before = datetime.now()
+
+	result = await offer_service.list_live()
+
+	assert result == []
+
+	(at,) = mock_offer_repository.list_live.await_args.args
+	assert before <= at <= datetime.now()
+
+
+@pytest.mark.asyncio
+async def test_list_live_offers_internal_error(offer_service, mock_offer_repository):
+	mock_offer_repository.list_live = AsyncMock(side_effect=Exception('Ih! Deu ruim!'))
+
+	with pytest.raises(OffersInternalError) as exc_info:
+		await offer_service.list_live()
+
+	assert 'Ih! Deu ruim!' in str(exc_info.value)
+
+
 @pytest.mark.asyncio
 async def test_get_offer_success(offer_service, mock_offer_repository, sample_offer_with_schedules):
 	mock_offer_repository.get = AsyncMock(return_value=sample_offer_with_schedules)
@@ -116,16 +153,16 @@ async def test_update_offer_success(offer_service, mock_offer_repository, sample
 		price=20.0,
 		active=False,
 	)
-	mock_offer_repository.get = AsyncMock(return_value=sample_offer)
-	mock_offer_repository.update = AsyncMock()
+	updated_offer = sample_offer.sqlmodel_update(update_data.model_dump())
+	mock_offer_repository.update = AsyncMock(return_value=updated_offer)
 
 	result = await offer_service.update(id=sample_offer.id, offer_update=update_data)
 
 	assert result.price == 20.0
 	assert result.active is False
 
-	mock_offer_repository.get.assert_awaited_once_with(sample_offer.id)
-	mock_offer_repository.update.assert_awaited_once_with(sample_offer)
+	mock_offer_repository.update.assert_awaited_once_with(sample_offer.id, update_data)
+	mock_offer_repository.get.assert_not_awaited()
 
 
 @pytest.mark.asyncio
@@ -135,12 +172,12 @@ async def test_update_offer_not_found(offer_service, mock_offer_repository):
 		price=20.0,
 		active=False,
 	)
-	mock_offer_repository.get = AsyncMock(side_effect=OfferNotFoundError(offer_id=str(offer_id)))
+	mock_offer_repository.update = AsyncMock(side_effect=OfferNotFoundError(offer_id=str(offer_id)))
 
 	with pytest.raises(OfferNotFoundError):
 		await offer_service.update(id=offer_id, offer_update=update_data)
 
-	mock_offer_repository.get.assert_awaited_once_with(offer_id)
+	mock_offer_repository.update.assert_awaited_once_with(offer_id, update_data)
 
 
 @pytest.mark.asyncio
@@ -149,7 +186,6 @@ async def test_update_offer_internal_error(offer_service, mock_offer_repository,
 		price=20.0,
 		active=False,
 	)
-	mock_offer_repository.get = AsyncMock(return_value=sample_offer)
 	mock_offer_repository.update = AsyncMock(side_effect=Exception('Ih! Deu ruim!'))
 
 	with pytest.raises(OffersInternalError) as exc_info:
@@ -160,29 +196,27 @@ async def test_update_offer_internal_error(offer_service, mock_offer_repository,
 
 @pytest.mark.asyncio
 async def test_delete_offer_success(offer_service, mock_offer_repository, sample_offer):
-	mock_offer_repository.get = AsyncMock(return_value=sample_offer)
 	mock_offer_repository.delete = AsyncMock()
 
 	await offer_service.delete(id=sample_offer.id)
 
-	mock_offer_repository.get.assert_awaited_once_with(sample_offer.id)
-	mock_offer_repository.delete.assert_awaited_once_with(sample_offer)
+	mock_offer_repository.delete.assert_awaited_once_with(sample_offer.id)
+	mock_offer_repository.get.assert_not_awaited()
 
 
 @pytest.mark.asyncio
 async def test_delete_offer_not_found(offer_service, mock_offer_repository):
 	offer_id = uuid4()
-	mock_offer_repository.get = AsyncMock(side_effect=OfferNotFoundError(offer_id=str(offer_id)))
+	mock_offer_repository.delete = AsyncMock(side_effect=OfferNotFoundError(offer_id=str(offer_id)))
 
 	with pytest.raises(OfferNotFoundError):
 		await offer_service.delete(id=offer_id)
 
-	mock_offer_repository.get.assert_awaited_once_with(offer_id)
+	mock_offer_repository.delete.assert_awaited_once_with(offer_id)
 
 
 @pytest.mark.asyncio
 async def test_delete_offer_internal_error(offer_service, mock_offer_repository, sample_offer):
-	mock_offer_repository.get = AsyncMock(return_value=sample_offer)
 	mock_offer_repository.delete = AsyncMock(side_effect=Exception('Ih! Deu ruim!'))
 
 	with pytest.raises(OffersInternalError) as exc_info:
@@ -263,9 +297,15 @@ async def test_update_offer_schedule_success(
 		end_time='22:00:00',
 		repeats=True,
 	)
-	mock_offer_repository.get = AsyncMock(return_value=sample_offer)
-	mock_schedule_repository.get = AsyncMock(return_value=sample_schedule)
-	mock_schedule_repository.update = AsyncMock()
+	updated_schedule = sample_schedule.sqlmodel_update(
+		{
+			'day': 'tuesday',
+			'start_time': time(10, 0, 0),
+			'end_time': time(22, 0, 0),
+			'repeats': True,
+		}
+	)
+	mock_schedule_repository.update = AsyncMock(return_value=updated_schedule)
 
 	result = await schedule_service.update(
 		offer_id=sample_offer.id,
@@ -278,13 +318,16 @@ async def test_update_offer_schedule_success(
 	assert result.end_time == time(22, 0, 0)
 	assert result.repeats is True
 
-	mock_offer_repository.get.assert_awaited_once_with(sample_offer.id)
-	mock_schedule_repository.get.assert_awaited_once_with(sample_schedule.id)
-	mock_schedule_repository.update.assert_awaited_once_with(sample_schedule)
+	mock_schedule_repository.update.assert_awaited_once_with(
+		sample_offer.id, sample_schedule.id, update_data
+	)
+	mock_offer_repository.get.assert_not_awaited()
 
 
 @pytest.mark.asyncio
-async def test_update_offer_schedule_offer_not_found(schedule_service, mock_offer_repository):
+async def test_update_offer_schedule_offer_not_found(
+	schedule_service, mock_schedule_repository, mock_offer_repository
+):
 	offer_id = uuid4()
 	schedule_id = uuid4()
 	update_data = UpdateOfferScheduleSchema(
@@ -293,6 +336,9 @@ async def test_update_offer_schedule_offer_not_found(schedule_service, mock_offe
 		end_time='22:00:00',
 		repeats=True,
 	)
+	mock_schedule_repository.update = AsyncMock(
+		side_effect=OfferScheduleNotFoundError(schedule_id=str(schedule_id))
+	)
 	mock_offer_repository.get = AsyncMock(side_effect=OfferNotFoundError(offer_id=str(offer_id)))
 
 	with pytest.raises(OfferNotFoundError):
@@ -315,7 +361,7 @@ async def test_update_offer_schedule_not_found(
 		repeats=True,
 	)
 	mock_offer_repository.get = AsyncMock(return_value=sample_offer)
-	mock_schedule_repository.get = AsyncMock(
+	mock_schedule_repository.update = AsyncMock(
 		side_effect=OfferScheduleNotFoundError(schedule_id=str(schedule_id))
 	)
 
@@ -324,8 +370,10 @@ async def test_update_offer_schedule_not_found(
 			offer_id=sample_offer.id, schedule_id=schedule_id, schedule_update=update_data
 		)
 
+	mock_schedule_repository.update.assert_awaited_once_with(
+		sample_offer.id, schedule_id, update_data
+	)
 	mock_offer_repository.get.assert_awaited_once_with(sample_offer.id)
-	mock_schedule_repository.get.assert_awaited_once_with(schedule_id)
 
 
 @pytest.mark.asyncio
@@ -342,8 +390,6 @@ async def test_update_offer_schedule_internal_error(
 		end_time='22:00:00',
 		repeats=True,
 	)
-	mock_offer_repository.get = AsyncMock(return_value=sample_offer)
-	mock_schedule_repository.get = AsyncMock(return_value=sample_schedule)
 	mock_schedule_repository.update = AsyncMock(side_effect=Exception('Ih! Deu ruim!'))
 
 	with pytest.raises(OfferSchedulesInternalError) as exc_info:
@@ -364,21 +410,23 @@ async def test_delete_offer_schedule_success(
 	sample_offer,
 	sample_schedule,
 ):
-	mock_offer_repository.get = AsyncMock(return_value=sample_offer)
-	mock_schedule_repository.get = AsyncMock(return_value=sample_schedule)
 	mock_schedule_repository.delete = AsyncMock()
 
 	await schedule_service.delete(offer_id=sample_offer.id, schedule_id=sample_schedule.id)
 
-	mock_offer_repository.get.assert_awaited_once_with(sample_offer.id)
-	mock_schedule_repository.get.assert_awaited_once_with(sample_schedule.id)
-	mock_schedule_repository.delete.assert_awaited_once_with(sample_schedule)
+	mock_schedule_repository.delete.assert_awaited_once_with(sample_offer.id, sample_schedule.id)
+	mock_offer_repository.get.assert_not_awaited()
 
 
 @pytest.mark.asyncio
-async def test_delete_offer_schedule_offer_not_found(schedule_service, mock_offer_repository):
+async def test_delete_offer_schedule_offer_not_found(
+	schedule_service, mock_schedule_repository, mock_offer_repository
+):
 	offer_id = uuid4()
 	schedule_id = uuid4()
+	mock_schedule_repository.delete = AsyncMock(
+		side_effect=OfferScheduleNotFoundError(schedule_id=str(schedule_id))
+	)
 	mock_offer_repository.get = AsyncMock(side_effect=OfferNotFoundError(offer_id=str(offer_id)))
 
 	with pytest.raises(OfferNotFoundError):
@@ -393,15 +441,15 @@ async def test_delete_offer_schedule_not_found(
 ):
 	schedule_id = uuid4()
 	mock_offer_repository.get = AsyncMock(return_value=sample_offer)
-	mock_schedule_repository.get = AsyncMock(
+	mock_schedule_repository.delete = AsyncMock(
 		side_effect=OfferScheduleNotFoundError(schedule_id=str(schedule_id))
 	)
 
 	with pytest.raises(OfferScheduleNotFoundError):
 		await schedule_service.delete(offer_id=sample_offer.id, schedule_id=schedule_id)
 
+	mock_schedule_repository.delete.assert_awaited_once_with(sample_offer.id, schedule_id)
 	mock_offer_repository.get.assert_awaited_once_with(sample_offer.id)
-	mock_schedule_repository.get.assert_awaited_once_with(schedule_id)
 
 
 @pytest.mark.asyncio
@@ -412,8 +460,6 @@ async def test_delete_offer_schedule_internal_error(
 	sample_offer,
 	sample_schedule,
 ):
-	mock_offer_repository.get = AsyncMock(return_value=sample_offer)
-	mock_schedule_repository.get = AsyncMock(return_value=sample_schedule)
 	mock_schedule_repository.delete = AsyncMock(side_effect=Exception('Ih! Deu ruim!'))
 
 	with pytest.raises(OfferSchedulesInternalError) as exc_info:
@@ -1,8 +1,10 @@
+from datetime import datetime
 from unittest.mock import ANY, AsyncMock
 from uuid import uuid4
 
 import pytest
 
+from src.core.etag import weak_etag
 from src.products.exceptions import ProductNotFoundError, ProductsInternalError
 from src.products.schemas import (
 	CreateProductSchema,
@@ -80,6 +82,30 @@ async def test_get_product_internal_error(product_service, mock_product_reposito
 	mock_product_repository.get.assert_awaited_once_with(product_id)
 
 
+@pytest.mark.asyncio
+async def test_get_product_etag_success(product_service, mock_product_repository, sample_product):
+	version = (sample_product.id, sample_product.updated_at)
+	offers = [(uuid4(), datetime.now()), (uuid4(), datetime.now())]
+	mock_product_repository.get_version = AsyncMock(return_value=(version, offers))
+
+	result = await product_service.get_etag(id=sample_product.id)
+
+	assert result == weak_etag(version, offers)
+
+	mock_product_repository.get_version.assert_awaited_once_with(sample_product.id)
+	mock_product_repository.get.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_product_etag_internal_error(product_service, mock_product_repository):
+	mock_product_repository.get_version = AsyncMock(side_effect=Exception('Ih! Deu ruim!'))
+
+	with pytest.raises(ProductsInternalError) as exc_info:
+		await product_service.get_etag(id=uuid4())
+
+	assert 'Ih! Deu ruim!' in str(exc_info.value)
+
+
 @pytest.mark.asyncio
 async def test_create_product_success(product_service, mock_product_repository):
 	product_id = uuid4()
@@ -127,8 +153,8 @@ async def test_update_product_success(product_service, mock_product_repository,
 		category_id=sample_product.category_id,
 		image_url='https://example.com/pepperoni.jpg',
 	)
-	mock_product_repository.get = AsyncMock(return_value=sample_product)
-	mock_product_repository.update = AsyncMock()
+	updated_product = sample_product.sqlmodel_update(update_data.model_dump())
+	mock_product_repository.update = AsyncMock(return_value=updated_product)
 
 	result = await product_service.update(id=sample_product.id, product_update=update_data)
 
@@ -136,8 +162,8 @@ async def test_update_product_success(product_service, mock_product_repository,
 	assert result.price == 30.0
 	assert str(result.image_url) == 'https://example.com/pepperoni.jpg'
 
-	mock_product_repository.get.assert_awaited_once_with(sample_product.id)
-	mock_product_repository.update.assert_awaited_once_with(sample_product)
+	mock_product_repository.update.assert_awaited_once_with(sample_product.id, update_data)
+	mock_product_repository.get.assert_not_awaited()
 
 
 @pytest.mark.asyncio
@@ -150,14 +176,14 @@ async def test_update_product_not_found(product_service, mock_product_repository
 		category_id=uuid4(),
 		image_url='https://example.com/pepperoni.jpg',
 	)
-	mock_product_repository.get = AsyncMock(
+	mock_product_repository.update = AsyncMock(
 		side_effect=ProductNotFoundError(product_id=str(product_id))
 	)
 
 	with pytest.raises(ProductNotFoundError):
 		await product_service.update(id=product_id, product_update=update_data)
 
-	mock_product_repository.get.assert_awaited_once_with(product_id)
+	mock_product_repository.update.assert_awaited_once_with(product_id, update_data)
 
 
 @pytest.mark.asyncio
@@ -171,7 +197,6 @@ async def test_update_product_internal_error(
 		category_id=sample_product.category_id,
 		image_url='https://example.com/pepperoni.jpg',
 	)
-	mock_product_repository.get = AsyncMock(return_value=sample_product)
 	mock_product_repository.update = AsyncMock(side_effect=Exception('Ih! Deu ruim!'))
 
 	with pytest.raises(ProductsInternalError) as exc_info:
@@ -182,33 +207,31 @@ async def test_update_product_internal_error(
 
 @pytest.mark.asyncio
 async def test_delete_product_success(product_service, mock_product_repository, sample_product):
-	mock_product_repository.get = AsyncMock(return_value=sample_product)
 	mock_product_repository.delete = AsyncMock()
 
 	await product_service.delete(id=sample_product.id)
 
-	mock_product_repository.get.assert_awaited_once_with(sample_product.id)
-	mock_product_repository.delete.assert_awaited_once_with(sample_product)
+	mock_product_repository.delete.assert_awaited_once_with(sample_product.id)
+	mock_product_repository.get.assert_not_awaited()
 
 
 @pytest.mark.asyncio
 async def test_delete_product_not_found(product_service, mock_product_repository):
 	product_id = uuid4()
-	mock_product_repository.get = AsyncMock(
+	mock_product_repository.delete = AsyncMock(
 		side_effect=ProductNotFoundError(product_id=str(product_id))
 	)
 
 	with pytest.raises(ProductNotFoundError):
 		await product_service.delete(id=product_id)
 
-	mock_product_repository.get.assert_awaited_once_with(product_id)
+	mock_product_repository.delete.assert_awaited_once_with(product_id)
 
 
 @pytest.mark.asyncio
 async def test_delete_product_internal_error(
 	product_service, mock_product_repository, sample_product
 ):
-	mock_product_repository.get = AsyncMock(return_value=sample_product)
 	mock_product_repository.delete = AsyncMock(side_effect=Exception('Ih! Deu ruim!'))
 
 	with pytest.raises(ProductsInternalError) as exc_info:
@@ -1,8 +1,11 @@
+from datetime import datetime
 from unittest.mock import AsyncMock
 from uuid import uuid4
 
 import pytest
 
+from src.core.etag import weak_etag
+from src.core.pagination import InvalidCursorError, encode_cursor
 from src.enums import Day, DayType
 from src.restaurants.exceptions import (
 	RestaurantNotFoundError,
@@ -24,12 +27,74 @@ async def test_list_restaurants_success(
 ):
 	mock_restaurant_repository.list = AsyncMock(return_value=[sample_restaurant])
 
-	result = await restaurant_service.list(name='Pizza', owner_id=sample_restaurant.owner_id)
+	result = await restaurant_service.list(
+		name='Pizza', owner_id=sample_restaurant.owner_id, limit=10
+	)
+
+	assert len(result.items) == 1
+	assert result.items[0].id == sample_restaurant.id
+	assert result.next_cursor is None
+
+	mock_restaurant_repository.list.assert_awaited_once_with(
+		'Pizza', sample_restaurant.owner_id, 11, None, None
+	)
+
+
+@pytest.mark.asyncio
+async def test_list_restaurants_with_next_page(
+	restaurant_service, mock_restaurant_repository, sample_restaurant
+):
+	mock_restaurant_repository.list = AsyncMock(return_value=[sample_restaurant, sample_restaurant])
+
+	result = await restaurant_service.list(name=None, owner_id=None, limit=1)
+
+	assert len(result.items) == 1
+	assert result.next_cursor == encode_cursor(sample_restaurant.created_at, sample_restaurant.id)
+
+
+@pytest.mark.asyncio
+async def test_list_restaurants_from_cursor(
+	restaurant_service, mock_restaurant_repository, sample_restaurant
+):
+	cursor = encode_cursor(sample_restaurant.created_at, sample_restaurant.id)
+	mock_restaurant_repository.list = AsyncMock(return_value=[])
+
+	result = await restaurant_service.list(name=None, owner_id=None, limit=10, cursor=cursor)
+
+	assert result.items == []
+	assert result.next_cursor is None
+
+	mock_restaurant_repository.list.assert_awaited_once_with(
+		None, None, 11, (sample_restaurant.created_at, sample_restaurant.id), None
+	)
+
+
+@pytest.mark.asyncio
+async def test_list_restaurants_open_at(
+	restaurant_service, mock_restaurant_repository, sample_restaurant
+):
+	mock_restaurant_repository.list = AsyncMock(return_value=[sample_restaurant])
+
+	result = await restaurant_service.list(
+		name=None, owner_id=None, limit=10, open_at=datetime(2026, 1, 30, 22, 30)
+	)
+
+	assert len(result.items) == 1
+
+	# Friday 22:30 is 4 days and 22.5 hours after Monday 00:00
+	mock_restaurant_repository.list.assert_awaited_once_with(
+		None, None, 11, None, 4 * 1440 + 22 * 60 + 30
+	)
+
+
+@pytest.mark.asyncio
+async def test_list_restaurants_invalid_cursor(restaurant_service, mock_restaurant_repository):
+	mock_restaurant_repository.list = AsyncMock()
 
-	assert len(result) == 1
-	assert result[0].id == sample_restaurant.id
+	with pytest.raises(InvalidCursorError):
+		await restaurant_service.list(name=None, owner_id=None, limit=10, cursor='ih-deu-ruim')
 
-	mock_restaurant_repository.list.assert_awaited_once_with('Pizza', sample_restaurant.owner_id)
+	mock_restaurant_repository.list.assert_not_awaited()
 
 
 @pytest.mark.asyncio
@@ -37,7 +102,7 @@ async def test_list_restaurants_internal_error(restaurant_service, mock_restaura
 	mock_restaurant_repository.list = AsyncMock(side_effect=Exception('Ih! Deu ruim!'))
 
 	with pytest.raises(RestaurantsInternalError) as exc_info:
-		await restaurant_service.list(name='Pizza', owner_id=uuid4())
+		await restaurant_service.list(name='Pizza', owner_id=uuid4(), limit=10)
 
 	assert 'Ih! Deu ruim!' in str(exc_info.value)
 
@@ -48,40 +113,77 @@ async def test_list_restaurants_internal_error(restaurant_service, mock_restaura
 async def test_get_restaurant_success(
 	restaurant_service, mock_restaurant_repository, sample_restaurant
 ):
-	mock_restaurant_repository.get = AsyncMock(return_value=sample_restaurant)
+	mock_restaurant_repository.get_with_products = AsyncMock(return_value=sample_restaurant)
 
 	result = await restaurant_service.get(id=sample_restaurant.id)
 
 	assert result.id == sample_restaurant.id
 	assert result.name == sample_restaurant.name
 
-	mock_restaurant_repository.get.assert_awaited_once_with(sample_restaurant.id)
+	mock_restaurant_repository.get_with_products.assert_awaited_once_with(sample_restaurant.id)
 
 
 @pytest.mark.asyncio
 async def test_get_restaurant_not_found(restaurant_service, mock_restaurant_repository):
 	restaurant_id = uuid4()
-	mock_restaurant_repository.get = AsyncMock(
+	mock_restaurant_repository.get_with_products = AsyncMock(
 		side_effect=RestaurantNotFoundError(restaurant_id=str(restaurant_id))
 	)
 
 	with pytest.raises(RestaurantNotFoundError):
 		await restaurant_service.get(id=restaurant_id)
 
-	mock_restaurant_repository.get.assert_awaited_once_with(restaurant_id)
+	mock_restaurant_repository.get_with_products.assert_awaited_once_with(restaurant_id)
 
 
 @pytest.mark.asyncio
 async def test_get_restaurant_internal_error(restaurant_service, mock_restaurant_repository):
 	restaurant_id = uuid4()
-	mock_restaurant_repository.get = AsyncMock(side_effect=Exception('Ih! Deu ruim!'))
+	mock_restaurant_repository.get_with_products = AsyncMock(side_effect=Exception('Ih! Deu ruim!'))
 
 	with pytest.raises(RestaurantsInternalError) as exc_info:
 		await restaurant_service.get(id=restaurant_id)
 
 	assert 'Ih! Deu ruim!' in str(exc_info.value)
 
-	mock_restaurant_repository.get.assert_awaited_once_with(restaurant_id)
+	mock_restaurant_repository.get_with_products.assert_awaited_once_with(restaurant_id)
+
+
+@pytest.mark.asyncio
+async def test_get_restaurant_etag_success(
+	restaurant_service, mock_restaurant_repository, sample_restaurant
+):
+	version = (sample_restaurant.id, sample_restaurant.updated_at)
+	products = [(uuid4(), datetime.now())]
+	mock_restaurant_repository.get_version = AsyncMock(return_value=(version, products))
+
+	result = await restaurant_service.get_etag(id=sample_restaurant.id)
+
+	assert result == weak_etag(version, products)
+
+	mock_restaurant_repository.get_version.assert_awaited_once_with(sample_restaurant.id)
+	mock_restaurant_repository.get_with_products.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_restaurant_etag_not_found(restaurant_service, mock_restaurant_repository):
+	restaurant_id = uuid4()
+	mock_restaurant_repository.get_version = AsyncMock(
+		side_effect=RestaurantNotFoundError(restaurant_id=str(restaurant_id))
+	)
+
+	with pytest.raises(RestaurantNotFoundError):
+		await restaurant_service.get_etag(id=restaurant_id)
+
+
+@pytest.mark.asyncio
+async def test_get_restaurant_etag_internal_error(restaurant_service, mock_restaurant_repository):
+	mock_restaurant_repository.get_version = AsyncMock(side_effect=Exception('Ih! Deu ruim!'))
+
+	with pytest.raises(RestaurantsInternalError) as exc_info:
+		await restaurant_service.get_etag(id=uuid4())
+
+	assert 'Ih! Deu ruim!' in str(exc_info.value)
 
 
 @pytest.mark.asyncio
@@ -142,8 +244,8 @@ async def test_update_restaurant_success(
 		city='Rio de Janeiro',
 		state_abbr='RJ',
 	)
-	mock_restaurant_repository.get = AsyncMock(return_value=sample_restaurant)
-	mock_restaurant_repository.update = AsyncMock()
+	updated_restaurant = sample_restaurant.sqlmodel_update(update_data.model_dump())
+	mock_restaurant_repository.update = AsyncMock(return_value=updated_restaurant)
 
 	result = await restaurant_service.update(id=sample_restaurant.id, restaurant_update=update_data)
 
@@ -151,8 +253,8 @@ async def test_update_restaurant_success(
 	assert result.city == 'Rio de Janeiro'
 	assert result.state_abbr == 'RJ'
 
-	mock_restaurant_repository.get.assert_awaited_once_with(sample_restaurant.id)
-	mock_restaurant_repository.update.assert_awaited_once_with(sample_restaurant)
+	mock_restaurant_repository.update.assert_awaited_once_with(sample_restaurant.id, update_data)
+	mock_restaurant_repository.get.assert_not_awaited()
 
 
 @pytest.mark.asyncio
@@ -168,14 +270,14 @@ async def test_update_restaurant_not_found(restaurant_service, mock_restaurant_r
 		city='City',
 		state_abbr='SP',
 	)
-	mock_restaurant_repository.get = AsyncMock(
+	mock_restaurant_repository.update = AsyncMock(
 		side_effect=RestaurantNotFoundError(restaurant_id=str(restaurant_id))
 	)
 
 	with pytest.raises(RestaurantNotFoundError):
 		await restaurant_service.update(id=restaurant_id, restaurant_update=update_data)
 
-	mock_restaurant_repository.get.assert_awaited_once_with(restaurant_id)
+	mock_restaurant_repository.update.assert_awaited_once_with(restaurant_id, update_data)
 
 
 @pytest.mark.asyncio
@@ -192,7 +294,6 @@ async def test_update_restaurant_internal_error(
 		city='City',
 		state_abbr='SP',
 	)
-	mock_restaurant_repository.get = AsyncMock(return_value=sample_restaurant)
 	mock_restaurant_repository.update = AsyncMock(side_effect=Exception('Ih! Deu ruim!'))
 
 	with pytest.raises(RestaurantsInternalError) as exc_info:
@@ -205,33 +306,31 @@ async def test_update_restaurant_internal_error(
 async def test_delete_restaurant_success(
 	restaurant_service, mock_restaurant_repository, sample_restaurant
 ):
-	mock_restaurant_repository.get = AsyncMock(return_value=sample_restaurant)
 	mock_restaurant_repository.delete = AsyncMock()
 
 	await restaurant_service.delete(id=sample_restaurant.id)
 
-	mock_restaurant_repository.get.assert_awaited_once_with(sample_restaurant.id)
-	mock_restaurant_repository.delete.assert_awaited_once_with(sample_restaurant)
+	mock_restaurant_repository.delete.assert_awaited_once_with(sample_restaurant.id)
+	mock_restaurant_repository.get.assert_not_awaited()
 
 
 @pytest.mark.asyncio
 async def test_delete_restaurant_not_found(restaurant_service, mock_restaurant_repository):
 	restaurant_id = uuid4()
-	mock_restaurant_repository.get = AsyncMock(
+	mock_restaurant_repository.delete = AsyncMock(
 		side_effect=RestaurantNotFoundError(restaurant_id=str(restaurant_id))
 	)
 
 	with pytest.raises(RestaurantNotFoundError):
 		await restaurant_service.delete(id=restaurant_id)
 
-	mock_restaurant_repository.get.assert_awaited_once_with(restaurant_id)
+	mock_restaurant_repository.delete.assert_awaited_once_with(restaurant_id)
 
 
 @pytest.mark.asyncio
 async def test_delete_restaurant_internal_error(
 	restaurant_service, mock_restaurant_repository, sample_restaurant
 ):
-	mock_restaurant_repository.get = AsyncMock(return_value=sample_restaurant)
 	mock_restaurant_repository.delete = AsyncMock(side_effect=Exception('Ih! Deu ruim!'))
 
 	with pytest.raises(RestaurantsInternalError) as exc_info:
@@ -350,9 +449,10 @@ async def test_update_schedule_success(
 		start_time='10:00:00',
 		end_time='22:00:00',
 	)
-	mock_restaurant_repository.get = AsyncMock(return_value=sample_restaurant)
-	mock_schedule_repository.get = AsyncMock(return_value=sample_schedule)
-	mock_schedule_repository.update = AsyncMock()
+	updated_schedule = sample_schedule.sqlmodel_update(
+		{'day_type': 'weekend', 'start_day': 'saturday', 'end_day': 'sunday'}
+	)
+	mock_schedule_repository.update = AsyncMock(return_value=updated_schedule)
 
 	result = await schedule_service.update(
 		restaurant_id=sample_restaurant.id,
@@ -364,13 +464,16 @@ async def test_update_schedule_success(
 	assert result.start_day == 'saturday'
 	assert result.end_day == 'sunday'
 
-	mock_restaurant_repository.get.assert_awaited_once_with(sample_restaurant.id)
-	mock_schedule_repository.get.assert_awaited_once_with(sample_schedule.id)
-	mock_schedule_repository.update.assert_awaited_once_with(sample_schedule)
+	mock_schedule_repository.update.assert_awaited_once_with(
+		sample_restaurant.id, sample_schedule.id, update_data
+	)
+	mock_restaurant_repository.get.assert_not_awaited()
 
 
 @pytest.mark.asyncio
-async def test_update_schedule_restaurant_not_found(schedule_service, mock_restaurant_repository):
+async def test_update_schedule_restaurant_not_found(
+	schedule_service, mock_schedule_repository, mock_restaurant_repository
+):
 	restaurant_id = uuid4()
 	schedule_id = uuid4()
 	update_data = UpdateRestaurantScheduleSchema(
@@ -380,6 +483,9 @@ async def test_update_schedule_restaurant_not_found(schedule_service, mock_resta
 		start_time='10:00:00',
 		end_time='22:00:00',
 	)
+	mock_schedule_repository.update = AsyncMock(
+		side_effect=RestaurantScheduleNotFoundError(schedule_id=str(schedule_id))
+	)
 	mock_restaurant_repository.get = AsyncMock(
 		side_effect=RestaurantNotFoundError(restaurant_id=str(restaurant_id))
 	)
@@ -405,7 +511,7 @@ async def test_update_schedule_not_found(
 		end_time='22:00:00',
 	)
 	mock_restaurant_repository.get = AsyncMock(return_value=sample_restaurant)
-	mock_schedule_repository.get = AsyncMock(
+	mock_schedule_repository.update = AsyncMock(
 		side_effect=RestaurantScheduleNotFoundError(schedule_id=str(schedule_id))
 	)
 
@@ -414,8 +520,10 @@ async def test_update_schedule_not_found(
 			restaurant_id=sample_restaurant.id, schedule_id=schedule_id, schedule_update=update_data
 		)
 
+	mock_schedule_repository.update.assert_awaited_once_with(
+		sample_restaurant.id, schedule_id, update_data
+	)
 	mock_restaurant_repository.get.assert_awaited_once_with(sample_restaurant.id)
-	mock_schedule_repository.get.assert_awaited_once_with(schedule_id)
 
 
 @pytest.mark.asyncio
@@ -433,8 +541,6 @@ async def test_update_schedule_internal_error(
 		start_time='10:00:00',
 		end_time='22:00:00',
 	)
-	mock_restaurant_repository.get = AsyncMock(return_value=sample_restaurant)
-	mock_schedule_repository.get = AsyncMock(return_value=sample_schedule)
 	mock_schedule_repository.update = AsyncMock(side_effect=Exception('Ih! Deu ruim!'))
 
 	with pytest.raises(RestaurantSchedulesInternalError) as exc_info:
@@ -455,23 +561,27 @@ async def test_delete_schedule_success(
 	sample_restaurant,
 	sample_schedule,
 ):
-	mock_restaurant_repository.get = AsyncMock(return_value=sample_restaurant)
-	mock_schedule_repository.get = AsyncMock(return_value=sample_schedule)
 	mock_schedule_repository.delete = AsyncMock()
 
 	await schedule_service.delete(
 		restaurant_id=sample_restaurant.id, schedule_id=sample_schedule.id
 	)
 
-	mock_restaurant_repository.get.assert_awaited_once_with(sample_restaurant.id)
-	mock_schedule_repository.get.assert_awaited_once_with(sample_schedule.id)
-	mock_schedule_repository.delete.assert_awaited_once_with(sample_schedule)
+	mock_schedule_repository.delete.assert_awaited_once_with(
+		sample_restaurant.id, sample_schedule.id
+	)
+	mock_restaurant_repository.get.assert_not_awaited()
 
 
 @pytest.mark.asyncio
-async def test_delete_schedule_restaurant_not_found(schedule_service, mock_restaurant_repository):
+async def test_delete_schedule_restaurant_not_found(
+	schedule_service, mock_schedule_repository, mock_restaurant_repository
+):
 	restaurant_id = uuid4()
 	schedule_id = uuid4()
+	mock_schedule_repository.delete = AsyncMock(
+		side_effect=RestaurantScheduleNotFoundError(schedule_id=str(schedule_id))
+	)
 	mock_restaurant_repository.get = AsyncMock(
 		side_effect=RestaurantNotFoundError(restaurant_id=str(restaurant_id))
 	)
@@ -488,15 +598,15 @@ async def test_delete_schedule_not_found(
 ):
 	schedule_id = uuid4()
 	mock_restaurant_repository.get = AsyncMock(return_value=sample_restaurant)
-	mock_schedule_repository.get = AsyncMock(
+	mock_schedule_repository.delete = AsyncMock(
 		side_effect=RestaurantScheduleNotFoundError(schedule_id=str(schedule_id))
 	)
 
 	with pytest.raises(RestaurantScheduleNotFoundError):
 		await schedule_service.delete(restaurant_id=sample_restaurant.id, schedule_id=schedule_id)
 
+	mock_schedule_repository.delete.assert_awaited_once_with(sample_restaurant.id, schedule_id)
 	mock_restaurant_repository.get.assert_awaited_once_with(sample_restaurant.id)
-	mock_schedule_repository.get.assert_awaited_once_with(schedule_id)
 
 
 @pytest.mark.asyncio
@@ -507,8 +617,6 @@ async def test_delete_schedule_internal_error(
 	sample_restaurant,
 	sample_schedule,
 ):
-	mock_restaurant_repository.get = AsyncMock(return_value=sample_restaurant)
-	mock_schedule_repository.get = AsyncMock(return_value=sample_schedule)
 	mock_schedule_repository.delete = AsyncMock(side_effect=Exception('Ih! Deu ruim!'))
 
 	with pytest.raises(RestaurantSchedulesInternalError) as exc_info:
@@ -0,0 +1,71 @@
+from unittest.mock import patch
+
+import pytest
+
+from src.server import build_config, cgroup_cpu_limit, default_workers
+
+
+@pytest.fixture
+def cgroup(tmp_path):
+	def write(files):
+		for name, content in files.items():
+			path = tmp_path / name
+			path.parent.mkdir(parents=True, exist_ok=True)
+			path.write_text(content)
+
+		return str(tmp_path)
+
+	return write
+
+
+@pytest.mark.parametrize(
+	'files, limit',
+	[
+		({'cpu.max': '50000 100000\n'}, 0.5),
+		({'cpu.max': '250000 100000\n'}, 2.5),
+		({'cpu.max': 'max 100000\n'}, None),
+		({'cpu/cpu.cfs_quota_us': '150000\n', 'cpu/cpu.cfs_period_us': '100000\n'}, 1.5),
+		({'cpu/cpu.cfs_quota_us': '-1\n', 'cpu/cpu.cfs_period_us': '100000\n'}, None),
+		({}, None),
+	],
+)
+def test_cgroup_cpu_limit(cgroup, files, limit):
+	assert cgroup_cpu_limit(cgroup(files)) == limit
+
+
+@pytest.mark.parametrize(
+	'files, cpus, workers',
+	[
+		({'cpu.max': '50000 100000\n'}, 8, 1),
+		({'cpu.max': '150000 100000\n'}, 8, 2),
+		({'cpu.max': '800000 100000\n'}, 4, 4),
+		({'cpu.max': 'max 100000\n'}, 4, 4),
+	],
+)
+def test_default_workers(cgroup, files, cpus, workers):
+	with patch('src.server.available_cpus', return_value=cpus):
+		assert default_workers(cgroup(files)) == workers
+
+
+@patch('src.server.settings')
+def test_build_config_recycles_workers(mock_settings):
+	mock_settings.SERVER_MAX_REQUESTS = 1000
+	mock_settings.SERVER_MAX_REQUESTS_JITTER = 50
+	mock_settings.SERVER_GRACEFUL_TIMEOUT = 30
+
+	limits = {build_config('0.0.0.0', 8000).limit_max_requests for _ in range(50)}
+
+	assert all(1000 <= limit <= 1050 for limit in limits)
+	assert len(limits) > 1
+
+
+@patch('src.server.settings')
+def test_build_config_without_recycling(mock_settings):
+	mock_settings.SERVER_MAX_REQUESTS = 0
+	mock_settings.SERVER_GRACEFUL_TIMEOUT = 30
+
+	config = build_config('0.0.0.0', 8000)
+
+	assert config.limit_max_requests is None
+	assert config.timeout_graceful_shutdown == 30
+	assert (config.loop, config.http) == ('auto', 'auto')
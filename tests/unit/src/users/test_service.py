@@ -107,21 +107,21 @@ async def test_create_user_internal_error(user_service, mock_user_repository):
 
 
 @pytest.mark.asyncio
-async def test_update_user_success(user_service, mock_user_repository, sample_user_schema):
+async def test_update_user_success(user_service, mock_user_repository, sample_user):
 	update_data = UpdateUserSchema(
 		first_name='Rafa',
 		last_name='Cade',
 	)
-	mock_user_repository.get = AsyncMock(return_value=sample_user_schema)
-	mock_user_repository.update = AsyncMock()
+	updated_user = sample_user.sqlmodel_update(update_data.model_dump())
+	mock_user_repository.update = AsyncMock(return_value=updated_user)
 
-	result = await user_service.update(id=sample_user_schema.id, user_update=update_data)
+	result = await user_service.update(id=sample_user.id, user_update=update_data)
 
 	assert result.first_name == 'Rafa'
 	assert result.last_name == 'Cade'
 
-	mock_user_repository.get.assert_awaited_once_with(sample_user_schema.id)
-	mock_user_repository.update.assert_awaited_once_with(sample_user_schema)
+	mock_user_repository.update.assert_awaited_once_with(sample_user.id, update_data)
+	mock_user_repository.get.assert_not_awaited()
 
 
 @pytest.mark.asyncio
@@ -131,12 +131,12 @@ async def test_update_user_not_found(user_service, mock_user_repository):
 		first_name='Rafa',
 		last_name='Cade',
 	)
-	mock_user_repository.get = AsyncMock(side_effect=UserNotFoundError(user_id=str(user_id)))
+	mock_user_repository.update = AsyncMock(side_effect=UserNotFoundError(user_id=str(user_id)))
 
 	with pytest.raises(UserNotFoundError):
 		await user_service.update(id=user_id, user_update=update_data)
 
-	mock_user_repository.get.assert_awaited_once_with(user_id)
+	mock_user_repository.update.assert_awaited_once_with(user_id, update_data)
 
 
 @pytest.mark.asyncio
@@ -145,7 +145,6 @@ async def test_update_user_internal_error(user_service, mock_user_repository, sa
 		first_name='Rafa',
 		last_name='Cade',
 	)
-	mock_user_repository.get = AsyncMock(return_value=sample_user_schema)
 	mock_user_repository.update = AsyncMock(side_effect=Exception('Ih! Deu ruim!'))
 
 	with pytest.raises(UsersInternalError) as exc_info:
@@ -156,29 +155,27 @@ async def test_update_user_internal_error(user_service, mock_user_repository, sa
 
 @pytest.mark.asyncio
 async def test_delete_user_success(user_service, mock_user_repository, sample_user_schema):
-	mock_user_repository.get = AsyncMock(return_value=sample_user_schema)
 	mock_user_repository.delete = AsyncMock()
 
 	await user_service.delete(id=sample_user_schema.id)
 
-	mock_user_repository.get.assert_awaited_once_with(sample_user_schema.id)
-	mock_user_repository.delete.assert_awaited_once_with(sample_user_schema)
+	mock_user_repository.delete.assert_awaited_once_with(sample_user_schema.id)
+	mock_user_repository.get.assert_not_awaited()
 
 
 @pytest.mark.asyncio
 async def test_delete_user_not_found(user_service, mock_user_repository):
 	user_id = uuid4()
-	mock_user_repository.get = AsyncMock(side_effect=UserNotFoundError(user_id=str(user_id)))
+	mock_user_repository.delete = AsyncMock(side_effect=UserNotFoundError(user_id=str(user_id)))
 
 	with pytest.raises(UserNotFoundError):
 		await user_service.delete(id=user_id)
 
-	mock_user_repository.get.assert_awaited_once_with(user_id)
+	mock_user_repository.delete.assert_awaited_once_with(user_id)
 
 
 @pytest.mark.asyncio
 async def test_delete_user_internal_error(user_service, mock_user_repository, sample_user_schema):
-	mock_user_repository.get = AsyncMock(return_value=sample_user_schema)
 	mock_user_repository.delete = AsyncMock(side_effect=Exception('Ih! Deu ruim!'))
 
 	with pytest.raises(UsersInternalError) as exc_info: